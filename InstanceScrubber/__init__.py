@@ -1,13 +1,38 @@
 """Instant Scribe core package.
 
 Exposes commonly used helpers at the package root for convenience.
+
+Helpers backed by heavy modules (NumPy/NeMo, *keyboard*, WinRT toasts,
+*pyperclip*) are resolved lazily on first attribute access (PEP 562) so that
+``import InstanceScrubber`` stays cheap when only e.g. ``ConfigManager`` is
+needed.
 """
 
+import importlib
+
 from .config_manager import ConfigManager  # noqa: F401
 from .logging_config import setup_logging  # noqa: F401
 from .resource_manager import resource_path  # noqa: F401
-from .transcription_worker import TranscriptionEngine, TranscriptionWorker  # noqa: F401
-from .hotkey_manager import HotkeyManager  # noqa: F401
-from .notification_manager import NotificationManager  # noqa: F401
 from .archive_manager import ArchiveManager  # noqa: F401
-from .clipboard_manager import copy_with_verification  # noqa: F401 
\ No newline at end of file
+
+# Public name → submodule that defines it, imported on first access.
+_LAZY_EXPORTS = {
+    "TranscriptionEngine": ".transcription_worker",
+    "TranscriptionWorker": ".transcription_worker",
+    "HotkeyManager": ".hotkey_manager",
+    "NotificationManager": ".notification_manager",
+    "copy_with_verification": ".clipboard_manager",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # cache – subsequent lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -9,19 +9,31 @@ This module provides two primary public functions:
   archive folder structure.
 
 The implementation relies **only** on Python's standard-library to keep the
-package footprint minimal and portable.
+package footprint minimal and portable.  When the optional :pypi:`zipstream-ng`
+package is installed, ``create_backup`` streams the ZIP to disk chunk-by-chunk
+instead of going through :class:`zipfile.ZipFile`.
 """
 
 from __future__ import annotations
 
 import logging
+import os
+import shutil
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from zipfile import ZipFile, ZIP_DEFLATED
+from typing import Iterator, Tuple
+from zipfile import ZipFile, ZipInfo, ZIP_DEFLATED, ZIP_STORED
 
 from InstanceScrubber.archive_manager import ArchiveManager
 
+try:  # Optional – streaming ZIP writer (falls back to *zipfile* when absent)
+    from zipstream import ZipStream  # type: ignore
+except ImportError:  # pragma: no cover – optional dependency
+    ZipStream = None  # type: ignore[assignment,misc]
+
 __all__ = [
     "create_backup",
     "restore_backup",
@@ -30,6 +42,118 @@ __all__ = [
 
 _LOG = logging.getLogger(__name__)
 
+# Buffer size for backup file handles and copy loops – far larger than the
+# 8 KiB *zipfile* default so multi-MB WAVs need only a handful of syscalls.
+_IO_BUFSIZE = 1 << 20  # 1 MiB
+
+# Audio payloads are raw PCM or already compressed – DEFLATE burns CPU for a
+# marginal ratio gain, so they are *stored*.  Everything else (transcripts) is
+# small text that compresses well even at a low level.
+_STORED_SUFFIXES = frozenset({".wav", ".mp3", ".flac", ".opus"})
+_DEFLATE_LEVEL = 3
+
+# DOS timestamps cover 1980–2107 only; out-of-range mtimes are clamped like
+# ``ZipInfo.from_file(..., strict_timestamps=False)`` does instead of raising.
+_DOS_MIN_DATE = (1980, 1, 1, 0, 0, 0)
+_DOS_MAX_DATE = (2107, 12, 31, 23, 59, 59)
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+def _iter_archive_files(archive_root: Path) -> Iterator[Tuple[str, str]]:
+    """Yield ``(file_path, arcname)`` strings for every file below *archive_root*.
+
+    :func:`os.scandir` exposes the file type gathered by ``readdir`` so no
+    extra ``stat()`` is issued per entry, and plain strings avoid building a
+    :class:`~pathlib.Path` for every file.
+
+    The content-addressed store at the root is skipped: every blob in it is
+    hard-linked into a session folder, so it would otherwise be zipped twice.
+    """
+    stack = [(str(archive_root), "")]
+    while stack:
+        dir_path, prefix = stack.pop()
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                if not prefix and entry.name == ArchiveManager._CAS_DIRNAME:  # pylint: disable=protected-access
+                    continue
+                arcname = prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, arcname + "/"))
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry.path, arcname
+
+
+def _compression_for(arcname: str, compress: bool = True) -> Tuple[int, int | None]:
+    """Return ``(compress_type, compress_level)`` appropriate for *arcname*."""
+    if not compress:
+        return ZIP_STORED, None
+    suffix = os.path.splitext(arcname)[1].lower()
+    if suffix in _STORED_SUFFIXES:
+        return ZIP_STORED, None
+    return ZIP_DEFLATED, _DEFLATE_LEVEL
+
+
+def _zipinfo_from_stat(arcname: str, st: os.stat_result) -> ZipInfo:
+    """Build a file :class:`ZipInfo` from an existing *st* – no extra ``stat()``.
+
+    Equivalent to :meth:`ZipInfo.from_file` for regular files, but callers pass
+    the ``fstat()`` of the handle they already opened instead of having
+    *zipfile* resolve and stat the path a second time.
+    """
+    date_time = time.localtime(st.st_mtime)[:6]
+    if date_time[0] < 1980:
+        date_time = _DOS_MIN_DATE
+    elif date_time[0] > 2107:
+        date_time = _DOS_MAX_DATE
+    zinfo = ZipInfo(arcname, date_time)
+    zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+    zinfo.file_size = st.st_size
+    return zinfo
+
+
+def _read_entry(entry: Tuple[str, str]) -> Tuple[ZipInfo, bytes]:
+    """Stat and read a ``(file_path, arcname)`` pair – runs on a worker thread."""
+    file_path, arcname = entry
+    with open(file_path, "rb") as fh:
+        return _zipinfo_from_stat(arcname, os.fstat(fh.fileno())), fh.read()
+
+
+def _member_target(dest_root: Path, info: ZipInfo) -> Path | None:
+    """Return the on-disk path for *info* below *dest_root* (``None`` if unsafe).
+
+    Mirrors the sanitising done by :meth:`ZipFile.extractall` – absolute paths,
+    drive letters and ``..`` components must never escape *dest_root*.
+    """
+    parts = [
+        part
+        for part in info.filename.replace("\\", "/").split("/")
+        if part not in ("", ".", "..")
+    ]
+    if not parts or os.path.splitdrive(parts[0])[0]:
+        return None
+    return dest_root.joinpath(*parts)
+
+
+def _extract_member(zf: ZipFile, info: ZipInfo, dest_root: Path) -> None:
+    """Extract a single *info* from *zf* using a large copy buffer.
+
+    :meth:`ZipFile.extract` streams members through an 8 KiB buffer; a 1 MiB
+    buffer cuts the syscall count for multi-MB WAVs by two orders of magnitude.
+    """
+    target = _member_target(dest_root, info)
+    if target is None:
+        _LOG.warning("Skipping unsafe archive member %r", info.filename)
+        return
+    if info.is_dir():
+        target.mkdir(parents=True, exist_ok=True)
+        return
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with zf.open(info) as src, open(target, "wb", buffering=_IO_BUFSIZE) as dst:
+        shutil.copyfileobj(src, dst, _IO_BUFSIZE)
+
+
 # ---------------------------------------------------------------------------
 # Core functionality
 # ---------------------------------------------------------------------------
@@ -39,6 +163,7 @@ def create_backup(
     backup_dest_dir: Path | str | None = None,
     *,
     zip_name: str | None = None,
+    compress: bool = True,
 ) -> Path:
     """Create a *ZIP* backup of **archive_root** and return the resulting file *Path*.
 
@@ -53,11 +178,15 @@ def create_backup(
     zip_name:
         Optional explicit filename (should include ``.zip`` extension). If *None*,
         a timestamped default (``archive_backup_YYYYMMDD_HHMMSS.zip``) is used.
+    compress:
+        When *False* every entry is *stored* – the fastest possible snapshot,
+        bounded only by disk bandwidth.  By default transcripts are deflated
+        while audio is always stored.
     """
 
     # Resolve paths and sensible defaults -------------------------------------------------
     if archive_root is None:
-        archive_root = ArchiveManager().base_dir
+        archive_root = ArchiveManager.default_base_dir()
     archive_root = Path(archive_root).expanduser().resolve()
 
     if backup_dest_dir is None:
@@ -74,11 +203,51 @@ def create_backup(
     _LOG.info("Creating archive backup → %s", zip_path)
 
     # Create ZIP – store *relative* paths so restoration does not depend on absolute dirs
-    with ZipFile(zip_path, "w", compression=ZIP_DEFLATED) as zf:
-        for file_path in archive_root.rglob("*"):
-            if file_path.is_file():
-                relative_path = file_path.relative_to(archive_root)
-                zf.write(file_path, arcname=relative_path)
+    if ZipStream is not None:
+        # Stream compressed chunks straight to disk as they are produced rather
+        # than holding per-entry writer state inside *ZipFile*.
+        zs = ZipStream(compress_type=ZIP_STORED)
+        for file_path, arcname in _iter_archive_files(archive_root):
+            compress_type, compress_level = _compression_for(arcname, compress)
+            zs.add_path(
+                file_path,
+                arcname=arcname,
+                compress_type=compress_type,
+                compress_level=compress_level,
+            )
+        with open(zip_path, "wb", buffering=_IO_BUFSIZE) as fp:
+            for chunk in zs:
+                fp.write(chunk)
+    else:
+        with open(zip_path, "wb", buffering=_IO_BUFSIZE) as fp, ZipFile(
+            fp, "w", compression=ZIP_STORED, allowZip64=True, strict_timestamps=False
+        ) as zf:
+            deflated: list[Tuple[str, str]] = []
+            for file_path, arcname in _iter_archive_files(archive_root):
+                compress_type, _level = _compression_for(arcname, compress)
+                if compress_type != ZIP_STORED:
+                    deflated.append((file_path, arcname))
+                    continue
+                # Stored entries are a plain byte copy – stream them with a
+                # large buffer instead of ZipFile.write()'s 8 KiB loop.
+                with open(file_path, "rb", buffering=_IO_BUFSIZE) as src:
+                    zinfo = _zipinfo_from_stat(arcname, os.fstat(src.fileno()))
+                    zinfo.compress_type = ZIP_STORED
+                    with zf.open(zinfo, "w") as dst:
+                        shutil.copyfileobj(src, dst, _IO_BUFSIZE)
+
+            # Transcripts are many small files whose cost is dominated by
+            # open/stat/read latency.  Read them concurrently and append them
+            # in walk order – ZipFile itself only supports a single writer.
+            if deflated:
+                with ThreadPoolExecutor(thread_name_prefix="ArchiveBackup") as pool:
+                    for zinfo, data in pool.map(_read_entry, deflated):
+                        zf.writestr(
+                            zinfo,
+                            data,
+                            compress_type=ZIP_DEFLATED,
+                            compresslevel=_DEFLATE_LEVEL,
+                        )
 
     _LOG.info("Backup completed successfully – size=%d bytes", zip_path.stat().st_size)
     return zip_path
@@ -112,16 +281,42 @@ def restore_backup(
         raise FileNotFoundError(f"Backup ZIP not found: {backup_zip}")
 
     if dest_root is None:
-        dest_root = ArchiveManager().base_dir
+        dest_root = ArchiveManager.default_base_dir()
     dest_root = Path(dest_root).expanduser().resolve()
     dest_root.mkdir(parents=True, exist_ok=True)
 
     _LOG.info("Restoring backup %s → %s", backup_zip, dest_root)
 
     with ZipFile(backup_zip, "r") as zf:
-        zf.extractall(path=dest_root)
-
-    _LOG.info("Restore complete – extracted %d files", len(zf.namelist()))
+        # *infolist()* returns the already-parsed central directory – reuse it
+        # for extraction and the count instead of rebuilding *namelist()*.
+        infos = zf.infolist()
+
+    # *ZipFile* keeps a shared file position, so every worker thread opens its
+    # own handle.  zlib releases the GIL, letting decompression and writes of
+    # many small members overlap.
+    local = threading.local()
+    handles: list[ZipFile] = []
+
+    def _extract_one(info: ZipInfo) -> None:
+        zf = getattr(local, "zf", None)
+        if zf is None:
+            zf = local.zf = ZipFile(backup_zip, "r")
+            handles.append(zf)
+        _extract_member(zf, info, dest_root)
+
+    try:
+        with ThreadPoolExecutor(
+            max_workers=os.cpu_count(), thread_name_prefix="ArchiveRestore"
+        ) as pool:
+            # Exhaust the iterator so worker exceptions propagate to the caller.
+            for _ in pool.map(_extract_one, infos):
+                pass
+    finally:
+        for zf in handles:
+            zf.close()
+
+    _LOG.info("Restore complete – extracted %d files", len(infos))
     return dest_root
 
 
@@ -138,14 +333,16 @@ def _periodic_worker(
     """Internal loop that performs backups every *interval* until *stop_event*."""
     next_run = datetime.now()
     while not stop_event.is_set():
-        now = datetime.now()
-        if now >= next_run:
-            try:
-                create_backup(archive_root, backup_dir)
-            except Exception as exc:  # pragma: no cover – logging only
-                _LOG.exception("Scheduled backup failed: %s", exc)
-            next_run = now + interval
-        stop_event.wait(1)  # poll every second for graceful shutdown
+        # Sleep exactly until the next run – *wait()* returns True as soon as
+        # the stop event is set so shutdown stays prompt without polling.
+        delay = max(0.0, (next_run - datetime.now()).total_seconds())
+        if stop_event.wait(delay):
+            break
+        try:
+            create_backup(archive_root, backup_dir)
+        except Exception as exc:  # pragma: no cover – logging only
+            _LOG.exception("Scheduled backup failed: %s", exc)
+        next_run = datetime.now() + interval
 
 
 def schedule_periodic_backup(
@@ -163,7 +360,7 @@ def schedule_periodic_backup(
     """
 
     if archive_root is None:
-        archive_root = ArchiveManager().base_dir
+        archive_root = ArchiveManager.default_base_dir()
     archive_root = Path(archive_root).expanduser().resolve()
 
     if backup_dest_dir is None:
@@ -206,6 +403,7 @@ def _cli():  # noqa: D401 – imperative CLI helper
     create_p = subparsers.add_parser("create", help="Create a new archive backup ZIP")
     create_p.add_argument("archive_root", nargs="?", help="Path to archive root (defaults to canonical)")
     create_p.add_argument("backup_dest", nargs="?", help="Directory to place ZIP (defaults to <archive>/../backups)")
+    create_p.add_argument("--store", action="store_true", help="Store every entry uncompressed (fastest)")
 
     # restore sub-command ------------------------------------------------------
     restore_p = subparsers.add_parser("restore", help="Restore archive from backup ZIP")
@@ -215,7 +413,7 @@ def _cli():  # noqa: D401 – imperative CLI helper
     args = parser.parse_args()
 
     if args.command == "create":
-        zip_path = create_backup(args.archive_root, args.backup_dest)
+        zip_path = create_backup(args.archive_root, args.backup_dest, compress=not args.store)
         print(zip_path)
     elif args.command == "restore":
         restore_backup(args.backup_zip, args.dest_root)
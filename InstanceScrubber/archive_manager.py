@@ -6,6 +6,9 @@ Responsibilities
 ----------------
 1. Create uniquely named *session* folders using the pattern ``[n]_[YYYY-MM-DD_HH-MM-SS]``.
 2. Store the original ``recording.wav`` file inside the session folder.
+   Identical recordings are stored once under ``.cas/<hh>/<sha256>.wav`` and hard-linked into
+   each session folder (plain copy where hard links are unsupported).  Blobs no session links to
+   any more are reclaimed by :meth:`ArchiveManager.prune_cas`.
 3. Persist transcription text in a ``.txt`` file whose name is derived from the *first seven words*
    of the transcription (spaces → underscores).  Collisions are handled by appending ``_1``, ``_2`` ….
 
@@ -15,16 +18,79 @@ full code-path on any CI runner.
 
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
+import hashlib
 import logging
+import mmap
 import os
 import re
 import shutil
+import tempfile
+import threading
 from typing import Final
 
 __all__ = [
     "ArchiveManager",
 ]
 
+# Allow unicode letters, numbers, dash and underscore – everything else is stripped.
+_SANITIZE_RE: Final[re.Pattern[str]] = re.compile(r"[^\w\-]", re.UNICODE)
+
+def _file_sha256(path: Path) -> str:
+    """Return the hex SHA-256 digest of *path* (streamed, constant memory)."""
+    with open(path, "rb") as fh:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+ – hashes in C, no Python loop
+            return hashlib.file_digest(fh, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        if os.fstat(fh.fileno()).st_size:  # mmap() rejects empty files
+            # Hash straight from the page cache in a single C-level update()
+            # (GIL released) instead of a Python read loop.
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                digest.update(mapped)
+        return digest.hexdigest()
+
+
+# O_BINARY only exists (and matters) on Windows – keeps the CRT from translating newlines.
+# Text callers translate up front via _NEWLINE, like ``write_text`` does.
+_NEWLINE: Final[str] = os.linesep
+_WRITE_FLAGS: Final[int] = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """Write *data* to *path* with raw ``os.write`` calls (no text/buffer layers, no fsync)."""
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    """Copy *src* → *dst* contents only, staying in the kernel when possible.
+
+    Uses :func:`os.copy_file_range` (Linux; server-side copy / reflink on
+    XFS & Btrfs) and falls back to :func:`shutil.copyfile` on any platform or
+    filesystem that does not support it.  Mode bits, timestamps and xattrs are
+    deliberately *not* copied – archived recordings are internal artefacts.
+    """
+    copy_range = getattr(os, "copy_file_range", None)
+    if copy_range is not None:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+                remaining = os.fstat(src_fd).st_size
+                while remaining > 0:
+                    copied = copy_range(src_fd, dst_fd, remaining)
+                    if copied == 0:  # source shrank underneath us
+                        break
+                    remaining -= copied
+            return
+        except OSError:  # EXDEV on old kernels, ENOSYS, EINVAL on some FS …
+            pass
+    shutil.copyfile(src, dst)
+
 
 class ArchiveManager:  # pylint: disable=too-few-public-methods
     """High-level helper for persisting finished recordings to disk."""
@@ -32,25 +98,46 @@ class ArchiveManager:  # pylint: disable=too-few-public-methods
     _TIMESTAMP_FMT: Final[str] = "%Y-%m-%d_%H-%M-%S"
     _SESSION_REGEX: Final[re.Pattern[str]] = re.compile(r"^(\d+)_\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}$")
     _MAX_WORDS: Final[int] = 7
+    _CAS_DIRNAME: Final[str] = ".cas"
+    #: Copy-in / link rounds before a recording is copied straight from its source.
+    _STORE_ATTEMPTS: Final[int] = 3
 
     # ..................................................................
     def __init__(self, *, base_dir: Path | str | None = None, config_manager=None) -> None:  # noqa: D401
         if base_dir is None:
-            if config_manager is not None:
-                # ConfigManager may contain Windows-style env vars (e.g. %USERNAME%). Expand them.
-                raw = str(config_manager.get("archive_root", ""))
-                base_dir = Path(os.path.expandvars(raw)) if raw else Path.home() / "Instant Scribe" / "archive"
-            else:
-                base_dir = Path.home() / "Instant Scribe" / "archive"
+            base_dir = self.default_base_dir(config_manager)
         self.base_dir: Path = Path(base_dir).expanduser().resolve()
         self.base_dir.mkdir(parents=True, exist_ok=True)
 
+        # Highest session index handed out so far – populated by a directory
+        # scan, then advanced in memory while the root's mtime is unchanged.
+        self._last_idx: int | None = None
+        self._idx_mtime_ns: int | None = None
+        self._idx_lock = threading.Lock()
+        # Serialises blob creation / linking against pruning of the CAS.
+        self._cas_lock = threading.Lock()
+
         self._log = logging.getLogger(self.__class__.__name__)
         self._log.debug("Archive root set to %s", self.base_dir)
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
+    @classmethod
+    def default_base_dir(cls, config_manager=None) -> Path:
+        """Return the canonical archive root **without** touching the filesystem.
+
+        Unlike constructing an :class:`ArchiveManager`, this neither creates
+        the directory nor resolves symlinks – callers that only need the
+        default location (e.g. backup helpers) avoid the extra syscalls.
+        """
+        if config_manager is not None:
+            # ConfigManager may contain Windows-style env vars (e.g. %USERNAME%). Expand them.
+            raw = str(config_manager.get("archive_root", ""))
+            if raw:
+                return Path(os.path.expandvars(raw))
+        return Path.home() / "Instant Scribe" / "archive"
+
     def archive(self, *, wav_path: Path | str, transcription: str) -> Path:  # noqa: D401 – imperative API
         """Archive *wav_path* and *transcription*, returning the session folder *Path*."""
         wav_path = Path(wav_path)
@@ -61,49 +148,181 @@ class ArchiveManager:  # pylint: disable=too-few-public-methods
 
         # 1. Copy / move original WAV file
         target_wav = session_dir / "recording.wav"
-        shutil.copy2(wav_path, target_wav)
+        self._store_recording(wav_path, target_wav)
 
         # 2. Persist transcription text
         txt_path = session_dir / self._derive_txt_filename(transcription, session_dir)
-        txt_path.write_text(transcription, encoding="utf-8", errors="surrogatepass")
+        if _NEWLINE != "\n":  # keep CRLF transcripts on Windows, as write_text() produced
+            transcription = transcription.replace("\n", _NEWLINE)
+        _write_bytes(txt_path, transcription.encode("utf-8", "surrogatepass"))
 
         self._log.info("Archived session at %s", session_dir)
         return session_dir
 
+    def delete_session(self, session_dir: Path | str) -> int:
+        """Remove *session_dir* and reclaim its recording from the CAS if unshared.
+
+        Returns the number of CAS blobs freed (see :meth:`prune_cas`).
+        """
+        session_dir = Path(session_dir)
+        if session_dir.parent.resolve() != self.base_dir or not self._SESSION_REGEX.match(session_dir.name):
+            raise ValueError(f"Not a session folder of {self.base_dir}: {session_dir}")
+        shutil.rmtree(session_dir)
+        self._log.info("Deleted session %s", session_dir)
+        return self.prune_cas()
+
+    def prune_cas(self) -> int:
+        """Delete CAS blobs that no session folder links to any more.
+
+        Every session holds a hard link to its blob, so the link count doubles
+        as a reference count: a blob whose ``st_nlink`` is 1 is referenced by
+        the store alone.  The count comes from :func:`os.stat` –
+        ``DirEntry.stat()`` reports ``st_nlink == 0`` on Windows.  Sessions that received a plain copy (no hard-link
+        support) never pin their blob, which is then reclaimed here as well.
+        Returns the number of blobs removed.
+        """
+        cas_root = self.base_dir / self._CAS_DIRNAME
+        removed = 0
+        with self._cas_lock:
+            try:
+                buckets = list(os.scandir(cas_root))
+            except FileNotFoundError:
+                return 0
+            for bucket in buckets:
+                if not bucket.is_dir(follow_symlinks=False):
+                    continue
+                with os.scandir(bucket.path) as it:
+                    blobs = [entry for entry in it if entry.name.endswith(".wav")]
+                for blob in blobs:
+                    try:
+                        if os.stat(blob.path, follow_symlinks=False).st_nlink <= 1:
+                            os.unlink(blob.path)
+                            removed += 1
+                    except FileNotFoundError:
+                        continue
+                try:
+                    os.rmdir(bucket.path)  # only succeeds once the bucket is empty
+                except OSError:
+                    pass
+        if removed:
+            self._log.info("Pruned %d unreferenced recording(s) from %s", removed, cas_root)
+        return removed
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
     def _create_session_dir(self) -> Path:
-        """Return a newly created session directory following the naming convention."""
-        next_idx = self._next_session_index()
-        timestamp = datetime.now().strftime(self._TIMESTAMP_FMT)
-        dir_name = f"{next_idx}_{timestamp}"
-        session_dir = self.base_dir / dir_name
-        session_dir.mkdir(parents=True, exist_ok=False)
+        """Return a newly created session directory following the naming convention.
+
+        The cached index is only trusted while the archive root's mtime is the
+        one recorded after our own last ``mkdir``; sessions created by another
+        :class:`ArchiveManager` or process in between bump it and force a
+        rescan.  Two writers allocating within the same instant (or within one
+        timestamp tick on filesystems with coarse directory times, e.g. FAT)
+        can still pick the same *n* – the same window the plain scan had.
+        """
+        with self._idx_lock:
+            timestamp = datetime.now().strftime(self._TIMESTAMP_FMT)
+            while True:
+                next_idx = self._next_session_index()
+                session_dir = self.base_dir / f"{next_idx}_{timestamp}"
+                try:
+                    session_dir.mkdir(parents=True, exist_ok=False)
+                    break
+                except FileExistsError:
+                    # Another writer took this exact name – rescan.
+                    self._last_idx = None
+            self._last_idx = next_idx
+            self._idx_mtime_ns = os.stat(self.base_dir).st_mtime_ns
         return session_dir
 
+    # ..................................................................
+    def _store_recording(self, wav_path: Path, target_wav: Path) -> None:
+        """Place *wav_path* at *target_wav* via the content-addressed store.
+
+        The payload is copied into ``.cas`` only the first time its digest is
+        seen; every session then receives a hard link to that single blob so
+        re-archived audio (retries, re-runs) costs no additional disk space.
+
+        ``_cas_lock`` only guards this instance – another manager or process
+        may prune the fresh blob before it is linked, in which case it is
+        copied in again (and, after :attr:`_STORE_ATTEMPTS` rounds, the
+        recording is copied straight from *wav_path*).
+        """
+        digest = _file_sha256(wav_path)
+        cas_path = self.base_dir / self._CAS_DIRNAME / digest[:2] / f"{digest}.wav"
+        with self._cas_lock:  # prune_cas() must not reclaim the blob before it is linked
+            for _ in range(self._STORE_ATTEMPTS):
+                try:
+                    if not cas_path.exists():
+                        self._copy_into_cas(wav_path, cas_path)
+                    try:
+                        os.link(cas_path, target_wav)
+                    except FileNotFoundError:
+                        raise
+                    except OSError:  # FAT/exFAT, network shares … – fall back to an independent copy
+                        _fast_copy(cas_path, target_wav)
+                    return
+                except FileNotFoundError:
+                    # Pruned by another manager between copy-in and link – store it again.
+                    self._log.debug("CAS blob %s vanished before linking – retrying", cas_path.name)
+            _fast_copy(wav_path, target_wav)
+
+    @staticmethod
+    def _copy_into_cas(wav_path: Path, cas_path: Path) -> None:
+        """Atomically publish a copy of *wav_path* as the CAS blob *cas_path*."""
+        cas_path.parent.mkdir(parents=True, exist_ok=True)
+        # Copy under a unique temporary name first so a crash never leaves a truncated
+        # blob behind and concurrent writers (any process or manager) never share it.
+        fd, tmp_name = tempfile.mkstemp(prefix=f"{cas_path.stem}.", suffix=".tmp", dir=cas_path.parent)
+        os.close(fd)
+        try:
+            _fast_copy(wav_path, Path(tmp_name))
+            os.replace(tmp_name, cas_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+
     # ..................................................................
     def _next_session_index(self) -> int:
-        """Compute the next *n* by inspecting existing session folders."""
+        """Return the next *n*, rescanning session folders only when the root changed.
+
+        Callers must hold ``_idx_lock``.
+        """
+        mtime_ns = os.stat(self.base_dir).st_mtime_ns
+        if self._last_idx is not None and mtime_ns == self._idx_mtime_ns:
+            return self._last_idx + 1
+
         max_idx = 0
-        for entry in self.base_dir.iterdir():
-            if not entry.is_dir():
-                continue
-            match = self._SESSION_REGEX.match(entry.name)
-            if match:
-                try:
-                    idx = int(match.group(1))
-                    max_idx = max(max_idx, idx)
-                except ValueError:
+        # *scandir* reuses the readdir type bits – no per-entry stat() call.
+        with os.scandir(self.base_dir) as it:
+            for entry in it:
+                name = entry.name
+                # A leading digit is required by the pattern – cheaply skips
+                # ``.cas``, ``backups`` & friends before touching the regex.
+                if not name[:1].isdigit() or not entry.is_dir(follow_symlinks=False):
                     continue
+                match = self._SESSION_REGEX.match(name)
+                if match:
+                    max_idx = max(max_idx, int(match.group(1)))
+        self._last_idx = max_idx
+        # Stamp taken *before* the scan – a change made mid-scan triggers another.
+        self._idx_mtime_ns = mtime_ns
         return max_idx + 1
 
     # ..................................................................
-    @classmethod
-    def _sanitize_word(cls, word: str) -> str:
-        """Return **word** stripped of filesystem-hostile characters."""
-        # Allow unicode letters, numbers, dash and underscore. Replace others with nothing.
-        return re.sub(r"[^\w\-]", "", word, flags=re.UNICODE)
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _sanitize_word(word: str) -> str:
+        """Return **word** stripped of filesystem-hostile characters.
+
+        Cached because transcripts start with the same handful of common words
+        over and over ("the", "and", …).
+        """
+        return _SANITIZE_RE.sub("", word)
 
     def _derive_txt_filename(self, transcription: str, session_dir: Path) -> str:
         """Generate a unique filename for the transcription within *session_dir*."""
@@ -16,6 +16,8 @@ import math
 import threading
 from typing import Callable, Optional
 
+import numpy as np
+
 try:
     import pyaudio  # type: ignore
 except ModuleNotFoundError:  # pragma: no cover – optional at runtime / in CI
@@ -26,17 +28,27 @@ try:
 except ModuleNotFoundError:  # pragma: no cover – fallback stub for test environments
 
     class _StubVad:  # pylint: disable=too-few-public-methods
-        """Fallback *no-op* VAD when *webrtcvad* wheel unavailable.
+        """Fallback *energy* VAD when *webrtcvad* wheel unavailable.
 
-        The *is_speech()* method always returns ``False`` ensuring predictable
-        behaviour in test runners lacking the native extension.
+        A frame counts as speech when its RMS level exceeds a threshold that
+        grows with *mode* (the webrtcvad aggressiveness, 0–3).  Silent frames
+        therefore still yield ``False`` – keeping test runners that lack the
+        native extension predictable – while real microphone input gates
+        sensibly.  The energy is a single vectorised NumPy dot product.
         """
 
-        def __init__(self, *_args, **_kwargs) -> None:
-            pass
+        _BASE_RMS = 300.0  # int16 RMS threshold at aggressiveness 0
+
+        def __init__(self, mode: int = 0, *_args, **_kwargs) -> None:
+            rms = self._BASE_RMS * (1 + max(0, min(int(mode), 3)))
+            self._threshold_sq = rms * rms
 
-        def is_speech(self, _frame: bytes, _sample_rate: int) -> bool:  # noqa: D401 – simple stub
-            return False
+        def is_speech(self, frame: bytes, _sample_rate: int) -> bool:  # noqa: D401 – simple stub
+            samples = np.frombuffer(frame, dtype=np.int16).astype(np.float32)
+            if not samples.size:
+                return False
+            # mean(x²) > rms²  ⇔  x·x > rms² · n  – avoids the sqrt and mean.
+            return float(np.dot(samples, samples)) > self._threshold_sq * samples.size
 
     webrtcvad = type("_webrtcvad", (), {"Vad": _StubVad})()  # type: ignore
 
@@ -79,7 +91,10 @@ class VADAudioGate:
 
         self._in_speech: bool = False
         self._silence_counter: int = 0
-        self._buffer = bytearray()
+        # Frames of the current utterance – joined exactly once on speech end
+        # instead of growing (and finally copying) a bytearray.
+        self._chunks: list[bytes] = []
+        self._buffer_len: int = 0
 
     # ------------------------------------------------------------------
     # Public API
@@ -92,31 +107,38 @@ class VADAudioGate:
         • be encoded as 16-bit little-endian PCM;
         • have length exactly *bytes_per_frame*.
         """
-        if len(frame) != self.bytes_per_frame:
+        frame_len = self.bytes_per_frame
+        # Validation is compiled out under ``python -O`` – this runs every 10–30 ms.
+        if __debug__ and len(frame) != frame_len:
             raise ValueError(
-                f"Invalid frame length {len(frame)} bytes – expected {self.bytes_per_frame}")
+                f"Invalid frame length {len(frame)} bytes – expected {frame_len}")
 
         is_voiced = self._vad.is_speech(frame, self.sample_rate)
+        chunks = self._chunks
 
         if self._in_speech:
-            self._buffer.extend(frame)
+            chunks.append(frame)
+            self._buffer_len += frame_len
             if is_voiced:
                 self._silence_counter = 0  # reset on continued speech
             else:
                 self._silence_counter += 1
                 if self._silence_counter >= self._silence_frames_required:
                     # End of utterance detected
-                    logging.debug("VAD → speech_end (buffer=%d bytes)", len(self._buffer))
+                    logging.debug("VAD → speech_end (buffer=%d bytes)", self._buffer_len)
                     self._in_speech = False
-                    self._on_end(bytes(self._buffer))
+                    data = b"".join(chunks)
                     # Reset state for next utterance
-                    self._buffer.clear()
+                    chunks.clear()
+                    self._buffer_len = 0
                     self._silence_counter = 0
+                    self._on_end(data)
         else:  # currently in SILENT state
             if is_voiced:
                 logging.debug("VAD → speech_start")
                 self._in_speech = True
-                self._buffer.extend(frame)
+                chunks.append(frame)
+                self._buffer_len += frame_len
                 self._on_start()
 
 
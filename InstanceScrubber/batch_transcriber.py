@@ -22,9 +22,11 @@ Design highlights
    stage.
 """
 
-from concurrent.futures import ThreadPoolExecutor, Future
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed
+from functools import partial
 from typing import Dict, List, Optional
 import logging
+import threading
 
 from InstanceScrubber.transcription_worker import TranscriptionWorker, EngineResponse
 
@@ -47,7 +49,11 @@ class BatchTranscriber:  # pylint: disable=too-few-public-methods
         self.batch_length_ms = batch_length_ms
         self.overlap_ms = overlap_ms
         self._seq: int = 0
+        # *Pending* slices only – a done-callback moves each outcome into
+        # ``_results`` and drops the Future (and its EngineResponse) at once.
         self._futures: Dict[int, Future[EngineResponse]] = {}
+        self._results: Dict[int, str | BaseException] = {}
+        self._lock = threading.Lock()
 
         # The *TranscriptionWorker* already isolates the heavy model in a
         # separate *process* when *use_stub=False*.  In CI we pass
@@ -57,7 +63,13 @@ class BatchTranscriber:  # pylint: disable=too-few-public-methods
 
         # Thread-pool off-loads the blocking *transcribe()* calls so multiple
         # 10-minute windows can be processed concurrently.
-        self._executor = ThreadPoolExecutor(max_workers=max_workers or 4)
+        workers = max_workers or 4
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+
+        # The executor's work queue is unbounded – cap in-flight slices so a
+        # long recording cannot pile up hundreds of MB of queued PCM.
+        # *submit_slice* blocks (back-pressure) once the cap is reached.
+        self._slots = threading.BoundedSemaphore(workers * 2)
 
     # ------------------------------------------------------------------
     # Slice submission helpers
@@ -68,27 +80,69 @@ class BatchTranscriber:  # pylint: disable=too-few-public-methods
         The caller is responsible for slicing the *recording* into fixed-length
         windows (see *AudioListener* + *AudioSpooler* logic).  Here we simply
         forward the PCM bytes to the underlying *TranscriptionWorker*.
+
+        Blocks while ``2 × max_workers`` slices are already in flight.
         """
+        self._slots.acquire()
+        try:
+            fut = self._executor.submit(self._worker.transcribe, audio_pcm)
+        except BaseException:
+            self._slots.release()
+            raise
+        fut.add_done_callback(lambda _fut: self._slots.release())
+
         seq = self._seq
         self._seq += 1
-
-        logging.debug("Submitting batch slice seq=%d (%d bytes)", seq, len(audio_pcm))
-        fut = self._executor.submit(self._worker.transcribe, audio_pcm)
-        self._futures[seq] = fut
+        logging.debug("Submitted batch slice seq=%d (%d bytes)", seq, len(audio_pcm))
+        with self._lock:
+            self._futures[seq] = fut
+        # Registered outside the lock – runs inline when *fut* is already done.
+        fut.add_done_callback(partial(self._on_slice_done, seq))
+
+    def _on_slice_done(self, seq: int, fut: Future[EngineResponse]) -> None:
+        """Record the outcome of slice *seq* and release its Future."""
+        outcome: str | BaseException
+        if fut.cancelled():
+            outcome = RuntimeError(f"Batch slice {seq} was cancelled")
+        elif fut.exception() is not None:
+            outcome = fut.exception()  # type: ignore[assignment]
+        else:
+            resp = fut.result()
+            if resp.ok:
+                outcome = str(resp.payload)
+            else:
+                outcome = RuntimeError(f"Batch slice {seq} failed: {resp.payload}")
+        with self._lock:
+            self._futures.pop(seq, None)
+            self._results[seq] = outcome
 
     # ------------------------------------------------------------------
     # Finalisation helpers
     # ------------------------------------------------------------------
     def finalise(self, *, timeout_per_slice: float | None = 30) -> str:  # noqa: D401 – imperative API
-        """Wait for *all* slices to complete and return the concatenated text."""
-        logging.info("Finalising batch transcription – awaiting %d partial results", len(self._futures))
+        """Wait for *all* slices to complete and return the concatenated text.
+
+        Slices that already finished were harvested by their done-callback;
+        the remaining ones are awaited in *completion* order, so a slow early
+        slice never delays later ones.  The overall deadline is
+        ``timeout_per_slice × number of pending slices`` – the same worst case
+        as waiting on each slice in turn.
+        """
+        with self._lock:
+            future_to_seq = {fut: seq for seq, fut in self._futures.items()}
+        logging.info("Finalising batch transcription – awaiting %d partial results", len(future_to_seq))
+        total_timeout = None if timeout_per_slice is None else timeout_per_slice * max(1, len(future_to_seq))
+
+        for fut in as_completed(future_to_seq, timeout=total_timeout):
+            # Callbacks fire only *after* waiters are woken – record explicitly.
+            self._on_slice_done(future_to_seq[fut], fut)
+
         ordered_text: List[str] = []
-        for seq in sorted(self._futures):
-            fut = self._futures[seq]
-            resp = fut.result(timeout=timeout_per_slice)
-            if not resp.ok:
-                raise RuntimeError(f"Batch slice {seq} failed: {resp.payload}")
-            ordered_text.append(str(resp.payload))
+        for seq in range(self._seq):
+            outcome = self._results[seq]
+            if isinstance(outcome, BaseException):
+                raise outcome
+            ordered_text.append(outcome)
 
         # Join with a single space – the model already returns punctuation.
         return " ".join(ordered_text)
@@ -22,16 +22,43 @@ relies only on :pypi:`pyperclip` (already used by *notification_manager*) and
 standard-library modules.
 """
 
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 import logging
+import sys
 import time
 import re
-import textwrap
 
-__all__ = ["copy_with_verification"]
+try:  # Resolved once at import – swap via :func:`set_clipboard_backend`
+    import pyperclip as _pyperclip  # type: ignore
+except ImportError:  # pragma: no cover – clipboard unavailable, disk fallback only
+    _pyperclip = None  # type: ignore[assignment]
+
+# Backend resolved at import – restored by ``set_clipboard_backend(None)``.
+_DEFAULT_BACKEND = _pyperclip
+
+__all__ = ["copy_with_verification", "set_clipboard_backend"]
 
 _LOG = logging.getLogger(__name__)
 
+_WORD_RE = re.compile(r"\S+")
+_BADCHAR_RE = re.compile(r"[^0-9A-Za-z_-]")
+
+# Characters per write() when streaming the fallback file.
+_WRITE_CHUNK = 1 << 20
+
+# Payloads at least this long get a cheap native size probe before the full
+# paste-back (Windows only) – pasting a multi-GB string just to find a
+# mismatch costs seconds and several GB of transient memory.
+_SIZE_PROBE_MIN_CHARS = 1 << 20
+_CF_UNICODETEXT = 13
+_GMEM_MOVEABLE = 0x0002
+
+# Only while the default backend is active – an injected (test) backend has
+# nothing to do with the system clipboard.
+_native_clipboard_enabled = True
+
 # ---------------------------------------------------------------------------
 # Helper functions
 # ---------------------------------------------------------------------------
@@ -47,17 +74,159 @@ def _slugify(text: str, max_words: int = 7, max_len: int = 64) -> str:
         4. Truncate to *max_len* chars to avoid pathological long filenames
     """
 
-    words = re.split(r"\s+", text.strip())[:max_words]
+    # Lazily match only the leading words – equivalent to splitting the
+    # stripped text but never copies or scans a (potentially huge) payload.
+    words = [m.group() for m in islice(_WORD_RE.finditer(text), max_words)]
     slug = "_".join(words)
-    slug = re.sub(r"[^0-9A-Za-z_-]", "", slug)
+    slug = _BADCHAR_RE.sub("", slug)
     return slug[:max_len] or "clip_fallback"
 
 
+@lru_cache(maxsize=1)
+def _win32_clipboard_api():  # pragma: no cover – Windows only
+    """Return ``(user32, kernel32)`` with prototypes set, or *None* off Windows."""
+    if sys.platform != "win32":
+        return None
+    import ctypes
+    from ctypes import wintypes
+
+    user32 = ctypes.WinDLL("user32", use_last_error=True)
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    user32.OpenClipboard.argtypes = [wintypes.HWND]
+    user32.OpenClipboard.restype = wintypes.BOOL
+    user32.GetClipboardData.argtypes = [wintypes.UINT]
+    user32.GetClipboardData.restype = wintypes.HANDLE
+    user32.CloseClipboard.restype = wintypes.BOOL
+    user32.EmptyClipboard.restype = wintypes.BOOL
+    user32.SetClipboardData.argtypes = [wintypes.UINT, wintypes.HANDLE]
+    user32.SetClipboardData.restype = wintypes.HANDLE
+    user32.CreateWindowExW.argtypes = [
+        wintypes.DWORD, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD,
+        ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+        wintypes.HWND, wintypes.HMENU, wintypes.HINSTANCE, wintypes.LPVOID,
+    ]
+    user32.CreateWindowExW.restype = wintypes.HWND
+    user32.DestroyWindow.argtypes = [wintypes.HWND]
+    user32.DestroyWindow.restype = wintypes.BOOL
+    kernel32.GlobalSize.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalSize.restype = ctypes.c_size_t
+    kernel32.GlobalAlloc.argtypes = [wintypes.UINT, ctypes.c_size_t]
+    kernel32.GlobalAlloc.restype = wintypes.HGLOBAL
+    kernel32.GlobalLock.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalLock.restype = wintypes.LPVOID
+    kernel32.GlobalUnlock.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalUnlock.restype = wintypes.BOOL
+    kernel32.GlobalFree.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalFree.restype = wintypes.HGLOBAL
+    return user32, kernel32
+
+
+def _native_clipboard_size() -> int | None:  # pragma: no cover – Windows only
+    """Return the byte size of the ``CF_UNICODETEXT`` block, *None* if unknown.
+
+    Only ``GlobalSize`` is queried – the (potentially huge) text itself is never
+    copied out of the clipboard.
+    """
+    try:
+        api = _win32_clipboard_api()
+        if api is None:
+            return None
+        user32, kernel32 = api
+        if not user32.OpenClipboard(None):
+            return None
+        try:
+            handle = user32.GetClipboardData(_CF_UNICODETEXT)
+            return int(kernel32.GlobalSize(handle)) if handle else 0
+        finally:
+            user32.CloseClipboard()
+    except Exception:  # noqa: BLE001 – probe is best-effort only
+        return None
+
+
+def _native_clipboard_copy(payload: str) -> bool:  # pragma: no cover – Windows only
+    """Place *payload* on the clipboard via the WinAPI; *False* if not possible.
+
+    Avoids pyperclip's retry loop and context-manager layers.
+    ``SetClipboardData`` fails when the clipboard was opened without an
+    owner window, so a hidden one is created for the call and destroyed
+    afterwards – callers are often short-lived worker threads, and a
+    window kept per thread would outlive them.
+    """
+    try:
+        api = _win32_clipboard_api()
+        if api is None:
+            return False
+        import ctypes
+
+        user32, kernel32 = api
+        data = payload.encode("utf-16-le") + b"\0\0"
+        hmem = kernel32.GlobalAlloc(_GMEM_MOVEABLE, len(data))
+        if not hmem:
+            return False
+        ptr = kernel32.GlobalLock(hmem)
+        if not ptr:
+            kernel32.GlobalFree(hmem)
+            return False
+        try:
+            ctypes.memmove(ptr, data, len(data))
+        finally:
+            kernel32.GlobalUnlock(hmem)
+        del data
+
+        hwnd = user32.CreateWindowExW(0, "STATIC", None, 0, 0, 0, 0, 0, None, None, None, None)
+        if not hwnd:
+            kernel32.GlobalFree(hmem)
+            return False
+        try:
+            if not user32.OpenClipboard(hwnd):
+                kernel32.GlobalFree(hmem)
+                return False
+            try:
+                user32.EmptyClipboard()
+                if not user32.SetClipboardData(_CF_UNICODETEXT, hmem):
+                    kernel32.GlobalFree(hmem)  # ownership only passes on success
+                    return False
+            finally:
+                user32.CloseClipboard()
+        finally:
+            user32.DestroyWindow(hwnd)
+        return True
+    except Exception:  # noqa: BLE001 – fall back to pyperclip
+        return False
+
+
+def _clipboard_too_small(payload: str) -> bool:
+    """Return *True* when the clipboard provably cannot hold *payload*.
+
+    UTF-16 needs at least two bytes per code point plus the terminator, so a
+    smaller ``GlobalSize`` means a mismatch.  (The block may be rounded *up*,
+    hence only the lower bound is conclusive.)
+    """
+    if not _native_clipboard_enabled or len(payload) < _SIZE_PROBE_MIN_CHARS:
+        return False
+    size = _native_clipboard_size()
+    return size is not None and size < 2 * (len(payload) + 1)
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
 
+def set_clipboard_backend(module) -> None:
+    """Replace the clipboard backend used by :func:`copy_with_verification`.
+
+    *module* must be *pyperclip*-compatible, i.e. expose ``copy``, ``paste``
+    and ``PyperclipException``.  The direct WinAPI write and size probe are
+    bypassed while an injected backend is active; passing *None* restores
+    the default backend and re-enables them.  Primarily a hook for
+    unit-tests.
+    """
+    global _pyperclip, _native_clipboard_enabled  # pylint: disable=global-statement
+    _pyperclip = _DEFAULT_BACKEND if module is None else module
+    _native_clipboard_enabled = module is None
+
+
 def copy_with_verification(
     payload: str,
     *,
@@ -87,13 +256,7 @@ def copy_with_verification(
         (indicating that a fallback file has been created).
     """
 
-    # Import *pyperclip* at call time so that unit-tests can monkey-patch or
-    # replace the module **after** *clipboard_manager* has been imported.  We
-    # purposefully fetch the live reference from *sys.modules* so that tests
-    # which overwrite the entry with a stub implementation are honoured even
-    # if a real *pyperclip* module was imported earlier during the test run.
-    import sys, importlib
-    pyperclip = sys.modules.get("pyperclip") or importlib.import_module("pyperclip")
+    pyperclip = _pyperclip
 
     # ------------------------------------------------------------------
     # Fast-path: nothing to do for empty payload
@@ -102,6 +265,10 @@ def copy_with_verification(
         _LOG.debug("Nothing to copy – empty payload")
         return True
 
+    if pyperclip is None:  # pragma: no cover – pyperclip not installed
+        _LOG.warning("pyperclip unavailable – skipping clipboard, writing fallback file")
+        max_retries = 0
+
     # Transparent optimisation – avoid copying gargantuan strings more than
     # once when the verification strategy can be downgraded to a checksum.
     # However, Task 23 explicitly mentions 1 billion-char stress test so we
@@ -112,7 +279,8 @@ def copy_with_verification(
     # ------------------------------------------------------------------
     for attempt in range(1, max_retries + 1):
         try:
-            pyperclip.copy(payload)
+            if not (_native_clipboard_enabled and _native_clipboard_copy(payload)):
+                pyperclip.copy(payload)
         except pyperclip.PyperclipException as exc:
             _LOG.debug("Clipboard copy failed on attempt %d/%d: %s", attempt, max_retries, exc)
         except Exception as exc:  # pragma: no cover – unexpected runtime error
@@ -123,7 +291,9 @@ def copy_with_verification(
             # time to propagate the data.
             try:
                 time.sleep(retry_delay)
-                if pyperclip.paste() == payload:
+                if _clipboard_too_small(payload):
+                    _LOG.debug("Clipboard size probe mismatch on attempt %d – skipping paste", attempt)
+                elif pyperclip.paste() == payload:
                     _LOG.debug("Clipboard verification succeeded on attempt %d", attempt)
                     return True
                 _LOG.debug("Clipboard verification mismatch on attempt %d", attempt)
@@ -143,22 +313,22 @@ def copy_with_verification(
         _LOG.warning("Failed to create fallback directory %s: %s", dest_dir, exc)
         dest_dir = Path.cwd()
 
-    filename = _slugify(payload) + ".txt"
-    file_path = dest_dir / filename
+    slug = _slugify(payload)
+    file_path = dest_dir / f"{slug}.txt"
 
     # Guard against overwriting – append a counter if file exists.
     counter = 1
     while file_path.exists():
-        file_path = dest_dir / f"{_slugify(payload)}_{counter}.txt"
+        file_path = dest_dir / f"{slug}_{counter}.txt"
         counter += 1
 
     try:
-        # Use *write_text* with explicit encoding to avoid OS defaults.
-        # To mitigate memory bloat with very large payloads we stream via
-        # *write* chunks.
+        # Explicit encoding avoids OS defaults.  Plain slicing streams very
+        # large payloads one chunk at a time without materialising a list of
+        # pieces (and, unlike *textwrap*, preserves whitespace verbatim).
         with file_path.open("w", encoding="utf-8", newline="\n") as handle:
-            for chunk in textwrap.wrap(payload, 8192):
-                handle.write(chunk)
+            for start in range(0, len(payload), _WRITE_CHUNK):
+                handle.write(payload[start:start + _WRITE_CHUNK])
         _LOG.info("Clipboard unavailable – wrote fallback file: %s", file_path)
     except Exception as exc:  # pragma: no cover – disk write failure
         _LOG.error("Failed to write fallback file %s: %s", file_path, exc)
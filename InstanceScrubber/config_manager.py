@@ -1,8 +1,123 @@
+import copy
+import hashlib
 import json
 import logging
 import os
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Optional, Tuple, Union
+
+try:  # Optional – faster JSON parser (falls back to the stdlib)
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover – optional dependency
+    orjson = None  # type: ignore[assignment]
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Parse *raw* JSON bytes – *orjson* when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialise *data* to UTF-8 JSON bytes in the established on-disk format.
+
+    Always the stdlib: *orjson* can only indent by two spaces, which would
+    silently reformat existing 4-space config files on the next save.
+    """
+    return json.dumps(data, indent=4).encode("utf-8")
+
+
+def _digest(payload: bytes) -> bytes:
+    """Short content fingerprint used to skip no-op config writes."""
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+@lru_cache(maxsize=8)
+def _compute_config_path(
+    app_name: str,
+    filename: str,
+    appdata: Optional[str],
+    xdg_config_home: Optional[str],
+    _home_env: Optional[str],  # cache-key only – expanduser("~") derives from it
+) -> Path:
+    """Return the config file path for the given environment snapshot.
+
+    Tests that monkey-patch the environment get a fresh entry automatically
+    because every relevant variable is part of the cache key.
+    """
+    # Prefer the *APPDATA* environment variable when set to provide
+    # predictable behaviour in test environments that monkey-patch the
+    # variable regardless of the host OS.  This keeps the logic simple
+    # and aligns with the expectations asserted in *tests/test_config_manager.py*.
+    # Plain string joins – a single Path is built at the end.
+    if appdata:
+        base_dir = appdata
+    elif os.name == "nt":
+        # Windows hosts fall back to the real %APPDATA% location if the
+        # variable is missing (unlikely) to avoid writing to the user's
+        # home directory.
+        base_dir = os.path.expanduser("~")
+    else:
+        # Cross-platform default: honour XDG if available, otherwise use
+        # ~/.config to avoid cluttering the home directory root.
+        base_dir = xdg_config_home if xdg_config_home is not None else os.path.join(os.path.expanduser("~"), ".config")
+
+    return Path(os.path.join(base_dir, app_name.replace(" ", "_"), filename))
+
+
+class _DebouncedFlusher:
+    """Run the debounced saves of every :class:`ConfigManager` on one thread.
+
+    A ``threading.Timer`` per ``set()`` call spawns a thread per update; here
+    a single thread sleeps until the earliest due save, and exits once none
+    are pending.  Non-daemon on purpose – interpreter exit waits for the
+    final write.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._due: Dict["ConfigManager", float] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    def schedule(self, manager: "ConfigManager", delay: float) -> None:
+        """(Re)arm *manager*'s save to run *delay* seconds from now."""
+        with self._cond:
+            self._due[manager] = time.monotonic() + delay
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="ConfigFlusher")
+                self._thread.start()
+            else:
+                self._cond.notify()
+
+    def cancel(self, manager: "ConfigManager") -> None:
+        """Forget *manager*'s pending save (it is being written right now)."""
+        with self._cond:
+            self._due.pop(manager, None)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if not self._due:
+                    self._thread = None
+                    return
+                manager, due = min(self._due.items(), key=lambda item: item[1])
+                remaining = due - time.monotonic()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+                del self._due[manager]
+            try:
+                manager.flush()
+            except Exception as exc:  # pylint: disable=broad-except – keep serving other managers
+                logging.error("Debounced config save failed: %s", exc)
+
+
+_FLUSHER = _DebouncedFlusher()
 
 
 class ConfigManager:
@@ -33,79 +148,219 @@ class ConfigManager:
         "gpu_monitor_interval_sec": 5,     # Polling interval in seconds
     }
 
+    #: Read-only live view of :attr:`DEFAULTS` – missing-key fallbacks and
+    #: default materialisation without copying the class-level dict by hand.
+    _DEFAULTS_PROXY = MappingProxyType(DEFAULTS)
+
+    #: Numeric settings coerced once at load time, so a hand-edited ``"5"``
+    #: does not have to be converted again by every consumer.
+    _SCHEMA: Dict[str, type] = {
+        "vad_aggressiveness": int,
+        "silence_threshold_ms": int,
+        "silence_prune_threshold_ms": int,
+        "batch_length_ms": int,
+        "batch_overlap_ms": int,
+        "spooler_chunk_interval_sec": int,
+        "vram_unload_threshold_mb": int,
+        "gpu_monitor_interval_sec": float,
+    }
+
+    #: Process-wide parse cache: config path → ((st_mtime_ns, st_size), settings,
+    #: content digest).  Repeated instantiation skips the JSON parse while the
+    #: file is unchanged.
+    _CACHE: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any], bytes]] = {}
+
+    #: Debounce window for ``set()`` – bursts of key updates become one write.
+    _FLUSH_DELAY_SEC = 0.5
+    #: Managers with a scheduled (not yet written) save, by config path.
+    _PENDING: Dict[Path, "ConfigManager"] = {}
+
     def __init__(self, app_name: str = "Instant Scribe") -> None:
         self.app_name = app_name
         self._config_path: Path = self._resolve_config_path()
         self.settings: Dict[str, Any] = {}
+        self._dirty = False
+        self._flush_lock = threading.Lock()
+        #: ``st_mtime_ns`` of the config file as of the last load / save –
+        #: lets callers skip :meth:`reload` while the file is untouched.
+        self.mtime_ns: Optional[int] = None
+        #: Digest of the file content last loaded or written by this manager –
+        #: saves that would produce identical bytes are skipped.
+        self._last_written_digest: Optional[bytes] = None
         self._load()
 
     # ---------------------------------------------------------------------
     # Public helpers
     # ---------------------------------------------------------------------
     def get(self, key: str, default: Optional[Any] = None) -> Any:
-        """Return the configuration value for *key*, or *default* if missing."""
-        return self.settings.get(key, default)
+        """Return the value for *key*.
+
+        Keys absent from the loaded file (e.g. written by an older release)
+        resolve to the shipped :attr:`DEFAULTS`, then to *default*.
+        """
+        try:
+            return self.settings[key]
+        except KeyError:
+            return self._DEFAULTS_PROXY.get(key, default)
 
-    def set(self, key: str, value: Any, *, auto_save: bool = True) -> None:
-        """Set *key* to *value*. Optionally persist immediately."""
+    def set(self, key: str, value: Any, *, auto_save: Union[bool, str] = True) -> None:
+        """Set *key* to *value* and optionally persist it.
+
+        With *auto_save* the write is debounced by ``_FLUSH_DELAY_SEC`` so a
+        burst of updates costs a single file rewrite; pass
+        ``auto_save="immediate"`` to write synchronously.  Pending writes are
+        flushed before any manager in this process reads the same file.
+        """
         self.settings[key] = value
-        if auto_save:
+        if auto_save == "immediate":
+            self._dirty = True
+            self.flush()
+        elif auto_save:
+            self._schedule_flush()
+
+    def flush(self) -> None:
+        """Write pending auto-saved changes to disk now."""
+        with self._flush_lock:
+            self._cancel_flush_timer()
+            if not self._dirty:
+                return
+            self._dirty = False
             self._save()
 
+    @property
+    def config_path(self) -> Path:
+        """Location of the backing JSON file."""
+        return self._config_path
+
     def reload(self) -> None:
-        """Force reload configuration from disk, discarding local changes."""
+        """Force reload configuration from disk, discarding unsaved local changes.
+
+        Changes made with *auto_save* count as saved and are flushed first.
+        """
+        self.flush()
+        self._CACHE.pop(self._config_path, None)
         self._load()
 
     # ------------------------------------------------------------------
     # Implementation details
     # ------------------------------------------------------------------
     def _resolve_config_path(self) -> Path:
-        """Compute platform-appropriate path for the JSON config."""
-        # Prefer the *APPDATA* environment variable when set to provide
-        # predictable behaviour in test environments that monkey-patch the
-        # variable regardless of the host OS.  This keeps the logic simple
-        # and aligns with the expectations asserted in *tests/test_config_manager.py*.
-        if "APPDATA" in os.environ and os.environ["APPDATA"]:
-            base_dir = Path(os.environ["APPDATA"])
-        elif os.name == "nt":
-            # Windows hosts fall back to the real %APPDATA% location if the
-            # variable is missing (unlikely) to avoid writing to the user's
-            # home directory.
-            base_dir = Path(Path.home())
-        else:
-            # Cross-platform default: honour XDG if available, otherwise use
-            # ~/.config to avoid cluttering the home directory root.
-            base_dir = Path(os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config"))
-
-        path = base_dir / self.app_name.replace(" ", "_") / self._FILENAME
-        return path
+        """Compute platform-appropriate path for the JSON config.
+
+        The result only depends on the app name and a few environment
+        variables, so it is memoised by :func:`_compute_config_path`.
+        """
+        env = os.environ
+        return _compute_config_path(
+            self.app_name,
+            self._FILENAME,
+            env.get("APPDATA"),
+            env.get("XDG_CONFIG_HOME"),
+            env.get("USERPROFILE" if os.name == "nt" else "HOME"),
+        )
+
+    def _schedule_flush(self) -> None:
+        """(Re)arm the debounced save on the shared flusher thread."""
+        with self._flush_lock:
+            self._dirty = True
+            _FLUSHER.schedule(self, self._FLUSH_DELAY_SEC)
+            self._PENDING[self._config_path] = self
+
+    def _cancel_flush_timer(self) -> None:
+        _FLUSHER.cancel(self)
+        if self._PENDING.get(self._config_path) is self:
+            del self._PENDING[self._config_path]
 
     def _load(self) -> None:
         """Load settings from disk, creating the file with defaults if absent."""
+        pending = self._PENDING.get(self._config_path)
+        if pending is not None and pending is not self:
+            pending.flush()  # read-your-writes across managers in this process
+        self._last_written_digest = None
         try:
-            if self._config_path.exists():
-                with self._config_path.open("r", encoding="utf-8") as fh:
-                    self.settings = json.load(fh)
+            try:
+                st = self._config_path.stat()
+            except FileNotFoundError:
+                st = None
+            if st is not None:
+                self.mtime_ns = st.st_mtime_ns
+                stamp = (st.st_mtime_ns, st.st_size)
+                cached = self._CACHE.get(self._config_path)
+                if cached is not None and cached[0] == stamp:
+                    self.settings = copy.deepcopy(cached[1])
+                    self._last_written_digest = cached[2]
+                    return
+                raw = self._config_path.read_bytes()
+                self.settings = _json_loads(raw)
+                self._coerce_types(self.settings)
+                self._last_written_digest = _digest(raw)
+                self._CACHE[self._config_path] = (stamp, copy.deepcopy(self.settings), self._last_written_digest)
             else:
-                self.settings = self.DEFAULTS.copy()
+                self.settings = dict(self._DEFAULTS_PROXY)
                 self._write_to_disk(self.settings)
         except (json.JSONDecodeError, OSError) as exc:
             logging.warning("Failed to load config – using defaults: %s", exc)
-            self.settings = self.DEFAULTS.copy()
+            self.mtime_ns = None
+            self.settings = dict(self._DEFAULTS_PROXY)
             # Attempt to overwrite the corrupted file with defaults.
             try:
                 self._write_to_disk(self.settings)
             except Exception as write_exc:
                 logging.error("Unable to write default config: %s", write_exc)
 
+    @classmethod
+    def _coerce_types(cls, settings: Dict[str, Any]) -> None:
+        """Convert *settings* values in place to the types in :attr:`_SCHEMA`.
+
+        Invalid values are dropped so :meth:`get` falls back to the default.
+        """
+        for key, typ in cls._SCHEMA.items():
+            if key not in settings:
+                continue
+            value = settings[key]
+            if type(value) is typ:
+                continue
+            try:
+                settings[key] = typ(value)
+            except (TypeError, ValueError):
+                logging.warning("Ignoring invalid config value %s=%r", key, value)
+                del settings[key]
+
     def _save(self) -> None:
         """Persist current *settings* to disk."""
         self._write_to_disk(self.settings)
 
     def _write_to_disk(self, data: Dict[str, Any]) -> None:
+        payload = _json_dumps(data)
+        digest = _digest(payload)
+        if digest == self._last_written_digest:
+            return  # identical to what this manager last loaded / wrote
         self._config_path.parent.mkdir(parents=True, exist_ok=True)
-        with self._config_path.open("w", encoding="utf-8") as fh:
-            json.dump(data, fh, indent=4)
+        # Write a sibling temp file and atomically swap it in – a crash mid-write
+        # can no longer leave a truncated config (which _load would replace
+        # with defaults, losing the user's settings).
+        tmp_path = self._config_path.with_name(
+            f"{self._FILENAME}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, self._config_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        self._last_written_digest = digest
+        self._cache_store(data, digest)
+
+    def _cache_store(self, data: Dict[str, Any], digest: bytes) -> None:
+        """Record freshly written *data* in the parse cache under the new file stamp."""
+        try:
+            st = self._config_path.stat()
+        except OSError:
+            self._CACHE.pop(self._config_path, None)
+            self.mtime_ns = None
+            return
+        self.mtime_ns = st.st_mtime_ns
+        self._CACHE[self._config_path] = ((st.st_mtime_ns, st.st_size), copy.deepcopy(data), digest)
 
     # ------------------------------------------------------------------
     # Convenience dunder methods
@@ -26,6 +26,14 @@ except ImportError:  # pragma: no cover – headless CI path
 
 __all__ = ["GPUResourceMonitor"]
 
+# Upper bound for the adaptive polling interval (seconds).
+_MAX_INTERVAL_SEC = 60.0
+
+# NVML is initialised once per process and shut down when the last monitor
+# releases it – ``nvmlInit`` re-walks the driver on every call.
+_NVML_REFCOUNT = 0
+_NVML_LOCK = threading.Lock()
+
 
 class GPUResourceMonitor:
     """Background thread that watches free VRAM and **auto-unloads** the ASR model.
@@ -41,11 +49,26 @@ class GPUResourceMonitor:
         self._notify = notification_manager
         self._log = logging.getLogger(self.__class__.__name__)
 
+        # Config values read once – call :pymeth:`refresh_config` after a reload.
+        self._threshold_mb = 1024
+        self._threshold_bytes = 1024 << 20
+        self._interval = 5.0
+        self._debug_enabled = False
+        self.refresh_config()
+
         self._stop_evt = threading.Event()
+        # Set while the model is resident – the loop sleeps on it otherwise, so
+        # no NVML calls are issued while there is nothing to unload.
+        self._active_evt = threading.Event()
+        self._active_evt.set()
         self._thread: Optional[threading.Thread] = None
+        # Most recent free-VRAM sample (bytes) – *None* until the first successful poll.
+        self._last_free_bytes: Optional[int] = None
 
         # Lazily initialised NVML handle – *None* when unavailable.
         self._handle = None
+        self._get_mem: Any = None
+        self._nvml_acquired = False
         self._init_nvml()
 
     # ------------------------------------------------------------------
@@ -63,8 +86,29 @@ class GPUResourceMonitor:
     def stop(self) -> None:  # noqa: D401 – imperative API
         """Signal the background loop to terminate and **join** the thread."""
         self._stop_evt.set()
+        self._active_evt.set()  # wake a suspended loop so it can observe the stop
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=2)
+        if self._thread is None or not self._thread.is_alive():
+            self._shutdown_nvml()  # never pull NVML from under a still-running loop
+
+    def refresh_config(self) -> None:  # noqa: D401 – imperative API
+        """Re-read threshold and polling interval (e.g. after ``ConfigManager.reload()``).
+
+        Also re-samples whether DEBUG logging is enabled for the polling path.
+        """
+        self._threshold_mb = int(self._cfg.get("vram_unload_threshold_mb", 1024))
+        self._threshold_bytes = self._threshold_mb << 20
+        self._interval = float(self._cfg.get("gpu_monitor_interval_sec", 5))
+        self._debug_enabled = self._log.isEnabledFor(logging.DEBUG)
+
+    def on_model_loaded(self) -> None:  # noqa: D401 – imperative API
+        """Resume polling – called by the orchestrator after a model load."""
+        self._active_evt.set()
+
+    def on_model_unloaded(self) -> None:  # noqa: D401 – imperative API
+        """Suspend polling until :pymeth:`on_model_loaded` is called."""
+        self._active_evt.clear()
 
     def check_once(self) -> None:  # noqa: D401 – imperative API
         """Expose a *single-shot* check for **unit-tests** to trigger manually."""
@@ -77,32 +121,79 @@ class GPUResourceMonitor:
         if not _NVML_AVAILABLE:
             self._log.info("pynvml not available – GPU monitoring disabled")
             return
+        global _NVML_REFCOUNT  # pylint: disable=global-statement
         try:
-            pynvml.nvmlInit()
+            with _NVML_LOCK:
+                if _NVML_REFCOUNT == 0:
+                    pynvml.nvmlInit()
+                _NVML_REFCOUNT += 1
+            self._nvml_acquired = True
             self._handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+            # Prefer the v2 memory query when this pynvml build exposes it.
+            self._get_mem = getattr(pynvml, "nvmlDeviceGetMemoryInfo_v2", pynvml.nvmlDeviceGetMemoryInfo)
         except Exception as exc:  # pragma: no cover – unsupported host
             self._log.info("NVML initialisation failed – GPU monitoring disabled: %s", exc)
-            self._handle = None
+            self._shutdown_nvml()
+
+    def _shutdown_nvml(self) -> None:
+        """Release this monitor's NVML reference; the last one shuts NVML down."""
+        global _NVML_REFCOUNT  # pylint: disable=global-statement
+        self._handle = None
+        if not self._nvml_acquired:
+            return
+        self._nvml_acquired = False
+        with _NVML_LOCK:
+            _NVML_REFCOUNT -= 1
+            if _NVML_REFCOUNT == 0:
+                try:
+                    pynvml.nvmlShutdown()
+                except Exception as exc:  # pragma: no cover – best-effort
+                    self._log.debug("nvmlShutdown failed: %s", exc)
 
     def _loop(self) -> None:  # pragma: no cover – real runtime path
-        interval = float(self._cfg.get("gpu_monitor_interval_sec", 5))
-        while not self._stop_evt.wait(interval):
+        interval = self._interval
+        while not self._stop_evt.is_set():
+            if not self._active_evt.is_set():
+                self._active_evt.wait()
+                interval = self._interval  # freshly loaded model – poll promptly
+                continue
+            if self._stop_evt.wait(interval):
+                break
             self._check_once()
+            interval = self._next_interval(interval, self._interval)
+
+    def _next_interval(self, current: float, base: float) -> float:
+        """Back off while VRAM is plentiful or the model is unloaded.
+
+        The interval doubles (capped at ``_MAX_INTERVAL_SEC``) when nothing can
+        trigger an unload soon, and snaps back to *base* as soon as free VRAM
+        comes within 2× of the threshold.
+        """
+        free = self._last_free_bytes
+        if free is None:
+            return current
+        threshold = self._threshold_bytes
+        if free < 2 * threshold:
+            return base
+        if not self._orch.model_loaded or free > 4 * threshold:
+            return min(current * 2, max(_MAX_INTERVAL_SEC, base))
+        return current
 
     def _check_once(self) -> None:
         if self._handle is None:
             return  # Monitoring disabled
         try:
-            mem = pynvml.nvmlDeviceGetMemoryInfo(self._handle)  # type: ignore[attr-defined]
-            free_mb = mem.free / (1024 * 1024)
+            free = self._get_mem(self._handle).free
         except Exception as exc:  # pragma: no cover – NVML runtime error
-            self._log.debug("nvmlDeviceGetMemoryInfo failed: %s", exc)
+            if self._debug_enabled:
+                self._log.debug("nvmlDeviceGetMemoryInfo failed: %s", exc)
             return
+        self._last_free_bytes = free
 
-        threshold_mb = int(self._cfg.get("vram_unload_threshold_mb", 1024))
-        if self._orch.model_loaded and free_mb < threshold_mb:
+        # Compare in bytes – MiB are only derived for the log line.
+        if free < self._threshold_bytes and self._orch.model_loaded:
             self._log.warning(
-                "Free VRAM %.0f MB below threshold %d MB – triggering auto-unload", free_mb, threshold_mb
+                "Free VRAM %d MB below threshold %d MB – triggering auto-unload", free >> 20, self._threshold_mb
             )
             try:
                 self._orch.auto_unload_model()
@@ -17,6 +17,7 @@ import-time side-effects when the host system blocks the underlying hooks.
 """
 
 import logging
+import os
 from typing import Callable, Optional
 
 __all__ = ["HotkeyManager"]
@@ -52,6 +53,8 @@ class HotkeyManager:  # pylint: disable=too-few-public-methods
 
         self._hotkey_handle: Optional[str | int] = None
         self._current_hotkey: Optional[str] = None
+        # *keyboard* module, bound on the first start() – see module docstring.
+        self._kb = None
 
     # ------------------------------------------------------------------
     # Public helpers
@@ -68,9 +71,12 @@ class HotkeyManager:  # pylint: disable=too-few-public-methods
 
         hotkey = str(self._config.get("hotkey", "ctrl+alt+f"))
         try:
-            import keyboard  # local import keeps startup fast & mock-friendly
+            if self._kb is None:
+                import keyboard  # local import keeps startup fast & mock-friendly
 
-            self._hotkey_handle = keyboard.add_hotkey(
+                self._kb = keyboard
+
+            self._hotkey_handle = self._kb.add_hotkey(
                 hotkey,
                 self._callback,
                 suppress=self._suppress,
@@ -91,9 +97,7 @@ class HotkeyManager:  # pylint: disable=too-few-public-methods
         if self._hotkey_handle is None:
             return
         try:
-            import keyboard  # import here to match *start()* locality
-
-            keyboard.remove_hotkey(self._hotkey_handle)
+            self._kb.remove_hotkey(self._hotkey_handle)
             logging.info("Unregistered global hotkey: %s", self._current_hotkey)
         except Exception as exc:  # pylint: disable=broad-except
             logging.debug("Ignoring error while removing hotkey: %s", exc)
@@ -109,12 +113,14 @@ class HotkeyManager:  # pylint: disable=too-few-public-methods
         one will have been unregistered in that case).
         """
 
-        # Ensure we have the latest config from disk.
-        try:
-            self._config.reload()  # type: ignore[attr-defined]
-        except AttributeError:
-            # Duck-type configs used in tests may not implement *reload()*.
-            pass
+        # Ensure we have the latest config from disk – unless the file is
+        # provably untouched since it was last loaded.
+        if not self._config_unchanged_on_disk():
+            try:
+                self._config.reload()  # type: ignore[attr-defined]
+            except AttributeError:
+                # Duck-type configs used in tests may not implement *reload()*.
+                pass
 
         new_hotkey = str(self._config.get("hotkey", "ctrl+alt+f"))
         if new_hotkey == self._current_hotkey:
@@ -125,6 +131,21 @@ class HotkeyManager:  # pylint: disable=too-few-public-methods
         self.stop()
         return self.start()
 
+    def _config_unchanged_on_disk(self) -> bool:
+        """Return *True* when the config file's mtime matches the loaded copy.
+
+        Configs that do not expose ``config_path`` / ``mtime_ns`` are always
+        treated as changed.
+        """
+        cached = getattr(self._config, "mtime_ns", None)
+        path = getattr(self._config, "config_path", None)
+        if cached is None or path is None:
+            return False
+        try:
+            return os.stat(path).st_mtime_ns == cached
+        except OSError:
+            return False
+
     # ------------------------------------------------------------------
     # Convenience dunders
     # ------------------------------------------------------------------
@@ -14,40 +14,86 @@ Core features (Task 9):
     • fallback path that avoids hard dependency on WinRT
 """
 
-from typing import Callable, Optional
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Callable, List, Optional, Tuple
 import logging
+import queue
+import threading
+import time
 
 # ---------------------------------------------------------------------------
 # Optional Windows-specific dependencies
 # ---------------------------------------------------------------------------
-try:
-    # Importing may succeed on non-Windows but runtime calls could still fail.
-    from windows_toasts import Toast, WindowsToaster  # type: ignore
-
-    _WINRT_IMPORT_SUCCESS = True
-except Exception as exc:  # pragma: no cover – not an error, we fall back
-    logging.getLogger(__name__).info("Windows toast notifications unavailable: %s", exc)
-    Toast = None  # type: ignore[assignment]
-    WindowsToaster = None  # type: ignore[assignment]
-    _WINRT_IMPORT_SUCCESS = False
+# *windows-toasts* pulls in the WinRT projections, so it is imported by
+# :func:`_load_winrt` on the first manager that actually wants toasts rather
+# than at module import.  ``_WINRT_IMPORT_SUCCESS`` is *None* until then.
+Toast = None  # type: ignore[assignment]
+WindowsToaster = None  # type: ignore[assignment]
+_WINRT_IMPORT_SUCCESS: Optional[bool] = None
+
+
+def _load_winrt() -> bool:
+    """Import *windows-toasts* once and report whether it is usable."""
+    global Toast, WindowsToaster, _WINRT_IMPORT_SUCCESS  # pylint: disable=global-statement
+    if _WINRT_IMPORT_SUCCESS is None:
+        try:
+            # Importing may succeed on non-Windows but runtime calls could still fail.
+            from windows_toasts import Toast as _Toast, WindowsToaster as _Toaster  # type: ignore
+        except Exception as exc:  # pragma: no cover – not an error, we fall back
+            logging.getLogger(__name__).info("Windows toast notifications unavailable: %s", exc)
+            _WINRT_IMPORT_SUCCESS = False
+        else:
+            Toast, WindowsToaster = _Toast, _Toaster
+            _WINRT_IMPORT_SUCCESS = True
+    return _WINRT_IMPORT_SUCCESS
 
-import pyperclip  # Copy-to-clipboard backend (cross-platform)
+# *pyperclip* is deliberately not imported here: it probes for clipboard
+# back-ends at import time (possibly spawning xclip/xsel).  Clipboard access
+# goes through :pymod:`InstanceScrubber.clipboard_manager`, which is imported
+# on the first copy only.
 
 __all__ = ["NotificationManager"]
 
 
+class _StubToast:  # pylint: disable=too-few-public-methods
+    """Stand-in for :class:`windows_toasts.Toast` when the package is missing.
+
+    Exercised by the unit-tests, which monkey-patch the manager's toaster
+    with an in-memory fake but provide no global *Toast* symbol.
+    """
+
+    __slots__ = ("text_fields", "on_activated")
+
+    def __init__(self) -> None:
+        self.text_fields: List[str] = []
+        self.on_activated: Callable[[], None] | None = None
+
+
 class NotificationManager:  # pylint: disable=too-few-public-methods
     """Runtime helper responsible for user-visible notifications."""
 
     #: Default title shown for finished transcriptions
     _DEFAULT_TITLE = "Transcription complete"
 
+    #: Title for a burst of transcriptions aggregated into one toast
+    _BATCH_TITLE = "{count} transcriptions complete"
+
+    #: Title shared by model / pause state toasts
+    _STATE_TITLE = "Instant Scribe"
+
+    #: Toast body per model VRAM state – unknown states are shown verbatim
+    _MODEL_STATE_MESSAGES = {
+        "loaded": "Model loaded and ready.",
+        "unloaded": "Model unloaded from VRAM.",
+    }
+
     def __init__(
         self,
         app_name: str = "Instant Scribe",
         *,
         copy_on_click: bool | None = None,
         show_notifications: bool | None = None,
+        flush_window_ms: int = 500,
     ) -> None:
         """Create a new *NotificationManager*.
 
@@ -63,6 +109,11 @@ class NotificationManager:  # pylint: disable=too-few-public-methods
             Master on/off switch.  When *False*, no attempt is made to display
             UI toasts even if **windows-toasts** is installed.  *None* defers
             the decision to run-time configuration.
+        flush_window_ms
+            Transcriptions finishing within this many milliseconds of the
+            previous toast are held and shown together as one toast when the
+            window closes.  An isolated transcription is shown immediately.
+            ``0`` disables aggregation.
         """
 
         self._log = logging.getLogger(self.__class__.__name__)
@@ -72,7 +123,7 @@ class NotificationManager:  # pylint: disable=too-few-public-methods
 
         # Attempt to instantiate the WinRT bridge if available.
         self._toaster: Optional["WindowsToaster"]
-        if _WINRT_IMPORT_SUCCESS and show_notifications is not False:
+        if show_notifications is not False and _load_winrt():
             try:
                 # WindowsToaster may still raise if underlying WinRT APIs are
                 # inaccessible (e.g., running under Wine or Linux CI).
@@ -83,6 +134,28 @@ class NotificationManager:  # pylint: disable=too-few-public-methods
         else:
             self._toaster = None
 
+        # Model / pause state toasts carry no click handler, so one instance is
+        # mutated and re-shown instead of allocating a WinRT Toast per call.
+        # Cleared for good if the backend ever rejects a re-show.
+        self._state_toast = None
+        self._reuse_state_toast = True
+
+        # Clipboard copy + toast for finished transcriptions run on a daemon
+        # thread (started on first use) so the caller never blocks on the
+        # clipboard owner or a WinRT round-trip.
+        self._ui_queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._ui_thread: Optional[threading.Thread] = None
+        self._ui_thread_lock = threading.Lock()
+        self._flush_window = max(0, flush_window_ms) / 1000.0
+
+        # Clipboard writes go to their own single worker (started on first
+        # use, shut down by close()) so neither the UI thread nor a toast
+        # click callback blocks on the clipboard owner.  Only the newest
+        # pending payload is written (single slot).
+        self._clip_pool: Optional[ThreadPoolExecutor] = None
+        self._clip_lock = threading.Lock()
+        self._clip_pending: Optional[str] = None
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -91,6 +164,10 @@ class NotificationManager:  # pylint: disable=too-few-public-methods
 
         When the user clicks the toast (provided the platform supports it),
         the *text* is re-copied to the clipboard for convenience.
+
+        The work is queued to a background thread and this method returns
+        immediately; call :pymeth:`flush` to wait for delivery.  Bursts are
+        aggregated into a single toast (see *flush_window_ms*).
         """
 
         # Decide clipboard behaviour – explicit param takes precedence over ctor default
@@ -99,10 +176,82 @@ class NotificationManager:  # pylint: disable=too-few-public-methods
             if copy_to_clipboard is not None
             else (self._copy_on_click_default if self._copy_on_click_default is not None else True)
         )
+        self._ensure_ui_thread()
+        self._ui_queue.put((text, copy_enabled))
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until every queued transcription has been delivered.
+
+        Transcriptions held for aggregation are delivered right away, and
+        the resulting clipboard write has completed on return.
+        Returns *False* if *timeout* (seconds) elapsed first.
+        """
+        if self._ui_thread is None:
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        done = threading.Event()
+        self._ui_queue.put(done)
+        if not done.wait(timeout):
+            return False
+        # The clipboard worker is FIFO – a no-op task completes after it.
+        with self._clip_lock:
+            pool = self._clip_pool
+            if pool is None:
+                return True
+            marker = pool.submit(lambda: None)
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        try:
+            marker.result(remaining)
+        except FutureTimeoutError:  # clipboard owner still busy
+            return False
+        return True
+
+    def close(self, timeout: float | None = None) -> bool:
+        """Deliver pending transcriptions, then stop the clipboard worker.
+
+        Returns the result of :pymeth:`flush`.  The worker is started again
+        if the manager is used after closing.
+        """
+        flushed = self.flush(timeout)
+        with self._clip_lock:
+            pool, self._clip_pool = self._clip_pool, None
+        if pool is not None:
+            # Not waiting on a wedged clipboard owner if flush() timed out.
+            pool.shutdown(wait=flushed)
+        return flushed
+
+    def _deliver_batch(self, batch: List[Tuple[str, bool]]) -> None:
+        """Deliver queued ``(text, copy_enabled)`` items as one toast."""
+        if len(batch) == 1:
+            self._deliver_transcription(*batch[0])
+            return
+        copied = [text for text, copy_enabled in batch if copy_enabled]
+        self._deliver_transcription(
+            " ".join(text for text, _ in batch),
+            bool(copied),
+            title=self._BATCH_TITLE.format(count=len(batch)),
+            clipboard_text=" ".join(copied),
+        )
+
+    def _deliver_transcription(
+        self,
+        text: str,
+        copy_enabled: bool,
+        *,
+        title: str | None = None,
+        clipboard_text: str | None = None,
+    ) -> None:
+        """Copy *text* and show its toast – runs on the UI thread.
+
+        *clipboard_text* overrides what is copied (defaults to *text*).
+        """
+
+        if clipboard_text is None:
+            clipboard_text = text
 
         # Always attempt to copy immediately – even if notifications are disabled.
         if copy_enabled:
-            self._copy_to_clipboard(text)
+            self._copy_to_clipboard(clipboard_text)
 
         if not self._toaster:
             # Headless / unsupported environment – log and bail out.
@@ -110,23 +259,11 @@ class NotificationManager:  # pylint: disable=too-few-public-methods
             return
 
         # --- Prepare the toast ------------------------------------------------
-        if Toast is None:
-            # Fallback: create a minimal stub compatible with the attributes
-            # accessed below.  This path is exercised by the unit-tests which
-            # monkey-patch *self._toaster* with a fake in-memory implementation
-            # but intentionally skip providing a global *Toast* symbol.
-            class _StubToast:  # pylint: disable=too-few-public-methods
-                def __init__(self):
-                    self.text_fields = []
-                    self.on_activated: Callable[[], None] | None = None  # noqa: D401
-
-            toast = _StubToast()  # type: ignore[assignment]
-        else:
-            toast = Toast()  # type: ignore[call-arg]
-        toast.text_fields = [self._DEFAULT_TITLE, text]
+        toast = Toast() if Toast is not None else _StubToast()  # type: ignore[call-arg]
+        toast.text_fields = [title or self._DEFAULT_TITLE, text]
 
         if copy_enabled:
-            toast.on_activated = lambda: self._copy_to_clipboard(text)
+            toast.on_activated = lambda: self._copy_to_clipboard(clipboard_text)
 
         # --- Display ----------------------------------------------------------
         try:
@@ -150,32 +287,13 @@ class NotificationManager:  # pylint: disable=too-few-public-methods
             passed through verbatim.
         """
 
-        title = "Instant Scribe"
-        message = (
-            "Model loaded and ready." if state == "loaded" else "Model unloaded from VRAM."
-            if state == "unloaded" else str(state)
-        )
+        message = self._MODEL_STATE_MESSAGES.get(state) or str(state)
 
         if not self._toaster:
             self._log.debug("Toast suppressed (not supported). Body: %s", message)
             return
 
-        # Re-use the same fallback factory used in *show_transcription* to
-        # keep behaviour consistent and test-friendly.
-        if Toast is None:
-            class _StubToast:  # pylint: disable=too-few-public-methods
-                def __init__(self):
-                    self.text_fields = []
-
-            toast = _StubToast()  # type: ignore[assignment]
-        else:
-            toast = Toast()  # type: ignore[call-arg]
-        toast.text_fields = [title, message]
-
-        try:
-            self._toaster.show_toast(toast)  # type: ignore[arg-type]
-        except Exception as exc:  # pragma: no cover – runtime path
-            self._log.warning("Failed to display toast: %s", exc)
+        self._show_state_toast(message)
 
     # ------------------------------------------------------------------
     # Task 25 – Pause / Resume notifications
@@ -191,7 +309,6 @@ class NotificationManager:  # pylint: disable=too-few-public-methods
             *False* to indicate recording has resumed.
         """
 
-        title = "Instant Scribe"
         message = "Recording paused." if paused else "Recording resumed."
 
         if not self._toaster:
@@ -199,22 +316,7 @@ class NotificationManager:  # pylint: disable=too-few-public-methods
             self._log.debug("Toast suppressed (not supported). Body: %s", message)
             return
 
-        # Reuse stub-friendly logic from other helpers to avoid duplication.
-        if Toast is None:
-            class _StubToast:  # pylint: disable=too-few-public-methods
-                def __init__(self):
-                    self.text_fields = []
-
-            toast = _StubToast()  # type: ignore[assignment]
-        else:
-            toast = Toast()  # type: ignore[call-arg]
-
-        toast.text_fields = [title, message]
-
-        try:
-            self._toaster.show_toast(toast)  # type: ignore[arg-type]
-        except Exception as exc:  # pragma: no cover – runtime path
-            self._log.warning("Failed to display toast: %s", exc)
+        self._show_state_toast(message)
 
     # ------------------------------------------------------------------
     # Task 12 – crash recovery prompt
@@ -236,16 +338,7 @@ class NotificationManager:  # pylint: disable=too-few-public-methods
             self._log.warning(message)
             return
 
-        # Re-use the same fallback factory used in *show_transcription* to
-        # keep behaviour consistent and test-friendly.
-        if Toast is None:
-            class _StubToast:  # pylint: disable=too-few-public-methods
-                def __init__(self):
-                    self.text_fields = []
-
-            toast = _StubToast()  # type: ignore[assignment]
-        else:
-            toast = Toast()  # type: ignore[call-arg]
+        toast = Toast() if Toast is not None else _StubToast()  # type: ignore[call-arg]
         toast.text_fields = [title, message]
 
         try:
@@ -256,8 +349,80 @@ class NotificationManager:  # pylint: disable=too-few-public-methods
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    def _ensure_ui_thread(self) -> None:
+        if self._ui_thread is not None:
+            return
+        with self._ui_thread_lock:
+            if self._ui_thread is None:
+                thread = threading.Thread(target=self._ui_loop, name="NotificationUI", daemon=True)
+                thread.start()
+                self._ui_thread = thread
+
+    def _ui_loop(self) -> None:
+        pending: List[Tuple[str, bool]] = []
+        last_delivery = float("-inf")
+        while True:
+            timeout = None
+            if pending:
+                timeout = max(0.0, last_delivery + self._flush_window - time.monotonic())
+            try:
+                item = self._ui_queue.get(timeout=timeout)
+            except queue.Empty:  # aggregation window closed
+                item = None
+            if item is not None and not isinstance(item, threading.Event):
+                pending.append(item)
+                if time.monotonic() - last_delivery < self._flush_window:
+                    continue  # inside the window – hold for aggregation
+            if pending:
+                batch, pending = pending, []
+                try:
+                    self._deliver_batch(batch)
+                except Exception as exc:  # pragma: no cover – keep the thread alive
+                    self._log.warning("Transcription notification failed: %s", exc)
+                last_delivery = time.monotonic()
+            if isinstance(item, threading.Event):  # flush() marker
+                item.set()
+
+    def _show_state_toast(self, message: str) -> None:
+        """Show *message* on the shared state toast (see ``__init__``)."""
+        toast = self._state_toast
+        if toast is None:
+            toast = Toast() if Toast is not None else _StubToast()  # type: ignore[call-arg]
+            toast.text_fields = [self._STATE_TITLE, message]
+            if self._reuse_state_toast:
+                self._state_toast = toast
+        else:
+            toast.text_fields[1] = message  # update the body in place
+
+        try:
+            self._toaster.show_toast(toast)  # type: ignore[union-attr]
+        except Exception as exc:  # pragma: no cover – runtime path
+            if self._state_toast is not None:
+                # The backend may refuse to re-show an instance – allocate per call from now on.
+                self._state_toast = None
+                self._reuse_state_toast = False
+            self._log.warning("Failed to display toast: %s", exc)
+
+    def _copy_to_clipboard(self, payload: str) -> None:
+        """Queue *payload* for the clipboard worker (latest payload wins)."""
+        with self._clip_lock:
+            idle = self._clip_pending is None
+            self._clip_pending = payload
+            if idle:
+                # Otherwise a queued drain has not run yet and will pick up *payload*.
+                if self._clip_pool is None:
+                    self._clip_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="NotificationClipboard")
+                self._clip_pool.submit(self._drain_clipboard)
+
+    def _drain_clipboard(self) -> None:
+        """Write the newest pending payload – runs on the clipboard worker."""
+        with self._clip_lock:
+            payload, self._clip_pending = self._clip_pending, None
+        if payload is not None:
+            self._write_clipboard(payload)
+
     @staticmethod
-    def _copy_to_clipboard(payload: str) -> None:
+    def _write_clipboard(payload: str) -> None:
         """Copy *payload* to the system clipboard – with error suppression."""
         try:
             # Delegate the heavy lifting to the centralised helper (Task 23)
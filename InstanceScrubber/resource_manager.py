@@ -22,14 +22,30 @@ from __future__ import annotations
 
 import sys
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Union, AnyStr
+from typing import Optional, Union, AnyStr
 
 __all__ = ["resource_path"]
 
 _PathLike = Union[str, Path, 'os.PathLike[AnyStr]']  # noqa: UP035 – Python < 3.12 compatibility
 
 
+@lru_cache(maxsize=4)
+def _compute_base_path(meipass: Optional[str]) -> Path:
+    """Return the resource root for the given bundle directory (if frozen).
+
+    Cached because the source-checkout branch calls ``Path.resolve()``, which
+    costs a filesystem round-trip per path component.  Tests that simulate a
+    frozen build get a fresh entry since *meipass* is the cache key.
+    """
+    if meipass is not None:
+        return Path(meipass)
+
+    # Development / unit-test scenario – repo root = <package_parent>
+    return Path(__file__).resolve().parent.parent
+
+
 def _determine_base_path() -> Path:
     """Return the directory that forms the root for bundled data files.
 
@@ -39,15 +55,14 @@ def _determine_base_path() -> Path:
       take the parent directory of this *resource_manager.py* file which
       corresponds to the repository root (`.../Instant Scribe`).
     """
+    meipass: Optional[str] = None
     if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
         # noinspection PyProtectedMember
-        return Path(sys._MEIPASS)  # type: ignore[arg-type] – provided by bootloader
-
-    # Development / unit-test scenario – repo root = <package_parent>
-    return Path(__file__).resolve().parent.parent
+        meipass = os.fspath(sys._MEIPASS)  # type: ignore[attr-defined] – provided by bootloader
+    return _compute_base_path(meipass)
 
 
-def resource_path(relative_path: _PathLike) -> Path:
+def resource_path(relative_path: _PathLike, *, strict: bool = False) -> Path:
     """Resolve *relative_path* against the application bundle root.
 
     The returned :class:`~pathlib.Path` is **always absolute** and therefore
@@ -60,6 +75,11 @@ def resource_path(relative_path: _PathLike) -> Path:
         Path to the desired resource **relative** to the bundle root – for
         example ``"assets/icon.ico"``.  An empty string returns the root
         directory itself.
+    strict:
+        When *True* the result is additionally passed through
+        :meth:`Path.resolve` so symlinks are followed.  The default only
+        normalises ``.``/``..`` segments lexically – the base directory is
+        already absolute, so no filesystem round-trip is needed.
 
     Examples
     --------
@@ -70,4 +90,5 @@ def resource_path(relative_path: _PathLike) -> Path:
     """
 
     base_path = _determine_base_path()
-    return (base_path / Path(relative_path)).resolve()
\ No newline at end of file
+    joined = os.path.normpath(os.path.join(base_path, os.fspath(relative_path)))
+    return Path(joined).resolve() if strict else Path(joined)
\ No newline at end of file
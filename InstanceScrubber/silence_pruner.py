@@ -9,24 +9,286 @@ This module fulfils *DEV_TASKS.md – Task 22* requirements:
      ASR model.  The goal is to avoid wasting GPU cycles on dead air when the
      user pauses a recording for a long time.
 
-The implementation is pure-Python + NumPy only so that it remains lightweight
-and testable in any CI environment (no external deps).
+The implementation is pure-Python + NumPy so that it remains lightweight and
+testable in any CI environment.  When *numba* is installed the run-length scan
+is JIT-compiled into a single pass over the buffer instead.
 """
 
-from typing import List, Tuple
+import threading
+from functools import lru_cache
+from typing import Final, List, Optional, Tuple, Union
 
 import numpy as np
 
+try:  # Optional – single-pass JIT kernel (falls back to the NumPy scan)
+    from numba import njit  # type: ignore
+except ImportError:  # pragma: no cover – optional dependency
+    njit = None  # type: ignore[assignment]
+
 __all__ = [
+    "SilencePruner",
     "prune_long_silences",
     "prune_pcm_bytes",
+    "prune_pcm_bytes_into",
 ]
 
 
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+def _find_long_silences(
+    audio: np.ndarray, threshold_samples: int, silence_level: int
+) -> np.ndarray:
+    """Return an ``(n, 2)`` int64 array of silent runs ≥ *threshold_samples*.
+
+    Walks *audio* once, tracking where the current silent run started, so
+    abs/compare/run-length all happen in the same pass.  Written in the
+    Numba-compatible subset of Python – see ``_find_long_silences_jit``.
+    """
+    n = audio.shape[0]
+    # Runs are disjoint and each is ≥ threshold_samples long.
+    runs = np.empty((n // threshold_samples, 2), dtype=np.int64)
+    count = 0
+    run_start = -1
+    for i in range(n):
+        sample = audio[i]
+        if -silence_level <= sample and sample <= silence_level:
+            if run_start < 0:
+                run_start = i
+        elif run_start >= 0:
+            if i - run_start >= threshold_samples:
+                runs[count, 0] = run_start
+                runs[count, 1] = i
+                count += 1
+            run_start = -1
+    if run_start >= 0 and n - run_start >= threshold_samples:
+        runs[count, 0] = run_start
+        runs[count, 1] = n
+        count += 1
+    return runs[:count]
+
+
+_find_long_silences_jit = None
+if njit is not None:
+    try:
+        _find_long_silences_jit = njit(cache=True, boundscheck=False)(
+            _find_long_silences
+        )
+    except RuntimeError:  # pragma: no cover – no writable cache dir (frozen build)
+        _find_long_silences_jit = njit(boundscheck=False)(_find_long_silences)
+
+
+def _find_long_silences_numpy(
+    audio: np.ndarray,
+    threshold_samples: int,
+    silence_level: int,
+    scratch: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+) -> List[Tuple[int, int]]:
+    """Vectorised equivalent of :func:`_find_long_silences` (no JIT needed).
+
+    *scratch* optionally supplies ``(uint16, bool)`` buffers of at least
+    ``audio.size`` elements that the mask is computed into.
+    """
+
+    n = audio.size
+    # Fast boolean mask of *silent* samples.  For int16 input, biasing the
+    # unsigned view by *silence_level* maps [-level, level] onto [0, 2*level],
+    # so one unsigned compare replaces the two-sided range check.  Unlike
+    # ``np.abs`` this treats -32768 (whose abs overflows) as loud.
+    if audio.dtype == np.int16 and 0 <= silence_level < 0x8000:
+        biased_out = mask_out = None
+        if scratch is not None:
+            biased_out, mask_out = scratch[0][:n], scratch[1][:n]
+        biased = np.add(audio.view(np.uint16), np.uint16(silence_level), out=biased_out)
+        silence_mask = np.less_equal(biased, np.uint16(2 * silence_level), out=mask_out)
+    else:
+        silence_mask = np.less_equal(
+            audio, silence_level, out=None if scratch is None else scratch[1][:n]
+        )
+        silence_mask &= audio >= -silence_level
+    if not silence_mask.any():
+        return []  # early exit – no silence at all
+
+    # Run boundaries are the indices where the mask flips (compared as bools –
+    # no int8 promotion / np.diff).  Consecutive boundaries delimit runs that
+    # alternate between silent and voiced, starting with ``silence_mask[0]``.
+    # The uint16 scratch is free once the mask exists, so with *scratch* the
+    # transition mask is written into it (viewed as bool) – no temporary.
+    transitions = None if scratch is None else scratch[0].view(np.bool_)[: n - 1]
+    flips = np.flatnonzero(
+        np.not_equal(silence_mask[1:], silence_mask[:-1], out=transitions)
+    )
+    bounds = np.concatenate(([0], flips + 1, [audio.size]))
+    first = 0 if silence_mask[0] else 1
+    run_starts = bounds[first:-1:2]
+    run_ends = bounds[first + 1::2]
+
+    # Build list of (start, end) pairs exceeding the threshold.
+    long_runs = (run_ends - run_starts) >= threshold_samples
+    return list(zip(run_starts[long_runs].tolist(), run_ends[long_runs].tolist()))
+
+
 # ---------------------------------------------------------------------------
 # Public helpers
 # ---------------------------------------------------------------------------
 
+class SilencePruner:
+    """Reusable :func:`prune_long_silences` for one format / threshold.
+
+    Streaming callers prune many buffers with identical settings.  An
+    instance computes ``threshold_samples`` once and keeps the NumPy scan's
+    scratch buffers between calls, growing them only for a larger buffer.
+    Buffers above :pyattr:`_MAX_SCRATCH_SAMPLES` use temporaries instead so
+    one long recording does not pin its mask in memory, and no scratch is
+    allocated at all while the numba kernel is in use.  Safe to share
+    between threads.
+
+    Before the per-sample scan, fixed-size blocks are checked with min/max
+    reductions (see :meth:`_candidate_regions`) so clearly voiced audio is
+    never run-length scanned at all.
+    """
+
+    #: Largest buffer (in samples) whose scratch space is kept – 3 min @ 16 kHz (~9 MB)
+    _MAX_SCRATCH_SAMPLES: Final[int] = 16_000 * 180
+
+    #: Below this block size the prefilter's per-block overhead is not worth it
+    _MIN_PREFILTER_BLOCK: Final[int] = 4096
+
+    def __init__(
+        self,
+        *,
+        sample_rate: int = 16_000,
+        threshold_ms: int = 120_000,
+        silence_level: int = 100,
+    ) -> None:
+        self._threshold_samples = int(sample_rate * threshold_ms / 1000)
+        self._silence_level = int(silence_level)
+        self._biased = np.empty(0, dtype=np.uint16)
+        self._mask = np.empty(0, dtype=np.bool_)
+        self._lock = threading.Lock()
+
+    def prune(self, audio: np.ndarray) -> np.ndarray:
+        """Return *audio* with long silence segments removed.
+
+        See :func:`prune_long_silences` for the semantics.
+        """
+
+        remove_ranges = self._remove_ranges(audio)
+        if not remove_ranges:
+            return audio  # Nothing long enough to prune (or nothing to do).
+
+        removed = sum(end - start for start, end in remove_ranges)
+        out = np.empty(audio.size - removed, dtype=audio.dtype)
+        self._stitch(audio, remove_ranges, out)
+        # Corner-case: audio that is *all* silence yields a zero-length array.
+        return out
+
+    def prune_into(self, audio: np.ndarray, out: np.ndarray) -> int:
+        """Write the pruned *audio* into *out* and return the sample count.
+
+        *out* must have room for ``audio.size`` samples (the result is never
+        longer than the input); nothing beyond the returned count is touched.
+        """
+        if out.size < audio.size:
+            raise ValueError(f"output buffer holds {out.size} samples, need {audio.size}")
+        remove_ranges = self._remove_ranges(audio)
+        return self._stitch(audio, remove_ranges, out)
+
+    def _remove_ranges(self, audio: np.ndarray) -> List[Tuple[int, int]]:
+        """Return the sorted ``(start, end)`` silent runs to cut from *audio*."""
+        remove_ranges: List[Tuple[int, int]] = []
+        if audio.size == 0 or self._threshold_samples <= 0:
+            return remove_ranges
+        for lo, hi in self._candidate_regions(audio):
+            remove_ranges.extend(
+                (lo + start, lo + end) for start, end in self._find_runs(audio[lo:hi])
+            )
+        return remove_ranges
+
+    @staticmethod
+    def _stitch(
+        audio: np.ndarray, remove_ranges: List[Tuple[int, int]], out: np.ndarray
+    ) -> int:
+        """Copy the *keep* segments of *audio* back to back into *out*.
+
+        No list of slice views – one write per kept sample.  Returns the
+        number of samples written.
+        """
+        offset = 0
+        last_idx = 0
+        for start, end in remove_ranges:
+            keep = start - last_idx
+            out[offset : offset + keep] = audio[last_idx:start]
+            offset += keep
+            last_idx = end
+        tail = audio.size - last_idx
+        out[offset : offset + tail] = audio[last_idx:]
+        return offset + tail
+
+    def _candidate_regions(self, audio: np.ndarray) -> List[Tuple[int, int]]:
+        """Return the ``(lo, hi)`` slices of *audio* that may hold a long run.
+
+        With blocks of ``(threshold_samples + 1) // 2`` samples, every silent
+        run of at least ``threshold_samples`` fully covers one aligned block.
+        Such runs therefore live in a group of fully silent blocks plus the
+        block either side (where a loud sample ends the run), and nowhere
+        else.  A block is fully silent when its max/min lie within
+        ``±silence_level`` – two reductions, no per-sample temporaries.
+        """
+        n = audio.size
+        block = (self._threshold_samples + 1) // 2
+        n_blocks = n // block
+        if block < self._MIN_PREFILTER_BLOCK or n_blocks < 3 or audio.ndim != 1:
+            return [(0, n)]
+
+        blocks = audio[: n_blocks * block].reshape(n_blocks, block)
+        silent = blocks.max(axis=1) <= self._silence_level
+        silent &= blocks.min(axis=1) >= -self._silence_level
+        idx = np.flatnonzero(silent)
+        if idx.size == 0:
+            return []  # no fully silent block – clearly voiced audio
+
+        # Groups whose padded regions would touch are merged (gap ≤ 2 blocks).
+        splits = np.flatnonzero(np.diff(idx) > 2)
+        firsts = idx[np.concatenate(([0], splits + 1))].tolist()
+        lasts = idx[np.concatenate((splits, [idx.size - 1]))].tolist()
+        return [
+            (max(0, (first - 1) * block), min(n, (last + 2) * block))
+            for first, last in zip(firsts, lasts)
+        ]
+
+    def _find_runs(self, audio: np.ndarray) -> List[Tuple[int, int]]:
+        """Return the silent runs ≥ ``threshold_samples`` within *audio*."""
+        if _find_long_silences_jit is not None:
+            runs = _find_long_silences_jit(audio, self._threshold_samples, self._silence_level)
+            return [(start, end) for start, end in runs.tolist()]
+        if audio.size > self._MAX_SCRATCH_SAMPLES:
+            return _find_long_silences_numpy(audio, self._threshold_samples, self._silence_level)
+        with self._lock:
+            if self._mask.size < audio.size:
+                self._biased = np.empty(audio.size, dtype=np.uint16)
+                self._mask = np.empty(audio.size, dtype=np.bool_)
+            return _find_long_silences_numpy(
+                audio,
+                self._threshold_samples,
+                self._silence_level,
+                scratch=(self._biased, self._mask),
+            )
+
+
+@lru_cache(maxsize=1)
+def _shared_pruner(sample_rate: int, threshold_ms: int, silence_level: int) -> SilencePruner:
+    """Return the process-wide :class:`SilencePruner` for these settings.
+
+    Only the most recent settings are kept: the app prunes with a single
+    configuration, and a replaced pruner's scratch buffers are freed with it.
+    """
+    return SilencePruner(
+        sample_rate=sample_rate, threshold_ms=threshold_ms, silence_level=silence_level
+    )
+
+
 def prune_long_silences(
     audio: np.ndarray,
     *,
@@ -54,56 +316,11 @@ def prune_long_silences(
       recordings without noticeable CPU overhead.
     • When *no* runs exceed *threshold_ms* the original array is returned
       *unmodified* to avoid an unnecessary copy.
+    • Delegates to a cached :class:`SilencePruner` per setting combination, so
+      repeated calls reuse its scratch buffers.
     """
 
-    if audio.size == 0:
-        return audio  # Nothing to do.
-
-    threshold_samples = int(sample_rate * threshold_ms / 1000)
-    if threshold_samples <= 0:
-        return audio
-
-    # Fast boolean mask of *silent* samples.
-    silence_mask = np.abs(audio) <= silence_level
-    if not silence_mask.any():
-        return audio  # early exit – no silence at all
-
-    # Find run-lengths of consecutive *True* values in the mask.
-    # Adapted from NumPy run-length-encoding idiom.
-    diff = np.diff(silence_mask.astype(np.int8))
-    run_starts = np.where(diff == 1)[0] + 1  # transition from 0→1 marks start
-    run_ends = np.where(diff == -1)[0] + 1   # transition from 1→0 marks end
-
-    # Handle edge cases where the array starts or ends with silence.
-    if silence_mask[0]:
-        run_starts = np.r_[0, run_starts]
-    if silence_mask[-1]:
-        run_ends = np.r_[run_ends, audio.size]
-
-    # Build list of (start, end) pairs exceeding the threshold.
-    remove_ranges: List[Tuple[int, int]] = []
-    for start, end in zip(run_starts, run_ends):
-        if end - start >= threshold_samples:
-            remove_ranges.append((start, end))
-
-    if not remove_ranges:
-        return audio  # Nothing long enough to prune.
-
-    # Stitch together the *keep* segments.
-    keep_chunks: List[np.ndarray] = []
-    last_idx = 0
-    for start, end in remove_ranges:
-        if last_idx < start:
-            keep_chunks.append(audio[last_idx:start])
-        last_idx = end
-    if last_idx < audio.size:
-        keep_chunks.append(audio[last_idx:])
-
-    if not keep_chunks:
-        # Corner-case: audio is *all* silence – return a zero-length array.
-        return np.empty(0, dtype=np.int16)
-
-    return np.concatenate(keep_chunks)
+    return _shared_pruner(sample_rate, threshold_ms, silence_level).prune(audio)
 
 
 def prune_pcm_bytes(
@@ -113,7 +330,11 @@ def prune_pcm_bytes(
     threshold_ms: int = 120_000,
     silence_level: int = 100,
 ) -> bytes:
-    """Wrapper around :func:`prune_long_silences` operating on raw PCM bytes."""
+    """Wrapper around :func:`prune_long_silences` operating on raw PCM bytes.
+
+    When nothing is pruned *audio_bytes* itself is returned – no copy.  Use
+    :func:`prune_pcm_bytes_into` to write the result into a reusable buffer.
+    """
 
     # Ensure even length so it can be viewed as int16 – otherwise bail out.
     if len(audio_bytes) % 2:
@@ -131,4 +352,36 @@ def prune_pcm_bytes(
         threshold_ms=threshold_ms,
         silence_level=silence_level,
     )
-    return pruned.tobytes() 
\ No newline at end of file
+    if pruned is audio_np:
+        return audio_bytes
+    return pruned.tobytes()
+
+
+def prune_pcm_bytes_into(
+    audio_bytes: bytes,
+    out: Union[bytearray, memoryview],
+    *,
+    sample_rate: int = 16_000,
+    threshold_ms: int = 120_000,
+    silence_level: int = 100,
+) -> int:
+    """Prune raw PCM *audio_bytes* straight into the writable buffer *out*.
+
+    Returns the number of bytes written to the start of *out*, which must be
+    at least ``len(audio_bytes)`` long.  Unlike :func:`prune_pcm_bytes` no
+    intermediate array or ``bytes`` object is allocated, so callers can
+    reuse one buffer and hand ``memoryview(out)[:n]`` to ``file.write``.
+    Odd-length input is copied through unmodified.
+    """
+
+    size = len(audio_bytes)
+    if len(out) < size:
+        raise ValueError(f"output buffer holds {len(out)} bytes, need {size}")
+    if size % 2:
+        out[:size] = audio_bytes
+        return size
+
+    audio_np = np.frombuffer(audio_bytes, dtype=np.int16)
+    dest = np.frombuffer(out, dtype=np.int16, count=size // 2)
+    pruner = _shared_pruner(sample_rate, threshold_ms, silence_level)
+    return pruner.prune_into(audio_np, dest) * 2
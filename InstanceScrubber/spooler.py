@@ -1,34 +1,90 @@
 """Persistent audio spooler – fulfils DEV_TASKS.md Task 12 (Never Lose a Word).
 
-The *AudioSpooler* writes sequentially numbered PCM chunks to a temporary
-folder under the user's *APPDATA* directory (or a cross-platform fallback).
-Its primary goal is to guarantee that no captured audio is lost in the event
-of an unexpected application crash.  Upon clean shutdown the temporary files
-are removed.  If the application starts and finds leftover chunk files it can
-prompt the user to recover the recording.
+The *AudioSpooler* appends PCM chunks to a single session file in a temporary
+folder under the user's *APPDATA* directory (or a cross-platform fallback),
+alongside a small index of ``(offset, length)`` records marking the chunk
+boundaries.  Disk writes happen on a background thread so a slow disk never
+stalls audio capture, and small chunks are coalesced in RAM into one write
+per batch.  Its primary goal is to guarantee that no captured audio is lost
+in the event of an unexpected application crash.  Upon clean shutdown the
+temporary files are removed.  If the application starts and finds a leftover
+session (or legacy numbered chunk files) it can prompt the user to recover the
+recording.
 """
 
 from __future__ import annotations
 
+import logging
 import os
+import queue
 import shutil
+import struct
 import tempfile
+import threading
+import time
 from pathlib import Path
-from typing import Final
+from typing import BinaryIO, Final, List, Optional, Tuple, Union
 
 __all__ = [
     "AudioSpooler",
 ]
 
+# ``os.posix_fadvise`` only exists on POSIX platforms that implement it.
+_FADV_DONTNEED: Optional[int] = (
+    getattr(os, "POSIX_FADV_DONTNEED", None) if hasattr(os, "posix_fadvise") else None
+)
+
+try:  # Windows-only – CopyFile2 is exposed from Python 3.12 on
+    import _winapi  # type: ignore
+except ImportError:  # pragma: no cover – POSIX
+    _winapi = None  # type: ignore[assignment]
+_COPY_FILE2 = getattr(_winapi, "CopyFile2", None)
+
+
+def _copy_whole_file(src: Path, dst: Path) -> None:
+    """Copy *src* → *dst*, in-kernel via ``CopyFile2`` on Windows when available.
+
+    Elsewhere – and on Windows Pythons older than 3.12, where ``shutil.copyfile``
+    is a plain userspace read/write loop – :func:`shutil.copyfile` is used
+    (``sendfile`` on Linux, ``fcopyfile`` on macOS).
+    """
+    if _COPY_FILE2 is not None:
+        try:
+            _COPY_FILE2(os.fspath(src), os.fspath(dst), 0)
+            return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+
 
 class AudioSpooler:  # pylint: disable=too-few-public-methods
-    """Light-weight helper that appends numbered ``.pcm`` files to disk.
+    """Light-weight helper that appends audio chunks to an on-disk spool.
 
     The implementation purposefully avoids any external dependencies so that
     unit-tests can exercise the full code-path in *any* CI environment.
     """
 
+    _SESSION_FILE: Final[str] = "session.pcm"
+    _INDEX_FILE: Final[str] = "index.bin"
+    # One record per chunk: byte offset into the session file + chunk length.
+    _INDEX_RECORD: Final[struct.Struct] = struct.Struct("<QI")
+    # Zero padding the batch index buffer is grown by before pack_into().
+    _INDEX_BLANK: Final[bytes] = bytes(_INDEX_RECORD.size)
+    # Legacy layout (one file per chunk) – still recognised for recovery.
     _CHUNK_TEMPLATE: Final[str] = "chunk_{idx:04d}.pcm"
+    # Chunks queued for the writer thread before write_chunk() blocks.
+    _QUEUE_MAXSIZE: Final[int] = 256
+    # The writer coalesces chunks in RAM and flushes once a batch reaches
+    # this size or has been pending this long (seconds) – whichever is first.
+    _MAX_BATCH_BYTES: Final[int] = 1 << 20
+    _MAX_BATCH_DELAY: Final[float] = 0.25
+    # A batch that failed to write is kept and retried until it grows past
+    # this size (~35 min of 16 kHz mono audio); only then is it dropped.
+    _MAX_RETAINED_BYTES: Final[int] = 64 << 20
+    # Attempts at writing the final batch when the session closes.
+    _CLOSE_ATTEMPTS: Final[int] = 3
+    # How often blocked producers re-check that the writer thread is alive.
+    _LIVENESS_POLL: Final[float] = 0.5
     _APP_NAME: Final[str] = "Instant Scribe"
 
     # ------------------------------------------------------------------
@@ -42,14 +98,31 @@ class AudioSpooler:  # pylint: disable=too-few-public-methods
         chunk_interval_sec
             Desired *chunk interval* in **seconds**.  When *None* the default
             60-second value defined by Task&nbsp;24 is used.  The argument is
-            accepted for forward-compatibility – current implementation writes
-            one file per :py:meth:`write_chunk` invocation but storing the
-            interval now means the API remains stable when future work adds
-            time-based rotation.
+            accepted for forward-compatibility – current implementation appends
+            every :py:meth:`write_chunk` payload to one session file but
+            storing the interval now means the API remains stable when future
+            work adds time-based rotation.
         """
         self._temp_dir: Path = self._get_temp_dir()
         self._counter: int = 0
         self._active: bool = False
+        self._fh: Optional[BinaryIO] = None
+        self._idx_fh: Optional[BinaryIO] = None
+        self._offset: int = 0
+        self._idx_offset: int = 0
+        # Session-file bytes before this offset were already dropped from
+        # the OS page cache (see _evict_written).
+        self._evicted: int = 0
+        # Writer thread state – created per session by start_session().
+        # Items are chunks, flush() markers or the ``None`` stop sentinel.
+        self._queue: "queue.Queue[Union[bytes, threading.Event, None]]" = queue.Queue(
+            maxsize=self._QUEUE_MAXSIZE
+        )
+        self._writer: Optional[threading.Thread] = None
+        # Set by the writer when spooled audio could not be written – the
+        # spool is then kept on close so whatever did reach disk survives.
+        self._data_lost: bool = False
+        self._log = logging.getLogger(self.__class__.__name__)
         # Task 24 – configurable chunk interval (seconds)
         self._chunk_interval_sec: int = int(chunk_interval_sec or 60)
 
@@ -57,24 +130,112 @@ class AudioSpooler:  # pylint: disable=too-few-public-methods
     # Session helpers
     # ------------------------------------------------------------------
     def start_session(self) -> None:  # noqa: D401 – imperative API
-        """Create the temp directory (if missing) and reset counter."""
+        """Create the temp directory (if missing) and open the session files.
+
+        Both files are opened unbuffered in append mode and stay open for the
+        whole session, so each chunk costs one write per file instead of a
+        create/write/close per chunk.  Leftovers from a crashed session are
+        appended to rather than overwritten.  A daemon writer thread drains
+        queued chunks into them.
+        """
         if self._active:
             # Session already in progress – no-op.
             return
 
         self._temp_dir.mkdir(parents=True, exist_ok=True)
+        self._fh = (self._temp_dir / self._SESSION_FILE).open("ab", buffering=0)
+        self._idx_fh = (self._temp_dir / self._INDEX_FILE).open("ab", buffering=0)
+        self._offset = os.fstat(self._fh.fileno()).st_size
+        self._idx_offset = os.fstat(self._idx_fh.fileno()).st_size
+        if self._offset or self._idx_offset:
+            self._trim_leftovers()
+        self._evicted = 0
         self._counter = 0
+        self._data_lost = False
+        self._queue = queue.Queue(maxsize=self._QUEUE_MAXSIZE)
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="AudioSpoolerWriter", daemon=True
+        )
+        self._writer.start()
         self._active = True
 
+    def _trim_leftovers(self) -> None:
+        """Cut a crashed session's torn tail before appending to it.
+
+        New index records must follow on from the last whole chunk, otherwise
+        recovery would stop at the tear and discard everything after it.  An
+        index that does not describe the session file is emptied.
+        """
+        assert self._fh is not None and self._idx_fh is not None
+        try:
+            raw = (self._temp_dir / self._INDEX_FILE).read_bytes()
+            scan = self._scan_index(raw, self._offset)
+            audio_bytes, index_bytes = (self._offset, 0) if scan is None else scan
+            if audio_bytes < self._offset:
+                self._log.warning(
+                    "Discarding %d bytes of torn audio from the previous session", self._offset - audio_bytes
+                )
+            os.ftruncate(self._fh.fileno(), audio_bytes)
+            os.ftruncate(self._idx_fh.fileno(), index_bytes)
+        except OSError as exc:  # pragma: no cover – recovery still works on the raw files
+            self._log.warning("Could not trim leftover spool files: %s", exc)
+            return
+        self._offset, self._idx_offset = audio_bytes, index_bytes
+
     def write_chunk(self, audio_bytes: bytes) -> None:  # noqa: D401 – imperative API
-        """Write *audio_bytes* to the next sequential ``chunk_NNNN.pcm`` file."""
+        """Queue *audio_bytes* to be appended to the session file.
+
+        Returns as soon as the chunk is queued.  When the writer thread falls
+        :pyattr:`_QUEUE_MAXSIZE` chunks behind this blocks until there is room
+        – writing inline instead would reorder audio ahead of queued chunks.
+
+        Raises
+        ------
+        RuntimeError
+            If the writer thread has died, so the chunk can never be written.
+        """
         if not self._active:
             # Automatically start a session if the caller forgot to.
             self.start_session()
 
+        self._enqueue(bytes(audio_bytes))
         self._counter += 1
-        file_path = self._temp_dir / self._CHUNK_TEMPLATE.format(idx=self._counter)
-        file_path.write_bytes(audio_bytes)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until every queued chunk has been written to disk.
+
+        Returns *False* if *timeout* (seconds) elapsed first or the writer
+        thread is no longer running.
+        """
+        writer = self._writer
+        if writer is None:
+            return True
+        done = threading.Event()
+        try:
+            self._enqueue(done)
+        except RuntimeError:
+            return False
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self._LIVENESS_POLL
+            if deadline is not None:
+                wait = min(wait, max(0.0, deadline - time.monotonic()))
+            if done.wait(wait):
+                return True
+            if not writer.is_alive() or (deadline is not None and time.monotonic() >= deadline):
+                return False
+
+    def _enqueue(self, item: Union[bytes, threading.Event, None]) -> None:
+        """Put *item* on the writer queue, failing instead of blocking forever."""
+        writer = self._writer
+        while True:
+            if writer is None or not writer.is_alive():
+                raise RuntimeError("Audio spooler writer thread is not running")
+            try:
+                self._queue.put(item, timeout=self._LIVENESS_POLL)
+                return
+            except queue.Full:
+                continue
 
     def close_session(self, *, success: bool = True) -> None:  # noqa: D401 – imperative API
         """Close the current session.
@@ -82,13 +243,36 @@ class AudioSpooler:  # pylint: disable=too-few-public-methods
         Parameters
         ----------
         success
-            When *True* the temporary chunk files are deleted.  If *False* (e.g.
+            When *True* the temporary spool files are deleted.  If *False* (e.g.
             on crash) the files remain on disk so they can be recovered on the
             next application start-up.
         """
         if not self._active:
             return
 
+        if self._writer is not None:
+            try:
+                self._enqueue(None)  # drains everything queued before it
+            except RuntimeError:  # writer already died – nothing left to drain
+                pass
+            # No timeout: closing the files under a still-running writer
+            # would lose the audio it has yet to write.
+            self._writer.join()
+            self._writer = None
+        if success and self._data_lost:
+            self._log.warning("Spooled audio could not be fully written – keeping %s for recovery", self._temp_dir)
+            success = False
+        if not success and self._fh is not None:
+            self._evict_written(self._offset)  # leftover spool stays out of the cache
+
+        for fh in (self._fh, self._idx_fh):
+            if fh is not None:
+                try:
+                    fh.close()
+                except OSError:  # pragma: no cover – best-effort close
+                    pass
+        self._fh = self._idx_fh = None
+
         if success:
             # Best-effort cleanup – ignore errors so shutdown never fails.
             try:
@@ -98,6 +282,134 @@ class AudioSpooler:  # pylint: disable=too-few-public-methods
 
         self._active = False
         self._counter = 0
+        self._offset = self._idx_offset = 0
+
+    def _writer_loop(self) -> None:
+        """Drain the queue into the session files until the stop sentinel.
+
+        Chunks and their index records are appended to RAM buffers which are
+        written out once :pyattr:`_MAX_BATCH_BYTES` is reached or the oldest
+        pending chunk is :pyattr:`_MAX_BATCH_DELAY` seconds old.  flush()
+        markers and the stop sentinel always write out the pending batch.  A
+        batch that failed to write is retried one batch delay later.
+        """
+        try:
+            self._drain_queue()
+        except Exception:  # pylint: disable=broad-except
+            # write_chunk()/flush() notice the dead thread instead of blocking.
+            self._data_lost = True
+            self._log.exception("Spooler writer stopped unexpectedly")
+
+    def _drain_queue(self) -> None:
+        """Writer-thread body – see :meth:`_writer_loop`."""
+        buf = bytearray()
+        idx_buf = bytearray()
+        deadline = 0.0
+        while True:
+            timeout = max(0.0, deadline - time.monotonic()) if buf else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:  # batch delay elapsed
+                if not self._flush_batch(buf, idx_buf):
+                    deadline = time.monotonic() + self._MAX_BATCH_DELAY
+                continue
+            if item is None:
+                for attempt in range(self._CLOSE_ATTEMPTS):
+                    if attempt:
+                        time.sleep(self._MAX_BATCH_DELAY)
+                    if self._flush_batch(buf, idx_buf):
+                        break
+                else:
+                    self._data_lost = True
+                    self._log.error("Spooler closing with %d bytes of audio unwritten", len(buf))
+                return
+            if isinstance(item, threading.Event):  # flush() marker
+                self._flush_batch(buf, idx_buf)
+                item.set()
+                continue
+            if not buf:
+                deadline = time.monotonic() + self._MAX_BATCH_DELAY
+            # Packed in place – no per-chunk ``bytes`` record is allocated.
+            record_pos = len(idx_buf)
+            idx_buf += self._INDEX_BLANK
+            self._INDEX_RECORD.pack_into(idx_buf, record_pos, self._offset + len(buf), len(item))
+            buf += item
+            if len(buf) >= self._MAX_BATCH_BYTES:
+                self._flush_batch(buf, idx_buf)
+
+    def _flush_batch(self, buf: bytearray, idx_buf: bytearray) -> bool:
+        """Write the pending batch (one write per file) and clear the buffers.
+
+        The index goes first: after a crash mid-batch its records point past
+        the end of the session file, so recovery can tell exactly which
+        chunks made it to disk (see :meth:`_indexed_length`).  If either
+        write fails both files are truncated back to where the
+        batch started – index records never point past the audio – and the
+        buffers are kept for a retry.  Returns *False* while the batch is
+        still pending.
+        """
+        if not buf:
+            return True
+        assert self._fh is not None and self._idx_fh is not None
+        batch_start = self._offset
+        try:
+            self._write_all(self._idx_fh, idx_buf)
+            self._write_all(self._fh, buf)
+        except Exception as exc:  # pylint: disable=broad-except – keep the thread alive
+            if self._rollback() and len(buf) < self._MAX_RETAINED_BYTES:
+                self._log.warning("Spooler write failed, retrying %d bytes: %s", len(buf), exc)
+                return False
+            self._data_lost = True
+            self._log.error("Spooler write failed, dropping %d bytes of audio: %s", len(buf), exc)
+        else:
+            self._offset += len(buf)
+            self._idx_offset += len(idx_buf)
+        del buf[:]
+        del idx_buf[:]
+        # Earlier batches have had a flush interval to be written back, so
+        # their pages are clean and can actually be dropped.
+        self._evict_written(batch_start)
+        return True
+
+    def _rollback(self) -> bool:
+        """Truncate both files to their last fully written batch.
+
+        Returns *False* if that failed – the batch's index records would then
+        point at the wrong offsets, so it must not be retried.
+        """
+        assert self._fh is not None and self._idx_fh is not None
+        try:
+            os.ftruncate(self._fh.fileno(), self._offset)
+            os.ftruncate(self._idx_fh.fileno(), self._idx_offset)
+        except OSError as exc:
+            self._log.error("Spooler could not roll back a partial write: %s", exc)
+            return False
+        return True
+
+    def _evict_written(self, end: int) -> None:
+        """Advise the OS to drop cached session-file pages before *end*.
+
+        Spooled audio is write-once and only re-read on crash recovery, so
+        keeping it cached just evicts hotter pages (e.g. model weights).
+        Linux also starts write-back for dirty pages in the range.  No-op
+        where ``posix_fadvise`` is unavailable (Windows, macOS).
+        """
+        if _FADV_DONTNEED is None or self._fh is None or end <= self._evicted:
+            return
+        try:
+            os.posix_fadvise(
+                self._fh.fileno(), self._evicted, end - self._evicted, _FADV_DONTNEED
+            )
+        except OSError:  # pragma: no cover – purely advisory
+            return
+        self._evicted = end
+
+    @staticmethod
+    def _write_all(fh: BinaryIO, data: bytearray) -> None:
+        """Write all of *data* – unbuffered raw writes may be partial."""
+        view = memoryview(data)
+        while view:
+            view = view[fh.write(view) :]
 
     # ------------------------------------------------------------------
     # Recovery helpers (Task 24)
@@ -110,20 +422,26 @@ class AudioSpooler:  # pylint: disable=too-few-public-methods
         destination: Path | None = None,
         cleanup: bool = False,
     ) -> Path:  # noqa: D401 – utility API
-        """Merge sequential ``chunk_*.pcm`` files into a single output file.
+        """Merge the spooled audio into a single output file.
+
+        The session file already holds the chunks back to back, so on its own
+        it is renamed into place (``cleanup=True``) or copied.  Legacy
+        ``chunk_*.pcm`` files left by older versions are concatenated first,
+        in index order.  A chunk torn by a crash is cut from the end of the
+        session audio using ``index.bin``.
 
         Parameters
         ----------
         source_dir
-            Directory containing the chunk files.  Defaults to the canonical
+            Directory containing the spool files.  Defaults to the canonical
             temp spool directory.
         destination
             Desired output *Path*.  If *None* a file named ``merged.pcm`` will
             be created in *source_dir*.
         cleanup
-            When *True* the individual chunk files are deleted **after** a
-            successful merge – this mirrors the recovery workflow where the
-            temporary files are no longer needed once reconstructed.
+            When *True* the spool files are deleted **after** a successful
+            merge – this mirrors the recovery workflow where the temporary
+            files are no longer needed once reconstructed.
 
         Returns
         -------
@@ -134,21 +452,54 @@ class AudioSpooler:  # pylint: disable=too-few-public-methods
         if not src.exists():
             raise FileNotFoundError(f"Source directory does not exist: {src}")
 
-        # Discover chunk files and sort by their numeric index to preserve
-        # recording order.
-        chunk_files = sorted(src.glob("chunk_*.pcm"), key=cls._sort_key)
+        # Discover legacy chunk files and sort by their numeric index to
+        # preserve recording order; the session file always comes last.
+        # One directory scan finds both kinds of spool file.
+        chunk_files: List[Path] = []
+        session_file = src / cls._SESSION_FILE
+        has_session = False
+        with os.scandir(src) as entries:
+            for entry in entries:
+                if entry.name == cls._SESSION_FILE:
+                    has_session = entry.is_file()
+                elif cls._is_chunk_name(entry.name):
+                    chunk_files.append(Path(entry.path))
+        chunk_files.sort(key=cls._sort_key)
+        torn = 0
+        if has_session:
+            chunk_files.append(session_file)
+            size = session_file.stat().st_size
+            torn = size - cls._indexed_length(src / cls._INDEX_FILE, size)
         if not chunk_files:
             raise FileNotFoundError("No chunk files found to merge")
 
         dest_path = destination or src / "merged.pcm"
-        # Concatenate using buffered reads to avoid loading all data into RAM.
-        with dest_path.open("wb") as out_fh:
-            for file in chunk_files:
-                with file.open("rb") as in_fh:
-                    shutil.copyfileobj(in_fh, out_fh, length=64 * 1024)
+        renamed = False
+        if cleanup and chunk_files == [session_file]:
+            # Already contiguous – a rename replaces the copy entirely.
+            try:
+                os.replace(session_file, dest_path)
+                renamed = True
+            except OSError:  # e.g. destination on another volume – copy instead
+                pass
+        if renamed:
+            chunk_files = []
+        elif len(chunk_files) == 1:
+            # Whole-file copy – in-kernel where the platform offers it.
+            _copy_whole_file(chunk_files[0], dest_path)
+        else:
+            with dest_path.open("wb", buffering=0) as out_fh:
+                for file in chunk_files:
+                    with file.open("rb") as in_fh:
+                        cls._append_file(in_fh, out_fh)
+
+        if torn:
+            # The session file is always merged last – drop its torn tail.
+            logging.getLogger(cls.__name__).warning("Discarding %d bytes of torn audio from %s", torn, session_file)
+            os.truncate(dest_path, dest_path.stat().st_size - torn)
 
         if cleanup:
-            for file in chunk_files:
+            for file in (*chunk_files, src / cls._INDEX_FILE):
                 try:
                     file.unlink(missing_ok=True)  # type: ignore[arg-type]
                 except Exception:  # pragma: no cover – best-effort clean-up
@@ -160,9 +511,22 @@ class AudioSpooler:  # pylint: disable=too-few-public-methods
     # ------------------------------------------------------------------
     @classmethod
     def incomplete_session_exists(cls) -> bool:  # noqa: D401 – predicate helper
-        """Return *True* when un-cleaned chunk files exist on disk."""
-        temp_dir = cls._get_temp_dir()
-        return any(temp_dir.glob("chunk_*.pcm"))
+        """Return *True* when un-cleaned spooled audio exists on disk.
+
+        Scans the spool directory once and stops at the first hit, without
+        building a *Path* per entry.
+        """
+        try:
+            with os.scandir(cls._get_temp_dir()) as entries:
+                for entry in entries:
+                    if entry.name == cls._SESSION_FILE:
+                        if entry.stat().st_size > 0:
+                            return True
+                    elif cls._is_chunk_name(entry.name):
+                        return True
+        except OSError:  # spool directory missing or unreadable
+            pass
+        return False
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -178,6 +542,72 @@ class AudioSpooler:  # pylint: disable=too-few-public-methods
             base = Path(tempfile.gettempdir())
         return base / cls._APP_NAME / "temp"
 
+    @classmethod
+    def _indexed_length(cls, index_file: Path, size: int) -> int:
+        """Return how many bytes of a *size*-byte session file hold whole chunks.
+
+        Without a usable index (missing, empty or not matching the file) the
+        whole file is trusted.
+        """
+        try:
+            scan = cls._scan_index(index_file.read_bytes(), size)
+        except OSError:
+            return size
+        return size if scan is None else scan[0]
+
+    @classmethod
+    def _scan_index(cls, raw: bytes, size: int) -> Optional[Tuple[int, int]]:
+        """Return ``(audio_bytes, index_bytes)`` covering the whole chunks.
+
+        Index records are contiguous from offset 0, so valid audio ends where
+        the last record lying wholly inside the *size*-byte session file ends;
+        anything after it belongs to a chunk torn by a crash.  Returns *None*
+        when *raw* does not describe the file (no record at offset 0).
+        """
+        usable = len(raw) - len(raw) % cls._INDEX_RECORD.size  # ignore a torn record
+        end = records = 0
+        for offset, length in cls._INDEX_RECORD.iter_unpack(memoryview(raw)[:usable]):
+            if offset != end:
+                break
+            if offset + length > size:  # torn chunk – the index still matches
+                return end, records * cls._INDEX_RECORD.size
+            end += length
+            records += 1
+        if not records:
+            return None
+        return end, records * cls._INDEX_RECORD.size
+
+    @staticmethod
+    def _append_file(in_fh: BinaryIO, out_fh: BinaryIO) -> None:
+        """Append all of *in_fh* to *out_fh* without loading it into RAM.
+
+        Copies in-kernel with ``os.sendfile`` where it supports file targets
+        (Linux); otherwise, or if it fails part-way, the rest is streamed
+        through ``shutil.copyfileobj``.
+        """
+        offset = 0
+        if hasattr(os, "sendfile"):
+            in_fd, out_fd = in_fh.fileno(), out_fh.fileno()
+            size = os.fstat(in_fd).st_size
+            try:
+                while offset < size:
+                    sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+                    if not sent:
+                        break
+                    offset += sent
+            except OSError:  # e.g. macOS – sendfile needs a socket target
+                pass
+            else:
+                if offset >= size:
+                    return
+        in_fh.seek(offset)
+        shutil.copyfileobj(in_fh, out_fh, length=64 * 1024)
+
+    @staticmethod
+    def _is_chunk_name(name: str) -> bool:
+        """Return *True* for legacy ``chunk_*.pcm`` file names."""
+        return name.startswith("chunk_") and name.endswith(".pcm")
+
     @staticmethod
     def _sort_key(path: Path) -> int:  # noqa: D401 – helper
         """Return numeric index extracted from *chunk_XXXX.pcm* name for sorting."""
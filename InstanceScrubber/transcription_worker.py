@@ -21,10 +21,17 @@ the engine falls back to a lightweight fake model that returns deterministic
 outputs.  This makes the public API fully testable without network access.
 """
 
+import contextlib
+import itertools
 import logging
+import os
+import queue as _queue
+import threading
 import time
 from dataclasses import dataclass
-from typing import Any, List, Sequence, Tuple
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Any, List, Literal, Sequence, Tuple
 
 import numpy as np
 
@@ -62,6 +69,93 @@ except Exception:  # noqa: BLE001 – broad except on purpose; we fall back to s
 
     nemo_asr = None  # type: ignore
 
+# Optional ONNX Runtime backend for the encoder (see ``onnx_cache_dir``)
+try:
+    import onnxruntime as ort  # type: ignore
+except ImportError:  # pragma: no cover – optional accelerator
+    ort = None  # type: ignore
+
+try:  # Optional – parallel JIT kernel for the PCM → float32 conversion
+    from numba import njit, prange  # type: ignore
+except ImportError:  # pragma: no cover – optional dependency
+    njit = None  # type: ignore[assignment]
+    prange = range  # type: ignore[assignment]
+
+#: int16 PCM → normalised float32 scale factor (exact in float32)
+_PCM_SCALE = np.float32(1.0 / 32768.0)
+
+#: Below this many samples thread start-up outweighs the parallel kernel
+_JIT_MIN_SAMPLES = 1 << 16
+
+
+def _pcm16_to_f32(src: np.ndarray, dst: np.ndarray) -> None:
+    """Write ``src / 32768`` into *dst* (same length) – Numba-compatible.
+
+    Compiled with ``parallel=True`` the loop is split across cores and
+    auto-vectorised (int16 → int32 → float32 widening per SIMD lane).
+    """
+    scale = np.float32(1.0 / 32768.0)
+    for i in prange(src.shape[0]):  # pylint: disable=not-an-iterable
+        dst[i] = np.float32(src[i]) * scale
+
+
+_pcm16_to_f32_jit = None
+if njit is not None:
+    try:
+        _pcm16_to_f32_jit = njit(parallel=True, fastmath=True, cache=True)(_pcm16_to_f32)
+    except RuntimeError:  # pragma: no cover – no writable cache dir (frozen build)
+        _pcm16_to_f32_jit = njit(parallel=True, fastmath=True)(_pcm16_to_f32)
+
+
+def _pcm16_to_f32_into(src: np.ndarray, dst: np.ndarray) -> None:
+    """Convert int16 *src* into float32 *dst*, using the JIT kernel when worthwhile."""
+    if _pcm16_to_f32_jit is not None and src.shape[0] >= _JIT_MIN_SAMPLES:
+        _pcm16_to_f32_jit(src, dst)
+    else:
+        np.multiply(src, _PCM_SCALE, out=dst)
+
+
+def _precompile_pcm_kernel() -> None:
+    """Compile the JIT kernel for read-only (bytes) and writable (shm) input.
+
+    Run once at worker start so the first request does not pay JIT latency.
+    """
+    if _pcm16_to_f32_jit is None:
+        return
+    dst = np.empty(1, dtype=np.float32)
+    _pcm16_to_f32_jit(np.frombuffer(bytes(2), dtype=np.int16), dst)
+    _pcm16_to_f32_jit(np.zeros(1, dtype=np.int16), dst)
+
+
+class _CudaArray:  # pylint: disable=too-few-public-methods
+    """Expose an ORT device buffer to torch via ``__cuda_array_interface__``.
+
+    Lets ``torch.as_tensor`` wrap the encoder output in place – no
+    device→host→device round-trip.  Holds the *OrtValue* so it outlives
+    the view.
+    """
+
+    def __init__(self, value: Any, typestr: str) -> None:
+        self._value = value
+        self.__cuda_array_interface__ = {
+            "shape": tuple(value.shape()),
+            "typestr": typestr,
+            "data": (value.data_ptr(), False),
+            "version": 2,
+        }
+
+
+@dataclass(slots=True)
+class _EncoderGraph:
+    """A captured CUDA Graph of the encoder plus its static I/O tensors."""
+
+    graph: Any
+    features: Any
+    features_len: Any
+    encoded: Any
+    encoded_len: Any
+
+
 # ---------------------------------------------------------------------------
 # Public classes
 # ---------------------------------------------------------------------------
@@ -72,25 +166,73 @@ class TranscriptionEngine:  # pylint: disable=too-many-public-methods
 
     _DEFAULT_MODEL_NAME = "nvidia/parakeet-tdt-0.6b-v2"
 
+    #: Clip lengths (seconds @ 16 kHz) exercised by :meth:`_warm_up`
+    _WARM_UP_SECONDS: Tuple[int, ...] = (1, 5, 15, 30)
+    #: Wall-clock budget for the warm-up sweep
+    _WARM_UP_BUDGET_S = 3.0
+
+    #: Capacity of the pinned-host staging buffer (60 s @ 16 kHz)
+    _PINNED_SAMPLES = 60 * 16_000
+
+    #: Padded clip lengths (seconds) whose encoder pass is captured as a CUDA Graph
+    _GRAPH_BUCKET_SECONDS: Tuple[int, ...] = (5, 30)
+
     def __init__(self) -> None:
         self.model: Any | None = None
+        # Page-locked float32 staging buffer (CUDA only) – reused by every
+        # call so NeMo neither allocates a fresh tensor nor bounces the H2D
+        # copy through a pageable staging area.  Kept across unload/reload
+        # because pinned allocations are expensive.
+        self._pinned: Any | None = None
+        self._pinned_np: np.ndarray | None = None
+        self._pinned_lock = threading.Lock()
+        # Extra pinned (tensor, NumPy view) pairs handed out to producers
+        # such as the worker's prefetch thread – see pinned_staging_buffers()
+        self._staging: list[tuple[Any, np.ndarray]] = []
+        # bucket length (samples) → captured encoder graph; empty when eager only
+        self._encoder_graphs: dict[int, _EncoderGraph] = {}
+        # Inference precision of the real model; *None* for the stub
+        self._precision: str | None = None
+        # ONNX Runtime encoder session (TensorRT/CUDA EP) when enabled
+        self._onnx_session: Any | None = None
+        # Whether the model exposes preprocessor/encoder/decoding for the
+        # direct call path (False for the stub and after a direct failure)
+        self._direct = False
 
     # ------------------------------------------------------------------
     # Model lifecycle helpers
     # ------------------------------------------------------------------
 
-    def load_model(self, *, use_stub: bool = False) -> None:
+    def load_model(
+        self,
+        *,
+        use_stub: bool = False,
+        precision: Literal["auto", "fp32", "fp16", "bf16"] = "auto",
+        onnx_cache_dir: str | Path | None = None,
+    ) -> None:
         """Load the Parakeet model into GPU/CPU memory.
 
         The heavy import is done lazily so unit-tests can opt-out by passing
         ``use_stub=True`` which forces a dummy implementation that returns
         deterministic outputs without external dependencies.
+
+        *precision* selects the inference dtype; ``"auto"`` picks BF16 on
+        Ampere (SM 8.0) or newer, FP16 on older GPUs and FP32 on CPU.
+
+        With *onnx_cache_dir* set (and *onnxruntime-gpu* installed) the
+        encoder is exported to ONNX once, cached there together with the
+        TensorRT engine, and run through ONNX Runtime for single clips.
+        Without CUDA an INT8-quantised encoder is used the same way (cached
+        in *onnx_cache_dir* or the per-user model cache) when *onnxruntime*
+        is installed.
         """
 
         if use_stub or nemo_asr is None:
             logging.info("Using stub ASR model – real NeMo not available or skipped")
             # pylint: disable=protected-access
             self.model = _StubASRModel()  # type: ignore[name-defined]
+            self._precision = None
+            self._direct = False
             return
 
         try:
@@ -98,6 +240,13 @@ class TranscriptionEngine:  # pylint: disable=too-many-public-methods
             self.model = nemo_asr.models.ASRModel.from_pretrained(  # type: ignore[attr-defined]
                 model_name=self._DEFAULT_MODEL_NAME,
             )
+            if onnx_cache_dir is not None or not self._cuda_available():
+                # Export before any half cast; CPU-only hosts always try INT8
+                cache_dir = Path(onnx_cache_dir) if onnx_cache_dir is not None else self._default_model_cache_dir()
+                self._load_onnx_encoder(cache_dir)
+            self._apply_precision(precision)
+            self._direct = all(hasattr(self.model, part) for part in ("preprocessor", "encoder", "decoding"))
+            self._alloc_pinned()
             logging.info("Model loaded – performing warm-up inference")
             self._warm_up()
         except Exception as exc:  # pragma: no cover – safety
@@ -106,14 +255,453 @@ class TranscriptionEngine:  # pylint: disable=too-many-public-methods
             raise
 
     def _warm_up(self) -> None:
-        """Run a short inference pass to pay the JIT & CUDA launch costs up-front."""
+        """Run a short inference sweep to pay the JIT & CUDA launch costs up-front.
+
+        A single tiny clip only primes kernels for that one shape, so the
+        first real dictation still paid autotuning/JIT cost.  We instead
+        sweep representative clip lengths at batch sizes 1 and 2, using
+        low-amplitude noise because pure silence can take early-exit paths
+        that skip the decoder.  The clips go through the public inference
+        methods as normalised float32 – exactly what the worker feeds them –
+        so the engine path serving real requests is the one that gets primed.
+        The sweep stops once ``_WARM_UP_BUDGET_S`` has elapsed so slow
+        (CPU-only) hosts do not stall start-up.
+        """
         if self.model is None:
             return
-        silence = np.zeros(8000, dtype=np.int16)  # 0.5 s of silence @ 16 kHz
+        rng = np.random.default_rng(0)
+        started = time.perf_counter()
+        for secs in self._WARM_UP_SECONDS:
+            buf = rng.uniform(-1e-3, 1e-3, size=secs * 16_000).astype(np.float32)
+            try:
+                self.get_plain_transcription(buf)
+                self.get_plain_transcription_batch([buf, buf])
+            except Exception as exc:  # pragma: no cover – warm-up failures non-fatal
+                logging.warning("Warm-up inference (%d s clip) failed: %s", secs, exc)
+                break  # graph capture below does not depend on the sweep
+            if time.perf_counter() - started > self._WARM_UP_BUDGET_S:
+                logging.debug("Warm-up budget exhausted after %d s clips", secs)
+                break
+        self._capture_encoder_graphs()
+
+    def _capture_encoder_graphs(self) -> None:
+        """Capture one encoder CUDA Graph per ``_GRAPH_BUCKET_SECONDS`` bucket.
+
+        Short clips are launch-bound in eager mode – the Conformer encoder
+        issues hundreds of small kernels per forward.  Replaying a captured
+        graph on a fixed, padded shape removes that overhead; the
+        preprocessor and the (dynamic-length) decoder stay eager.  Any
+        failure simply leaves the engine on the eager path.
+        """
+        if self._pinned is None or self._onnx_session is not None:
+            return  # no CUDA (or no torch), or the ONNX encoder handles it
         try:
-            _ = self.model.transcribe(audio=[silence], batch_size=1)  # type: ignore[attr-defined]
-        except Exception as exc:  # pragma: no cover – warm-up failures non-fatal
-            logging.warning("Warm-up inference failed: %s", exc)
+            import torch  # pylint: disable=import-error,import-outside-toplevel
+
+            model = self.model
+            device = next(model.parameters()).device  # type: ignore[union-attr]
+            if device.type != "cuda":
+                return
+            model.eval()  # type: ignore[union-attr]
+            for secs in self._GRAPH_BUCKET_SECONDS:
+                samples = secs * 16_000
+                with self._inference_context():
+                    signal = torch.zeros(1, samples, device=device)
+                    signal_len = torch.tensor([samples], device=device)
+                    feats, feats_len = model.preprocessor(  # type: ignore[union-attr]
+                        input_signal=signal, length=signal_len
+                    )
+                    static_feats, static_len = feats.clone(), feats_len.clone()
+
+                    # Warm the side stream before capture, as torch requires
+                    side = torch.cuda.Stream()
+                    side.wait_stream(torch.cuda.current_stream())
+                    with torch.cuda.stream(side):
+                        for _ in range(2):
+                            model.encoder(audio_signal=static_feats, length=static_len)  # type: ignore[union-attr]
+                    torch.cuda.current_stream().wait_stream(side)
+
+                    graph = torch.cuda.CUDAGraph()
+                    with torch.cuda.graph(graph):
+                        encoded, encoded_len = model.encoder(  # type: ignore[union-attr]
+                            audio_signal=static_feats, length=static_len
+                        )
+                self._encoder_graphs[samples] = _EncoderGraph(graph, static_feats, static_len, encoded, encoded_len)
+            logging.info("Captured encoder CUDA Graphs for %s s buckets", self._GRAPH_BUCKET_SECONDS)
+        except Exception as exc:  # pragma: no cover – needs CUDA + NeMo
+            logging.debug("Encoder CUDA Graph capture unavailable: %s", exc)
+            self._encoder_graphs.clear()
+
+    def _transcribe_with_graph(self, audio: np.ndarray) -> str | None:
+        """Transcribe *audio* via a captured encoder graph; *None* on a miss.
+
+        The clip is zero-padded to the smallest bucket that holds it; the
+        true length is passed to the preprocessor so padding is masked.  Any
+        runtime failure disables graphs for the rest of the session.
+        Caller holds ``_pinned_lock`` (the static buffers are shared).
+        """
+        n = len(audio)
+        bucket = min((b for b in self._encoder_graphs if b >= n), default=None)
+        if bucket is None:
+            return None
+        try:
+            entry = self._encoder_graphs[bucket]
+            with self._inference_context():
+                feats, feats_len = self._features([audio], pad_to=bucket)
+                entry.features.copy_(feats)
+                entry.features_len.copy_(feats_len)
+                entry.graph.replay()
+                return self._decode(entry.encoded, entry.encoded_len)[0]
+        except Exception as exc:  # pylint: disable=broad-except – eager path still works
+            logging.warning("Encoder CUDA Graph replay failed (%s) – using eager inference", exc)
+            self._encoder_graphs.clear()
+            return None
+
+    # ------------------------------------------------------------------
+    # Direct preprocessor → encoder → decoder path
+    # ------------------------------------------------------------------
+
+    def _features(self, audios: Sequence[np.ndarray], *, pad_to: int | None = None) -> Tuple[Any, Any]:
+        """Run the mel preprocessor on *audios* and return ``(features, lengths)``.
+
+        Clips are zero-padded into one ``(batch, samples)`` signal (to
+        *pad_to* samples if given); the true lengths mask the padding.
+        Caller holds ``_pinned_lock`` and the inference context.
+        """
+        import torch  # pylint: disable=import-error,import-outside-toplevel
+
+        model = self.model
+        device = next(model.parameters()).device  # type: ignore[union-attr]
+        sources = [
+            src if torch.is_tensor(src) else torch.from_numpy(self._as_float32(src))
+            for src in self._to_model_inputs(audios)
+        ]
+        lengths = [len(audio) for audio in audios]
+        if len(sources) == 1 and pad_to is None:
+            signal = sources[0].to(device, non_blocking=True).unsqueeze(0)
+        else:
+            signal = torch.zeros(len(sources), pad_to or max(lengths), device=device)
+            for row, src in zip(signal, sources):
+                row[: len(src)].copy_(src, non_blocking=True)
+        length = torch.tensor(lengths, device=device)
+        return model.preprocessor(input_signal=signal, length=length)  # type: ignore[union-attr]
+
+    @staticmethod
+    def _as_float32(audio: np.ndarray) -> np.ndarray:
+        """Return *audio* as contiguous normalised float32 (int16 PCM is scaled)."""
+        if audio.dtype == np.int16:
+            converted = np.empty(len(audio), dtype=np.float32)
+            _pcm16_to_f32_into(audio, converted)
+            return converted
+        return np.ascontiguousarray(audio, dtype=np.float32)
+
+    def _decode(self, encoded: Any, encoded_len: Any) -> List[str]:
+        """Greedy-decode encoder output into one transcript per batch row."""
+        hyps = self.model.decoding.rnnt_decoder_predictions_tensor(  # type: ignore[union-attr]
+            encoder_output=encoded, encoded_lengths=encoded_len, return_hypotheses=False
+        )
+        if isinstance(hyps, tuple):  # older NeMo: (best_hypotheses, all_hypotheses)
+            hyps = hyps[0]
+        return [getattr(hyp, "text", hyp) for hyp in hyps or []]
+
+    def _transcribe_direct(self, audios: Sequence[np.ndarray]) -> List[str] | None:
+        """Transcribe *audios* without going through ``model.transcribe()``.
+
+        ``transcribe()`` validates input, builds a dataloader and collates
+        every call – Python overhead that dominates short clips at batch 1.
+        Calling the preprocessor, encoder and decoder directly skips all of
+        it.  Returns *None* (and disables the path) on unexpected failures;
+        CUDA OOM is re-raised for the caller to report.
+        Caller holds ``_pinned_lock``.
+        """
+        try:
+            with self._inference_context():
+                feats, feats_len = self._features(audios)
+                encoded, encoded_len = self.model.encoder(  # type: ignore[union-attr]
+                    audio_signal=feats, length=feats_len
+                )
+                texts = self._decode(encoded, encoded_len)
+            if len(texts) != len(audios):
+                raise RuntimeError(f"Decoder returned {len(texts)} results for {len(audios)} clips")
+            return texts
+        except Exception as exc:  # pylint: disable=broad-except – transcribe() still works
+            if "CUDA out of memory" in str(exc):
+                raise
+            logging.warning("Direct inference failed (%s) – using model.transcribe()", exc)
+            self._direct = False
+            return None
+
+    @staticmethod
+    def _resolve_precision(precision: str) -> str:
+        """Map ``"auto"`` to the best dtype for this host; half needs CUDA."""
+        import torch  # pylint: disable=import-error,import-outside-toplevel
+
+        if not torch.cuda.is_available():
+            if precision not in ("auto", "fp32"):
+                logging.warning("%s inference needs CUDA – using fp32", precision)
+            return "fp32"
+        if precision != "auto":
+            return precision
+        major, _minor = torch.cuda.get_device_capability()
+        return "bf16" if major >= 8 else "fp16"
+
+    def _apply_precision(self, precision: str) -> None:
+        """Cast the freshly loaded model to the requested inference dtype.
+
+        The mel preprocessor stays in FP32 (STFT/log are precision-sensitive);
+        autocast in :meth:`_inference_context` bridges it to the half encoder.
+        """
+        import torch  # pylint: disable=import-error,import-outside-toplevel
+
+        resolved = self._resolve_precision(precision)
+        model = self.model.eval()  # type: ignore[union-attr]
+        if resolved == "bf16":
+            model = model.to(torch.bfloat16)
+        elif resolved == "fp16":
+            model = model.half()
+        if resolved != "fp32":
+            model.preprocessor.float()
+        self.model = model
+        self._precision = resolved
+        logging.info("Parakeet inference precision: %s", resolved)
+
+    def _inference_context(self) -> contextlib.AbstractContextManager[Any]:
+        """Return the grad-free (and, for half precision, autocast) context."""
+        if self._precision is None:
+            return contextlib.nullcontext()  # stub model – no torch needed
+        import torch  # pylint: disable=import-error,import-outside-toplevel
+
+        stack = contextlib.ExitStack()
+        stack.enter_context(torch.inference_mode())
+        if self._precision != "fp32":
+            dtype = torch.bfloat16 if self._precision == "bf16" else torch.float16
+            # Weights are already cast, and the cast cache is incompatible
+            # with CUDA Graph capture – so keep it off.
+            stack.enter_context(torch.autocast("cuda", dtype=dtype, cache_enabled=False))
+        return stack
+
+    @staticmethod
+    def _default_model_cache_dir() -> Path:
+        """Return where exported/quantised encoders are cached by default."""
+        appdata = os.getenv("APPDATA")  # Windows hosts
+        if appdata:
+            return Path(appdata) / "Instant Scribe" / "models"
+        return Path.home() / ".cache" / "instant-scribe"
+
+    @staticmethod
+    def _cuda_available() -> bool:
+        try:
+            import torch  # pylint: disable=import-error,import-outside-toplevel
+
+            return bool(torch.cuda.is_available())
+        except Exception:  # pragma: no cover – torch missing or broken
+            return False
+
+    def _export_encoder(self, cache_dir: Path, *, int8: bool = False) -> Path:
+        """Return the cached ONNX encoder, exporting (and quantising) on first use.
+
+        Files are written under a temporary name and renamed into place so
+        an interrupted export never leaves a half-written model behind.
+        """
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        stem = f"{self._DEFAULT_MODEL_NAME.replace('/', '_')}-encoder"
+        onnx_path = cache_dir / f"{stem}.onnx"
+        if not onnx_path.exists():
+            logging.info("Exporting Parakeet encoder to %s (one-off)", onnx_path)
+            tmp_path = onnx_path.with_suffix(".tmp.onnx")
+            self.model.encoder.export(str(tmp_path))  # type: ignore[union-attr]
+            tmp_path.replace(onnx_path)
+        if not int8:
+            return onnx_path
+
+        int8_path = cache_dir / f"{stem}.int8.onnx"
+        if not int8_path.exists():
+            # pylint: disable=import-error,import-outside-toplevel
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+
+            logging.info("Quantising Parakeet encoder to INT8 (one-off)")
+            tmp_path = int8_path.with_suffix(".tmp.onnx")
+            quantize_dynamic(str(onnx_path), str(tmp_path), per_channel=True, weight_type=QuantType.QInt8)
+            tmp_path.replace(int8_path)
+        return int8_path
+
+    def _load_onnx_encoder(self, cache_dir: Path) -> None:
+        """Create an ORT session for the encoder, exporting it on first use.
+
+        Only the encoder goes through ONNX: the TDT decoder's greedy loop is
+        dynamic and stays in NeMo, as do the preprocessor and decoding.
+
+        * CUDA hosts – FP32 graph on the TensorRT provider (engine cached in
+          *cache_dir*), else the CUDA provider.
+        * CPU-only hosts – per-channel INT8 weight-quantised graph on the CPU
+          provider, several times faster than the FP32 PyTorch encoder.
+
+        Any failure leaves the engine on the PyTorch path.
+        """
+        if ort is None:
+            logging.debug("onnxruntime not installed – ONNX encoder disabled")
+            return
+        available = ort.get_available_providers()
+        on_gpu = self._cuda_available()
+        if on_gpu and "CUDAExecutionProvider" not in available:
+            logging.debug("ONNX Runtime has no CUDA provider – ONNX encoder disabled")
+            return
+        try:
+            onnx_path = self._export_encoder(cache_dir, int8=not on_gpu)
+            providers: list[Any] = []
+            if on_gpu:
+                if "TensorrtExecutionProvider" in available:
+                    providers.append(
+                        (
+                            "TensorrtExecutionProvider",
+                            {
+                                "trt_fp16_enable": True,
+                                "trt_engine_cache_enable": True,
+                                "trt_engine_cache_path": str(cache_dir),
+                            },
+                        )
+                    )
+                providers.append("CUDAExecutionProvider")
+            else:
+                providers.append("CPUExecutionProvider")
+            options = ort.SessionOptions()
+            options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            self._onnx_session = ort.InferenceSession(str(onnx_path), sess_options=options, providers=providers)
+            logging.info("ONNX encoder ready (%s)", ", ".join(self._onnx_session.get_providers()))
+        except Exception as exc:  # pragma: no cover – needs NeMo + onnxruntime
+            logging.warning("ONNX encoder unavailable (%s) – using PyTorch", exc)
+            self._onnx_session = None
+
+    def _transcribe_with_onnx(self, audios: Sequence[np.ndarray]) -> List[str] | None:
+        """Transcribe *audios* (one padded batch) with the ORT encoder; *None* if unavailable.
+
+        On CUDA, features and outputs stay on the GPU: inputs are bound by
+        device pointer and the encoder output is wrapped for torch in place.
+        On CPU the session is run directly on (zero-copy) NumPy views.  A
+        runtime failure drops the session for the rest of the session.
+        Caller holds ``_pinned_lock``.
+        """
+        try:
+            import torch  # pylint: disable=import-error,import-outside-toplevel
+
+            session = self._onnx_session
+            with self._inference_context():
+                feats, feats_len = self._features(audios)
+                device = feats.device
+                feats = feats.float().contiguous()
+                feats_len = feats_len.to(torch.int64).contiguous()
+
+                (sig_in, len_in), (enc_out, len_out) = session.get_inputs(), session.get_outputs()
+                if device.type != "cuda":
+                    encoded_np, encoded_len_np = session.run(
+                        [enc_out.name, len_out.name], {sig_in.name: feats.numpy(), len_in.name: feats_len.numpy()}
+                    )
+                    encoded, encoded_len = torch.from_numpy(encoded_np), torch.from_numpy(encoded_len_np)
+                else:
+                    binding = session.io_binding()
+                    dev_id = device.index or 0
+                    binding.bind_input(sig_in.name, "cuda", dev_id, np.float32, tuple(feats.shape), feats.data_ptr())
+                    binding.bind_input(
+                        len_in.name, "cuda", dev_id, np.int64, tuple(feats_len.shape), feats_len.data_ptr()
+                    )
+                    binding.bind_output(enc_out.name, "cuda", dev_id)
+                    binding.bind_output(len_out.name, "cuda", dev_id)
+                    torch.cuda.current_stream(device).synchronize()  # ORT runs on its own stream
+                    session.run_with_iobinding(binding)
+
+                    encoded_val, encoded_len_val = binding.get_outputs()
+                    encoded = torch.as_tensor(_CudaArray(encoded_val, "<f4"), device=device)
+                    encoded_len = torch.as_tensor(_CudaArray(encoded_len_val, "<i8"), device=device)
+                return self._decode(encoded, encoded_len)
+        except Exception as exc:  # pylint: disable=broad-except – PyTorch path still works
+            logging.warning("ONNX encoder inference failed (%s) – using PyTorch", exc)
+            self._onnx_session = None
+            return None
+
+    def _alloc_pinned(self) -> None:
+        """Allocate the pinned-host staging buffer when CUDA is usable."""
+        if self._pinned is not None:
+            return
+        try:
+            import torch  # pylint: disable=import-error,import-outside-toplevel
+
+            if not torch.cuda.is_available():
+                return
+            pinned = torch.empty(self._PINNED_SAMPLES, dtype=torch.float32, pin_memory=True)
+            self._pinned, self._pinned_np = pinned, pinned.numpy()
+        except Exception as exc:  # pragma: no cover – optional acceleration
+            logging.debug("Pinned staging buffer unavailable: %s", exc)
+
+    def pinned_host_buffer(self) -> np.ndarray | None:
+        """Return a NumPy view of the pinned staging buffer (*None* without CUDA).
+
+        Float32 clips written into this view are handed to the model without
+        another copy; only use it from the thread that calls the engine.
+        """
+        return self._pinned_np
+
+    def pinned_staging_buffers(self, count: int) -> List[np.ndarray]:
+        """Return *count* separate pinned float32 buffers (empty without CUDA).
+
+        Unlike :meth:`pinned_host_buffer` these are never written by the
+        engine, so another thread may fill one while the engine runs on a
+        clip staged in a different one.  Clips staged in them are still
+        passed to the model without a copy.  Allocated once and reused.
+        """
+        if self._pinned is None:
+            return []
+        try:
+            import torch  # pylint: disable=import-error,import-outside-toplevel
+
+            while len(self._staging) < count:
+                tensor = torch.empty(self._PINNED_SAMPLES, dtype=torch.float32, pin_memory=True)
+                self._staging.append((tensor, tensor.numpy()))
+        except Exception as exc:  # pragma: no cover – pinned memory exhausted
+            logging.debug("Pinned staging buffers unavailable: %s", exc)
+            return []
+        return [host for _tensor, host in self._staging[:count]]
+
+    def _to_model_inputs(self, audios: Sequence[np.ndarray]) -> List[Any]:
+        """Map *audios* onto the pinned staging buffer where possible.
+
+        Clips that already live in the buffer are passed as tensor slices
+        as-is; otherwise int16 PCM is scaled (float input copied) into it in
+        one vectorised pass.  Falls back to the arrays themselves when there
+        is no buffer or the batch does not fit.  Caller holds ``_pinned_lock``.
+        """
+        pinned, host = self._pinned, self._pinned_np
+        if pinned is None or host is None:
+            return list(audios)
+
+        views = [self._pinned_slice(a) for a in audios]
+        if all(v is not None for v in views):
+            return views
+        if any(v is not None for v in views) or sum(len(a) for a in audios) > host.size:
+            return list(audios)  # would overwrite a clip still being read
+
+        inputs: List[Any] = []
+        offset = 0
+        for audio in audios:
+            n = len(audio)
+            dst = host[offset : offset + n]
+            if audio.dtype == np.int16:
+                _pcm16_to_f32_into(audio, dst)
+            else:
+                np.copyto(dst, audio, casting="same_kind")
+            inputs.append(pinned[offset : offset + n])
+            offset += n
+        return inputs
+
+    def _pinned_slice(self, audio: np.ndarray) -> Any | None:
+        """Return the tensor slice backing *audio* if it is a view of a pinned buffer."""
+        if self._pinned_np is None or audio.dtype != np.float32 or not audio.flags.c_contiguous:
+            return None
+        for tensor, host in [(self._pinned, self._pinned_np), *self._staging]:
+            byte_offset = audio.ctypes.data - host.ctypes.data
+            start, rem = divmod(byte_offset, host.itemsize)
+            if not rem and 0 <= start and start + audio.size <= host.size:
+                return tensor[start : start + audio.size]
+        return None
 
     def unload_model(self) -> None:  # noqa: D401 – imperative API
         """Free GPU/CPU memory by discarding the loaded model.
@@ -128,6 +716,9 @@ class TranscriptionEngine:  # pylint: disable=too-many-public-methods
         if self.model is None:
             return  # Already unloaded – idempotent
 
+        self._encoder_graphs.clear()  # graphs pin the model's activations
+        self._onnx_session = None  # re-created from the on-disk cache on load
+        self._direct = False
         # Drop the strong reference first so Python can reclaim memory.
         _tmp = self.model
         self.model = None
@@ -146,11 +737,32 @@ class TranscriptionEngine:  # pylint: disable=too-many-public-methods
     # Public inference APIs
     # ------------------------------------------------------------------
 
-    def get_plain_transcription(self, audio: np.ndarray) -> str:
-        """Return best-guess transcript as a plain string."""
+    def get_plain_transcription(self, audio: np.ndarray, *, legacy: bool = False) -> str:
+        """Return best-guess transcript as a plain string.
+
+        The fastest available path wins: ONNX encoder, captured encoder
+        graph, then the direct preprocessor → encoder → decoder calls.
+        ``legacy=True`` (and any path failure) uses ``model.transcribe()``.
+        """
         self._ensure_model_loaded()
         try:
-            preds = self.model.transcribe(audio=[audio], batch_size=1)  # type: ignore[attr-defined]
+            with self._pinned_lock:
+                if not legacy:
+                    if self._onnx_session is not None:
+                        texts = self._transcribe_with_onnx([audio])
+                        if texts is not None:
+                            return texts[0]
+                    if self._encoder_graphs:
+                        text = self._transcribe_with_graph(audio)
+                        if text is not None:
+                            return text
+                    if self._direct:
+                        texts = self._transcribe_direct([audio])
+                        if texts is not None:
+                            return texts[0]
+                inputs = self._to_model_inputs([audio])
+                with self._inference_context():
+                    preds = self.model.transcribe(audio=inputs, batch_size=1)  # type: ignore[attr-defined]
             return preds[0] if preds else ""
         except RuntimeError as exc:
             # Intercept CUDA OOM and similar issues – surface as regular Exception
@@ -158,12 +770,46 @@ class TranscriptionEngine:  # pylint: disable=too-many-public-methods
                 raise TranscriptionError("cuda_oom", "CUDA out of memory during inference")
             raise
 
+    def get_plain_transcription_batch(self, audios: Sequence[np.ndarray], *, legacy: bool = False) -> List[str]:
+        """Return one plain transcript per clip in *audios* – a single model call.
+
+        Batching amortises kernel-launch overhead across requests; clips are
+        zero-padded and masked by length.  Uses the ONNX encoder (the INT8
+        graph on CPU-only hosts), then the direct call path unless
+        ``legacy=True`` (or both fail), else ``model.transcribe()``.
+        """
+        self._ensure_model_loaded()
+        if not audios:
+            return []
+        try:
+            with self._pinned_lock:
+                if not legacy:
+                    if self._onnx_session is not None:
+                        texts = self._transcribe_with_onnx(audios)
+                        if texts is not None:
+                            return texts
+                    if self._direct:
+                        texts = self._transcribe_direct(audios)
+                        if texts is not None:
+                            return texts
+                inputs = self._to_model_inputs(audios)
+                with self._inference_context():
+                    preds = self.model.transcribe(audio=inputs, batch_size=len(audios))  # type: ignore[attr-defined]
+        except RuntimeError as exc:
+            if "CUDA out of memory" in str(exc):
+                raise TranscriptionError("cuda_oom", "CUDA out of memory during inference")
+            raise
+        if len(preds) != len(audios):
+            raise RuntimeError(f"Model returned {len(preds)} results for {len(audios)} clips")
+        return list(preds)
+
     def get_detailed_transcription(self, audio: np.ndarray) -> Tuple[str, Any]:
         """Return transcript plus word-level timestamps (if supported)."""
         self._ensure_model_loaded()
-        preds = self.model.transcribe(  # type: ignore[attr-defined]
-            audio=[audio], batch_size=1, timestamps=True
-        )
+        with self._inference_context():
+            preds = self.model.transcribe(  # type: ignore[attr-defined]
+                audio=[audio], batch_size=1, timestamps=True
+            )
         if not preds:
             return "", []
         first = preds[0]
@@ -219,37 +865,327 @@ class TranscriptionError(Exception):  # pylint: disable=too-few-public-methods
 # ---------------------------------------------------------------------------
 
 import multiprocessing as _mp
-from ipc.messages import Shutdown, Transcribe, Response, UnloadModel, LoadModel  # noqa: E402 – avoid circular at top
+from ipc.messages import (  # noqa: E402 – avoid circular at top
+    Message,
+    Shutdown,
+    Transcribe,
+    Response,
+    UnloadModel,
+    LoadModel,
+)
 from ipc.queue_wrapper import IPCQueue  # noqa: E402
 
+#: Upper bound on *Transcribe* requests coalesced into one model call
+_MAX_BATCH = 8
+
+#: Clips at least this large travel via shared memory instead of pickled bytes
+_SHM_MIN_BYTES = 64 * 1024
+
+#: Shared audio ring set up by ``TranscriptionWorker.start`` – slot size
+#: (60 s @ 16 kHz, 16-bit) and count.  Larger clips, or any clip while every
+#: slot is busy, use a one-off shared-memory block instead.
+_RING_SLOT_BYTES = 60 * 16_000 * 2
+_RING_SLOTS = 8
+
+
+class _AudioRing:
+    """Caller-side pool of fixed-size PCM slots in one shared-memory block.
+
+    Creating, mapping and unlinking a block per request costs several
+    syscalls; the ring is mapped once per worker and slots are recycled.
+    """
+
+    def __init__(self, *, slots: int = _RING_SLOTS, slot_bytes: int = _RING_SLOT_BYTES) -> None:
+        self.slot_bytes = slot_bytes
+        self._shm = SharedMemory(create=True, size=slots * slot_bytes)
+        self._free = list(range(slots))
+        self._lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def try_write(self, audio_pcm: bytes) -> int | None:
+        """Copy *audio_pcm* into a free slot and return it (*None* if none fits)."""
+        if len(audio_pcm) > self.slot_bytes:
+            return None
+        with self._lock:
+            if not self._free:
+                return None
+            slot = self._free.pop()
+        start = slot * self.slot_bytes
+        self._shm.buf[start : start + len(audio_pcm)] = audio_pcm
+        return slot
+
+    def release(self, slot: int) -> None:
+        """Return *slot* to the pool once the worker has answered for it.
+
+        Releasing a slot that is already free is a no-op, so a duplicate
+        release can never hand the same slot to two requests.
+        """
+        with self._lock:
+            if slot not in self._free:
+                self._free.append(slot)
+
+    def close(self) -> None:
+        """Unmap and unlink the block (the worker must be gone)."""
+        self._shm.close()
+        self._shm.unlink()
+
+
+class _AudioStager:
+    """Convert request PCM to normalised float32 in a reusable scratch arena.
+
+    Each clip is read straight from its message bytes or shared-memory block
+    and scaled into a slice of one float32 buffer – a single pass, with no
+    intermediate int16 copy and no per-request allocation.  Slices stay
+    valid until the next :meth:`stage` call.
+    """
+
+    #: Arenas above this size (10 min @ 16 kHz) are not kept between batches
+    _MAX_SCRATCH_SAMPLES = 16_000 * 600
+
+    def __init__(self, ring: SharedMemory | None = None, ring_slot_bytes: int = 0) -> None:
+        self._scratch = np.empty(0, dtype=np.float32)
+        self._ring = ring
+        self._ring_slot_bytes = ring_slot_bytes
+
+    def stage(self, batch: Sequence[Transcribe], arena: np.ndarray | None = None) -> List[np.ndarray | Exception]:
+        """Return one float32 view per message, or the error reading it.
 
-def _worker_process(request_q: _mp.Queue, response_q: _mp.Queue, *, use_stub: bool = False):
-    """Entry-point executed in the background *spawned* process."""
+        *arena* (e.g. :meth:`TranscriptionEngine.pinned_host_buffer`) is
+        written to instead of the private scratch when it is large enough.
+        """
+        sizes = [self._pcm_bytes(msg) // 2 for msg in batch]
+        total = sum(sizes)
+        scratch = self._scratch
+        if arena is not None and arena.size >= total:
+            scratch = arena
+        elif scratch.size < total:
+            scratch = np.empty(total, dtype=np.float32)
+            if total <= self._MAX_SCRATCH_SAMPLES:
+                self._scratch = scratch
+
+        staged: List[np.ndarray | Exception] = []
+        offset = 0
+        for msg, n in zip(batch, sizes):
+            dst = scratch[offset : offset + n]
+            offset += n
+            try:
+                self._copy_into(msg, dst)
+            except (OSError, ValueError) as exc:  # e.g. block already unlinked by a timed-out caller
+                staged.append(exc)
+            else:
+                staged.append(dst)
+        return staged
+
+    @staticmethod
+    def _pcm_bytes(msg: Transcribe) -> int:
+        if msg.ring_slot is not None or msg.shm_name is not None:
+            return msg.nbytes
+        return len(msg.audio)
+
+    def _copy_into(self, msg: Transcribe, dst: np.ndarray) -> None:
+        if msg.ring_slot is not None:
+            if self._ring is None:
+                raise ValueError("request refers to a shared audio ring but none is attached")
+            offset = msg.ring_slot * self._ring_slot_bytes
+            _pcm16_to_f32_into(np.frombuffer(self._ring.buf, dtype=np.int16, count=dst.size, offset=offset), dst)
+            return
+        if msg.shm_name is None:
+            _pcm16_to_f32_into(np.frombuffer(msg.audio, dtype=np.int16, count=dst.size), dst)
+            return
+        shm = SharedMemory(name=msg.shm_name)
+        try:
+            src = np.ndarray((dst.size,), dtype=np.int16, buffer=shm.buf)
+            _pcm16_to_f32_into(src, dst)
+            del src  # release the exported buffer before close()
+        finally:
+            shm.close()
+
+
+@dataclass(slots=True)
+class _StagedBatch:
+    """Requests dequeued by :class:`_Prefetcher` with their staged audio."""
+
+    batch: List[Transcribe]
+    staged: List[np.ndarray | Exception]
+    slot: int
+
+
+class _Prefetcher:
+    """Dequeue, batch and stage requests one step ahead of the GPU.
+
+    A daemon thread pulls from *request_q*, coalesces queued *Transcribe*
+    messages (up to ``_MAX_BATCH``) and converts their PCM into one of two
+    staging slots while the main thread is still transcribing the previous
+    batch.  A slot is reused only after :meth:`release` – classic double
+    buffering.  Other messages are forwarded in arrival order; the thread
+    exits after forwarding *Shutdown*.
+    """
+
+    _SLOTS = 2
+
+    def __init__(
+        self,
+        request_q: _mp.Queue,
+        engine: TranscriptionEngine,
+        *,
+        ring: SharedMemory | None = None,
+        ring_slot_bytes: int = 0,
+    ) -> None:
+        self._requests = request_q
+        self._ready: _queue.Queue[Any] = _queue.Queue(maxsize=self._SLOTS)
+        self._stagers = [_AudioStager(ring, ring_slot_bytes) for _ in range(self._SLOTS)]
+        arenas = engine.pinned_staging_buffers(self._SLOTS)
+        self._arenas: List[np.ndarray | None] = arenas if arenas else [None] * self._SLOTS
+        self._free = [threading.Semaphore(1) for _ in range(self._SLOTS)]
+        self._thread = threading.Thread(target=self._run, name="TranscriptionPrefetch", daemon=True)
+        self._thread.start()
+
+    def get(self) -> Any:
+        """Return the next :class:`_StagedBatch` or control message (blocking)."""
+        return self._ready.get()
+
+    def release(self, slot: int) -> None:
+        """Mark *slot* reusable once its batch has been transcribed."""
+        self._free[slot].release()
+
+    def _run(self) -> None:
+        deferred: Message | None = None
+        slot = 0
+        try:
+            while True:
+                if deferred is not None:
+                    msg, deferred = deferred, None
+                else:
+                    msg = self._requests.get()  # blocking – the main app owns the timeout
+                if not isinstance(msg, Transcribe):
+                    self._ready.put(msg)
+                    if isinstance(msg, Shutdown):
+                        return
+                    continue
+
+                batch = [msg]
+                while len(batch) < _MAX_BATCH:
+                    try:
+                        extra = self._requests.get_nowait()
+                    except _queue.Empty:
+                        break
+                    if not isinstance(extra, Transcribe):
+                        deferred = extra
+                        break
+                    batch.append(extra)
+
+                self._free[slot].acquire()  # wait until the GPU is done with it
+                staged = self._stagers[slot].stage(batch, arena=self._arenas[slot])
+                self._ready.put(_StagedBatch(batch, staged, slot))
+                slot = (slot + 1) % self._SLOTS
+        except Exception as exc:  # pragma: no cover – never leave the main loop hanging
+            logging.exception("Transcription prefetch thread failed: %s", exc)
+            self._ready.put(Shutdown(reason=f"prefetch failure: {exc}"))
+
+
+def _transcribe_batch(
+    engine: TranscriptionEngine,
+    batch: List[Transcribe],
+    staged_audio: List[np.ndarray | Exception],
+    response_q: _mp.Queue,
+) -> None:
+    """Transcribe *batch* in one model call and answer each request in order.
+
+    If the batched call fails (e.g. CUDA OOM on the larger batch) every clip
+    is retried on its own so one bad request cannot fail its neighbours.
+    """
+    audios: List[np.ndarray] = []
+    ready: List[Transcribe] = []
+    for msg, staged in zip(batch, staged_audio):
+        if isinstance(staged, Exception):
+            logging.error("Could not read audio for request %d: %s", msg.request_id, staged)
+            response_q.put(
+                Response(result=EngineResponse(ok=False, payload={"error": str(staged)}), request_id=msg.request_id)
+            )
+            continue
+        ready.append(msg)
+        audios.append(staged)
+    batch = ready
+
+    if len(batch) > 1:
+        try:
+            texts = engine.get_plain_transcription_batch(audios)
+        except Exception as exc:  # pylint: disable=broad-except – retry one by one
+            logging.warning("Batched transcription of %d clips failed (%s) – retrying singly", len(batch), exc)
+        else:
+            for msg, text in zip(batch, texts):
+                response_q.put(Response(result=EngineResponse(ok=True, payload=text), request_id=msg.request_id))
+            return
+
+    for msg, audio_np in zip(batch, audios):
+        try:
+            text = engine.get_plain_transcription(audio_np)
+            response_q.put(Response(result=EngineResponse(ok=True, payload=text), request_id=msg.request_id))
+        except Exception as exc:  # pylint: disable=broad-except – robustness
+            logging.exception("Transcription failed: %s", exc)
+            response_q.put(
+                Response(result=EngineResponse(ok=False, payload={"error": str(exc)}), request_id=msg.request_id)
+            )
+
+
+def _worker_process(
+    request_q: _mp.Queue,
+    response_q: _mp.Queue,
+    *,
+    use_stub: bool = False,
+    onnx_cache_dir: str | None = None,
+    ring_name: str | None = None,
+    ring_slot_bytes: int = 0,
+):
+    """Entry-point executed in the background *spawned* process.
+
+    A :class:`_Prefetcher` thread dequeues, batches and stages requests
+    while this thread keeps the GPU busy: queued *Transcribe* requests (up
+    to ``_MAX_BATCH``) are transcribed in a single batched model call, and
+    other messages are handled in arrival order.  *ring_name* names the
+    caller's :class:`_AudioRing`, mapped once for the worker's lifetime.
+    """
 
     engine = TranscriptionEngine()
+    _precompile_pcm_kernel()
     try:
-        engine.load_model(use_stub=use_stub)
+        engine.load_model(use_stub=use_stub, onnx_cache_dir=onnx_cache_dir)
     except Exception as exc:  # pragma: no cover – propagate fatal load failure
         logging.critical("Transcription worker failed to start: %s", exc)
         response_q.put(Response(result=EngineResponse(ok=False, payload={"error": str(exc)})))
         return
 
+    ring = SharedMemory(name=ring_name) if ring_name else None
+    try:
+        prefetcher = _Prefetcher(request_q, engine, ring=ring, ring_slot_bytes=ring_slot_bytes)
+        _serve(engine, prefetcher, response_q, use_stub=use_stub, onnx_cache_dir=onnx_cache_dir)
+    finally:
+        if ring is not None:
+            ring.close()
+
+
+def _serve(
+    engine: TranscriptionEngine,
+    prefetcher: _Prefetcher,
+    response_q: _mp.Queue,
+    *,
+    use_stub: bool,
+    onnx_cache_dir: str | None,
+) -> None:
+    """Main loop of :func:`_worker_process` – runs until *Shutdown*."""
     while True:
-        msg = request_q.get()  # blocking – the main app owns the timeout
+        msg = prefetcher.get()
         if isinstance(msg, Shutdown):
             logging.info("Transcription worker shutting down (%s)", msg.reason)
             break
-        if isinstance(msg, Transcribe):
+        if isinstance(msg, _StagedBatch):
             try:
-                # Convert raw 16-bit PCM bytes → NumPy array for the engine
-                audio_np = np.frombuffer(msg.audio, dtype=np.int16)
-                text = engine.get_plain_transcription(audio_np)
-                response_q.put(Response(result=EngineResponse(ok=True, payload=text)))
-            except Exception as exc:  # pylint: disable=broad-except – robustness
-                logging.exception("Transcription failed: %s", exc)
-                response_q.put(
-                    Response(result=EngineResponse(ok=False, payload={"error": str(exc)}))
-                )
+                _transcribe_batch(engine, msg.batch, msg.staged, response_q)
+            finally:
+                prefetcher.release(msg.slot)
         elif isinstance(msg, UnloadModel):
             try:
                 engine.unload_model()
@@ -263,7 +1199,7 @@ def _worker_process(request_q: _mp.Queue, response_q: _mp.Queue, *, use_stub: bo
                 )
         elif isinstance(msg, LoadModel):
             try:
-                engine.load_model(use_stub=use_stub)
+                engine.load_model(use_stub=use_stub, onnx_cache_dir=onnx_cache_dir)
                 response_q.put(
                     Response(result=EngineResponse(ok=True, payload={"state": "loaded"}))
                 )
@@ -277,8 +1213,10 @@ def _worker_process(request_q: _mp.Queue, response_q: _mp.Queue, *, use_stub: bo
 class TranscriptionWorker:
     """Facade managing the background worker process."""
 
-    def __init__(self, *, use_stub: bool = False):
+    def __init__(self, *, use_stub: bool = False, onnx_cache_dir: str | None = None):
         self._use_stub = use_stub
+        self._onnx_cache_dir = onnx_cache_dir  # see TranscriptionEngine.load_model
+        self._ring: _AudioRing | None = None  # created by start()
 
         # *Optimization for test environments*: when running in *stub* mode we
         # avoid the expensive Windows **multiprocessing spawn** overhead by
@@ -297,6 +1235,18 @@ class TranscriptionWorker:
             self._responses: IPCQueue[Any] = IPCQueue()
             self._proc: _mp.Process | None = None
 
+        # Several threads (e.g. *BatchTranscriber*) may wait on the shared
+        # response queue at once.  One of them reads at a time; responses
+        # meant for another waiter are parked in ``_parked`` by request id.
+        # Requests whose caller timed out are tracked in ``_abandoned`` (with
+        # their ring and slot, if any) so a late response is dropped, not
+        # parked, and the slot goes back to the ring it was taken from.
+        self._request_ids = itertools.count(1)
+        self._response_cond = threading.Condition()
+        self._parked: dict[int | None, Any] = {}
+        self._abandoned: dict[int, tuple[_AudioRing, int] | None] = {}
+        self._receiving = False
+
     # ------------------------------------------------------------------
     # Public helpers
     # ------------------------------------------------------------------
@@ -313,11 +1263,18 @@ class TranscriptionWorker:
             logging.debug("Worker already running – start() ignored")
             return
 
+        if self._ring is None:
+            self._ring = _AudioRing()
         ctx = _mp.get_context("spawn")
         self._proc = ctx.Process(
             target=_worker_process,
             args=(self._requests.raw, self._responses.raw),
-            kwargs={"use_stub": False},
+            kwargs={
+                "use_stub": False,
+                "onnx_cache_dir": self._onnx_cache_dir,
+                "ring_name": self._ring.name,
+                "ring_slot_bytes": self._ring.slot_bytes,
+            },
         )
         self._proc.start()
         logging.info("Transcription worker process started (pid=%d)", self._proc.pid)
@@ -338,28 +1295,77 @@ class TranscriptionWorker:
         if self._proc.is_alive():
             self._proc.kill()
         self._proc = None
+        with self._response_cond:
+            # The old process will never answer – its slots die with the ring.
+            self._abandoned.clear()
+        if self._ring is not None:
+            self._ring.close()
+            self._ring = None
         logging.info("Transcription worker stopped")
 
-    def transcribe(self, audio_pcm: bytes, *, timeout: float | None = 30) -> EngineResponse:
+    def transcribe(
+        self,
+        audio_pcm: bytes | SharedMemory,
+        *,
+        timeout: float | None = 30,
+        nbytes: int | None = None,
+    ) -> EngineResponse:
         """Synchronous convenience wrapper – transcribe audio and return result.
 
         In *inline stub* mode we bypass IPC entirely for speed; otherwise the
         call is proxied to the background worker process via the request
         queue and blocks until a response is received or *timeout* expires.
+
+        *audio_pcm* may also be a caller-owned :class:`SharedMemory` block
+        holding *nbytes* of PCM (default: the whole block); only its name is
+        sent to the worker.  Large ``bytes`` payloads are staged through a
+        temporary block automatically.
         """
 
         if self._use_stub:
             assert self._inline_engine is not None  # for type checker
             try:
+                if isinstance(audio_pcm, SharedMemory):
+                    audio_pcm = bytes(audio_pcm.buf[: audio_pcm.size if nbytes is None else nbytes])
                 audio_np = np.frombuffer(audio_pcm, dtype=np.int16)
                 text = self._inline_engine.get_plain_transcription(audio_np)
                 return EngineResponse(ok=True, payload=text)
             except Exception as exc:  # pragma: no cover – stub path safety
                 return EngineResponse(ok=False, payload={"error": str(exc)})
 
-        self._requests.put(Transcribe(audio=audio_pcm))
-        resp: Response[EngineResponse] = self._responses.get(timeout=timeout)
-        return resp.result
+        request_id = next(self._request_ids)
+        if isinstance(audio_pcm, SharedMemory):
+            size = audio_pcm.size if nbytes is None else nbytes
+            msg = Transcribe(audio=b"", request_id=request_id, shm_name=audio_pcm.name, nbytes=size)
+            self._requests.put(msg)
+            resp: Response[EngineResponse] = self._await_response(request_id, timeout)
+            return resp.result
+
+        if len(audio_pcm) < _SHM_MIN_BYTES:
+            self._requests.put(Transcribe(audio=audio_pcm, request_id=request_id))
+            resp = self._await_response(request_id, timeout)
+            return resp.result
+
+        ring = self._ring
+        slot = ring.try_write(audio_pcm) if ring is not None else None
+        if ring is not None and slot is not None:
+            msg = Transcribe(audio=b"", request_id=request_id, ring_slot=slot, nbytes=len(audio_pcm))
+            self._requests.put(msg)
+            # On timeout the slot stays reserved until the late response arrives
+            resp = self._await_response(request_id, timeout, ring=ring, ring_slot=slot)
+            ring.release(slot)
+            return resp.result
+
+        shm = SharedMemory(create=True, size=len(audio_pcm))
+        try:
+            shm.buf[: len(audio_pcm)] = audio_pcm
+            msg = Transcribe(audio=b"", request_id=request_id, shm_name=shm.name, nbytes=len(audio_pcm))
+            self._requests.put(msg)
+            resp = self._await_response(request_id, timeout)
+            return resp.result
+        finally:
+            shm.close()
+            shm.unlink()
 
     # ------------------------------------------------------------------
     # VRAM toggle helpers (Task 11)
@@ -379,7 +1385,7 @@ class TranscriptionWorker:
         from ipc.messages import UnloadModel  # local import avoids circularity
 
         self._requests.put(UnloadModel())
-        resp: Response[EngineResponse] = self._responses.get(timeout=timeout)
+        resp: Response[EngineResponse] = self._await_response(None, timeout)
         return resp.result
 
     def load_model(self, *, timeout: float | None = 120) -> EngineResponse:
@@ -396,9 +1402,69 @@ class TranscriptionWorker:
         from ipc.messages import LoadModel  # local import avoids circularity
 
         self._requests.put(LoadModel())
-        resp: Response[EngineResponse] = self._responses.get(timeout=timeout)
+        resp: Response[EngineResponse] = self._await_response(None, timeout)
         return resp.result
 
+    # ------------------------------------------------------------------
+    # Response routing
+    # ------------------------------------------------------------------
+
+    def _await_response(
+        self,
+        request_id: int | None,
+        timeout: float | None,
+        *,
+        ring: _AudioRing | None = None,
+        ring_slot: int | None = None,
+    ) -> Response[Any]:
+        """Return the response for *request_id* (*None* = model load/unload).
+
+        Raises :class:`TimeoutError` once *timeout* seconds have elapsed; the
+        request is then marked abandoned and *ring_slot* of *ring* (if any)
+        is only released when its late response turns up.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._response_cond:
+                while request_id not in self._parked and self._receiving:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        self._abandon(request_id, ring, ring_slot)
+                        raise TimeoutError("Timed out while waiting for item from IPCQueue")
+                    self._response_cond.wait(remaining)
+                if request_id in self._parked:
+                    return self._parked.pop(request_id)
+                self._receiving = True
+
+            # This thread is now the reader until it gets one response.
+            try:
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                resp = self._responses.get(timeout=remaining)
+            except TimeoutError:
+                with self._response_cond:
+                    self._abandon(request_id, ring, ring_slot)
+                raise
+            finally:
+                with self._response_cond:
+                    self._receiving = False
+                    self._response_cond.notify_all()
+            if resp.request_id == request_id:
+                return resp
+            with self._response_cond:
+                if resp.request_id not in self._abandoned:
+                    self._parked[resp.request_id] = resp
+                    self._response_cond.notify_all()
+                    continue
+                stale = self._abandoned.pop(resp.request_id)
+            if stale is not None:
+                stale_ring, stale_slot = stale
+                stale_ring.release(stale_slot)  # a closed ring's free list is simply unused
+
+    def _abandon(self, request_id: int | None, ring: _AudioRing | None, ring_slot: int | None) -> None:
+        """Remember that nobody waits for *request_id* any more (lock held)."""
+        if request_id is not None:
+            self._abandoned[request_id] = None if ring is None or ring_slot is None else (ring, ring_slot)
+
     # ------------------------------------------------------------------
     # Context-manager helpers
     # ------------------------------------------------------------------
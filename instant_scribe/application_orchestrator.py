@@ -21,7 +21,7 @@ import threading
 import traceback
 from pathlib import Path
 from types import TracebackType
-from typing import Any, Type
+from typing import Any, Callable, Type
 import importlib
 
 # --- Local project imports --------------------------------------------------
@@ -55,12 +55,14 @@ class _ConfigKeyAdapter:  # pylint: disable=too-few-public-methods
     :class:`instant_scribe.config_manager.ConfigManager` instance but maps the
     requested key to an alternative (e.g. *model_hotkey*).  This avoids any
     changes to the `HotkeyManager` implementation while still supporting
-    multiple distinct hotkey bindings.
+    multiple distinct hotkey bindings.  *on_reload* is invoked after every
+    reload so other components can pick up the fresh values.
     """
 
-    def __init__(self, base_cfg: ConfigManager, mapped_key: str):
+    def __init__(self, base_cfg: ConfigManager, mapped_key: str, on_reload: Callable[[], None] | None = None):
         self._cfg = base_cfg
         self._key = mapped_key
+        self._on_reload = on_reload
 
     # -- Dict-like interface expected by HotkeyManager ------------------
     def get(self, key, default=None):  # noqa: D401 – signature match
@@ -76,6 +78,16 @@ class _ConfigKeyAdapter:  # pylint: disable=too-few-public-methods
 
     def reload(self):  # noqa: D401 – proxy
         self._cfg.reload()
+        if self._on_reload is not None:
+            self._on_reload()
+
+    @property
+    def config_path(self):  # noqa: D401 – proxy
+        return self._cfg.config_path
+
+    @property
+    def mtime_ns(self):  # noqa: D401 – proxy
+        return self._cfg.mtime_ns
 
 
 class ApplicationOrchestrator:  # pylint: disable=too-many-instance-attributes
@@ -125,10 +137,12 @@ class ApplicationOrchestrator:  # pylint: disable=too-many-instance-attributes
             on_speech_start=self._on_speech_start,
             on_speech_end=self._on_speech_end,
         )
-        self.hotkey_manager = _safe_init(HotkeyManagerCls, self.config, on_activate=self._toggle_listening)
+        # Hotkey reloads re-read the config file – propagate the new values.
+        hotkey_cfg_adapter = _ConfigKeyAdapter(self.config, "hotkey", on_reload=self._on_config_reloaded)
+        self.hotkey_manager = _safe_init(HotkeyManagerCls, hotkey_cfg_adapter, on_activate=self._toggle_listening)
 
         # VRAM toggle hotkey (Ctrl+Alt+F6)
-        vram_cfg_adapter = _ConfigKeyAdapter(self.config, "model_hotkey")
+        vram_cfg_adapter = _ConfigKeyAdapter(self.config, "model_hotkey", on_reload=self._on_config_reloaded)
         self.vram_hotkey_manager = _safe_init(
             HotkeyManagerCls,
             vram_cfg_adapter,
@@ -136,7 +150,7 @@ class ApplicationOrchestrator:  # pylint: disable=too-many-instance-attributes
         )
 
         # Task 25 – Pause / Resume workflow -----------------------------
-        pause_cfg_adapter = _ConfigKeyAdapter(self.config, "pause_hotkey")
+        pause_cfg_adapter = _ConfigKeyAdapter(self.config, "pause_hotkey", on_reload=self._on_config_reloaded)
         self.pause_hotkey_manager = _safe_init(
             HotkeyManagerCls,
             pause_cfg_adapter,
@@ -309,9 +323,34 @@ class ApplicationOrchestrator:  # pylint: disable=too-many-instance-attributes
         except Exception:
             pass
 
+        # Deliver queued transcription toasts / clipboard copies.
+        try:
+            self.notification_manager.close(timeout=2)
+        except Exception:  # pragma: no cover – best-effort (stubs lack close)
+            pass
+
+        # Persist debounced config writes (e.g. *paused*) before exit.
+        try:
+            self.config.flush()
+        except Exception:  # pragma: no cover – best-effort
+            pass
+
         self._is_running = False
         self._log.info("Shutdown complete")
 
+    # .................................................................
+    def reload_config(self) -> None:  # noqa: D401 – imperative API
+        """Re-read the config file and apply it to components caching values."""
+        self.config.reload()
+        self._on_config_reloaded()
+
+    def _on_config_reloaded(self) -> None:
+        """Propagate freshly reloaded config values (hotkey / explicit reloads)."""
+        try:
+            self.gpu_monitor.refresh_config()
+        except Exception as exc:  # pylint: disable=broad-except
+            self._log.debug("GPU monitor config refresh failed: %s", exc)
+
     # ------------------------------------------------------------------
     # UI callbacks & internal handlers
     # ------------------------------------------------------------------
@@ -417,6 +456,7 @@ class ApplicationOrchestrator:  # pylint: disable=too-many-instance-attributes
                     resp = self.worker.unload_model(timeout=30)
                     if resp.ok:
                         self._model_loaded = False
+                        self.gpu_monitor.on_model_unloaded()
                         self.notification_manager.show_model_state("unloaded")
                         self._log.info("ASR model unloaded from VRAM")
                     else:
@@ -429,6 +469,7 @@ class ApplicationOrchestrator:  # pylint: disable=too-many-instance-attributes
                     resp = self.worker.load_model(timeout=120)
                     if resp.ok:
                         self._model_loaded = True
+                        self.gpu_monitor.on_model_loaded()
                         self.notification_manager.show_model_state("loaded")
                         if hasattr(self.tray_app, "update_vram_badge"):
                             try:
@@ -496,6 +537,7 @@ class ApplicationOrchestrator:  # pylint: disable=too-many-instance-attributes
                 resp = self.worker.unload_model(timeout=30)
                 if resp.ok:
                     self._model_loaded = False
+                    self.gpu_monitor.on_model_unloaded()
                     # Reuse existing notification helper for consistency.
                     self.notification_manager.show_model_state("unloaded")
                     # Tray badge helper is *optional* (stubbed in unit-tests)
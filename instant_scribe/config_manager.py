@@ -1,11 +1,44 @@
-import json
-import logging
+"""Instant Scribe flavour of :class:`InstanceScrubber.config_manager.ConfigManager`.
+
+Loading, type coercion, the parse cache and the debounced atomic saves all
+live in the core module; this subclass only contributes its own defaults
+and the platform-specific config location.
+"""
+
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Optional, Tuple
+
+from InstanceScrubber.config_manager import ConfigManager as _CoreConfigManager
+
+
+@lru_cache(maxsize=8)
+def _compute_config_path(
+    app_name: str,
+    filename: str,
+    appdata: Optional[str],
+    xdg_config_home: Optional[str],
+    _home_env: Optional[str],  # cache-key only – expanduser("~") derives from it
+) -> Path:
+    """Return the config file path for the given environment snapshot.
+
+    Every relevant environment variable is part of the cache key, so a
+    changed environment yields a fresh entry.
+    """
+    # Plain string joins – a single Path is built at the end.
+    if os.name == "nt":
+        # Use %APPDATA% on Windows.
+        base_dir = appdata if appdata is not None else os.path.expanduser("~")
+    else:
+        # Fallback to XDG spec on *nix; ~/.config otherwise.
+        base_dir = xdg_config_home if xdg_config_home is not None else os.path.join(os.path.expanduser("~"), ".config")
+
+    return Path(os.path.join(base_dir, app_name.replace(" ", "_"), filename))
 
 
-class ConfigManager:
+class ConfigManager(_CoreConfigManager):
     """Simple JSON-backed configuration loader / saver.
 
     The config file is stored in the user-specific application data directory.
@@ -13,8 +46,6 @@ class ConfigManager:
     back to ~/.config.
     """
 
-    _FILENAME = "config.json"
-
     #: Default configuration values shipped with Instant Scribe.
     DEFAULTS: Dict[str, Any] = {
         "hotkey": "ctrl+alt+f",
@@ -32,82 +63,17 @@ class ConfigManager:
         "paused": False,
     }
 
-    def __init__(self, app_name: str = "Instant Scribe") -> None:
-        self.app_name = app_name
-        self._config_path: Path = self._resolve_config_path()
-        self.settings: Dict[str, Any] = {}
-        self._load()
-
-    # ---------------------------------------------------------------------
-    # Public helpers
-    # ---------------------------------------------------------------------
-    def get(self, key: str, default: Optional[Any] = None) -> Any:
-        """Return the configuration value for *key*, or *default* if missing."""
-        return self.settings.get(key, default)
+    _DEFAULTS_PROXY = MappingProxyType(DEFAULTS)
 
-    def set(self, key: str, value: Any, *, auto_save: bool = True) -> None:
-        """Set *key* to *value*. Optionally persist immediately."""
-        self.settings[key] = value
-        if auto_save:
-            self._save()
+    #: Separate parse cache – entries are materialised from *these* defaults.
+    _CACHE: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any], bytes]] = {}
 
-    def reload(self) -> None:
-        """Force reload configuration from disk, discarding local changes."""
-        self._load()
-
-    # ------------------------------------------------------------------
-    # Implementation details
-    # ------------------------------------------------------------------
     def _resolve_config_path(self) -> Path:
-        """Compute platform-appropriate path for the JSON config."""
-        if os.name == "nt":
-            # Use %APPDATA% on Windows.
-            base_dir = Path(os.environ.get("APPDATA", Path.home()))
-        else:
-            # Fallback to XDG spec on *nix; ~/.config otherwise.
-            base_dir = Path(os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config"))
-
-        path = base_dir / self.app_name.replace(" ", "_") / self._FILENAME
-        return path
-
-    def _load(self) -> None:
-        """Load settings from disk, creating the file with defaults if absent."""
-        try:
-            if self._config_path.exists():
-                with self._config_path.open("r", encoding="utf-8") as fh:
-                    self.settings = json.load(fh)
-            else:
-                self.settings = self.DEFAULTS.copy()
-                self._write_to_disk(self.settings)
-        except (json.JSONDecodeError, OSError) as exc:
-            logging.warning("Failed to load config – using defaults: %s", exc)
-            self.settings = self.DEFAULTS.copy()
-            # Attempt to overwrite the corrupted file with defaults.
-            try:
-                self._write_to_disk(self.settings)
-            except Exception as write_exc:
-                logging.error("Unable to write default config: %s", write_exc)
-
-    def _save(self) -> None:
-        """Persist current *settings* to disk."""
-        self._write_to_disk(self.settings)
-
-    def _write_to_disk(self, data: Dict[str, Any]) -> None:
-        self._config_path.parent.mkdir(parents=True, exist_ok=True)
-        with self._config_path.open("w", encoding="utf-8") as fh:
-            json.dump(data, fh, indent=4)
-
-    # ------------------------------------------------------------------
-    # Convenience dunder methods
-    # ------------------------------------------------------------------
-    def __getitem__(self, item: str) -> Any:  # dict-style access
-        return self.settings[item]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.set(key, value)
-
-    def __contains__(self, item: str) -> bool:
-        return item in self.settings
-
-    def __repr__(self) -> str:  # pragma: no cover
-        return f"<ConfigManager path={self._config_path!s} keys={list(self.settings.keys())}>" 
\ No newline at end of file
+        env = os.environ
+        return _compute_config_path(
+            self.app_name,
+            self._FILENAME,
+            env.get("APPDATA"),
+            env.get("XDG_CONFIG_HOME"),
+            env.get("USERPROFILE" if os.name == "nt" else "HOME"),
+        )
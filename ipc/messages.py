@@ -32,6 +32,20 @@ class Transcribe(Message):
     """Request for the worker to transcribe a buffer of audio."""
 
     audio: bytes  # Raw PCM or encoded audio buffer
+    request_id: int = 0
+    """Echoed back on the matching :class:`Response` so concurrent callers
+    can tell their results apart."""
+
+    shm_name: str | None = None
+    """Name of a :class:`multiprocessing.shared_memory.SharedMemory` block
+    holding the PCM instead of *audio* (large clips avoid the pickle copy)."""
+
+    ring_slot: int | None = None
+    """Slot of the worker's shared audio ring holding the PCM (see
+    ``TranscriptionWorker``); takes precedence over *shm_name*."""
+
+    nbytes: int = 0
+    """Number of valid PCM bytes in the *shm_name* block or *ring_slot*."""
 
 
 @dataclass(slots=True)
@@ -58,4 +72,7 @@ class Response(Generic[_T], Message):
     result: _T
     """Result payload – for a *Transcribe* request this will usually be the
     transcription text or richer metadata depending on the worker API.
-    """ 
\ No newline at end of file
+    """
+
+    request_id: int | None = None
+    """``Transcribe.request_id`` of the request answered; *None* otherwise.""" 
\ No newline at end of file
@@ -38,6 +38,7 @@ class _StubAudioStreamer:
 # 2. Stub HotkeyManager – no-op
 class _StubHotkey:
     def __init__(self, *_a, **_kw):  # noqa: D401 – stub
+        self.config = _a[0] if _a else None
         self.started = False
 
     def start(self):  # noqa: D401 – stub
@@ -224,4 +225,22 @@ def test_sys_excepthook_writes_crash_log(tmp_path, monkeypatch):
     log_file = Path("logs/crash.log")
     assert log_file.is_file()
     content = log_file.read_text(encoding="utf-8")
-    assert "ValueError" in content and "kaboom" in content 
\ No newline at end of file
+    assert "ValueError" in content and "kaboom" in content 
+
+def test_config_reload_refreshes_gpu_monitor(tmp_path, monkeypatch):
+    """Reloading the config (directly or via a hotkey reload) updates the GPU monitor."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("APPDATA", str(tmp_path))
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+
+    from instant_scribe.application_orchestrator import ApplicationOrchestrator
+
+    orch = ApplicationOrchestrator(use_stub_worker=True)
+
+    orch.config.set("vram_unload_threshold_mb", 2048, auto_save="immediate")
+    orch.reload_config()
+    assert orch.gpu_monitor._threshold_mb == 2048  # pylint: disable=protected-access
+
+    orch.config.set("gpu_monitor_interval_sec", 42, auto_save="immediate")
+    orch.vram_hotkey_manager.config.reload()
+    assert orch.gpu_monitor._interval == 42  # pylint: disable=protected-access
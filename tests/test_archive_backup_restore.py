@@ -72,11 +72,12 @@ def test_backup_then_restore_cycle(temp_archive_root: Path, tmp_path: Path):
         _create_dummy_wav(wav_path)
         manager.archive(wav_path=wav_path, transcription=f"Sample transcription {idx}")
 
-    # Capture original hashes
+    # Capture original hashes – the ``.cas`` store only holds hard links to the
+    # session recordings and is deliberately left out of the backup.
     original_hashes = {
         p.relative_to(temp_archive_root): _file_hash(p)
         for p in temp_archive_root.rglob("*")
-        if p.is_file()
+        if p.is_file() and ".cas" not in p.relative_to(temp_archive_root).parts
     }
     assert original_hashes, "Expected at least one file in archive"
 
@@ -119,4 +120,22 @@ def test_backup_then_restore_cycle(temp_archive_root: Path, tmp_path: Path):
     assert restored_hashes == original_hashes, (
         "Restored files differ from original.\n"
         f"Original: {len(original_hashes)} files, Restored: {len(restored_hashes)} files"
-    ) 
\ No newline at end of file
+    ) 
+
+def test_backup_stores_each_recording_once(tmp_path: Path):
+    """Deduplicated recordings appear once per session and never via ``.cas``."""
+    from zipfile import ZipFile
+
+    archive_root = tmp_path / "archive"
+    manager = ArchiveManager(base_dir=archive_root)
+    wav_path = tmp_path / "dummy.wav"
+    _create_dummy_wav(wav_path)
+    for idx in range(2):
+        manager.archive(wav_path=wav_path, transcription=f"Take {idx}")
+
+    zip_path = create_backup(archive_root, tmp_path / "backups")
+    with ZipFile(zip_path) as zf:
+        names = zf.namelist()
+
+    assert not [n for n in names if n.startswith(".cas/")]
+    assert len([n for n in names if n.endswith("recording.wav")]) == 2
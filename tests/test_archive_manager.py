@@ -1,3 +1,4 @@
+import os
 import tempfile
 from pathlib import Path
 
@@ -50,6 +51,35 @@ def test_session_folder_increment(temp_dir: Path):
     assert second_dir.name.startswith("2_")
 
 
+def test_session_index_not_reused_across_managers(temp_dir: Path):
+    """A second manager on the same root must not hand out an index the first already used."""
+    first = ArchiveManager(base_dir=temp_dir)
+    second = ArchiveManager(base_dir=temp_dir)
+    wav = temp_dir / "dummy.wav"
+    _create_dummy_wav(wav)
+
+    names = [
+        first.archive(wav_path=wav, transcription="one").name,
+        second.archive(wav_path=wav, transcription="two").name,
+        first.archive(wav_path=wav, transcription="three").name,
+        second.archive(wav_path=wav, transcription="four").name,
+    ]
+    assert [name.split("_", 1)[0] for name in names] == ["1", "2", "3", "4"]
+
+
+def test_transcript_uses_platform_line_endings(temp_dir: Path, monkeypatch):
+    """Transcripts keep the text-mode newline translation (CRLF on Windows)."""
+    import InstanceScrubber.archive_manager as archive_manager
+
+    monkeypatch.setattr(archive_manager, "_NEWLINE", "\r\n")
+    wav = temp_dir / "dummy.wav"
+    _create_dummy_wav(wav)
+
+    session_dir = ArchiveManager(base_dir=temp_dir).archive(wav_path=wav, transcription="line one\nline two")
+    txt = next(session_dir.glob("*.txt"))
+    assert txt.read_bytes() == b"line one\r\nline two"
+
+
 def test_transcription_filename_first_seven_words(temp_dir: Path):
     text = "The primary objective for the next quarter is increased"  # 9 words
     manager = ArchiveManager(base_dir=temp_dir)
@@ -93,4 +123,110 @@ def test_unicode_handling(temp_dir: Path):
     txt_files = list(session_dir.glob("*.txt"))
     assert len(txt_files) == 1
     # File exists and path is Unicode-capable
-    assert txt_files[0].exists(), "Unicode filename should be created successfully" 
\ No newline at end of file
+    assert txt_files[0].exists(), "Unicode filename should be created successfully" 
+
+def test_identical_recordings_are_deduplicated(temp_dir: Path):
+    manager = ArchiveManager(base_dir=temp_dir)
+    wav = temp_dir / "dummy.wav"
+    _create_dummy_wav(wav)
+
+    dir1 = manager.archive(wav_path=wav, transcription="First take")
+    dir2 = manager.archive(wav_path=wav, transcription="Second take")
+
+    blobs = [p for p in (temp_dir / ".cas").rglob("*") if p.is_file()]
+    assert len(blobs) == 1, "Identical audio should be stored only once"
+    assert (dir1 / "recording.wav").read_bytes() == wav.read_bytes()
+    assert (dir2 / "recording.wav").read_bytes() == wav.read_bytes()
+
+
+def test_deleting_sessions_reclaims_cas_blob_after_last_reference(temp_dir: Path):
+    manager = ArchiveManager(base_dir=temp_dir)
+    wav = temp_dir / "dummy.wav"
+    _create_dummy_wav(wav)
+
+    dir1 = manager.archive(wav_path=wav, transcription="First take")
+    dir2 = manager.archive(wav_path=wav, transcription="Second take")
+
+    # Blob is still referenced by the second session.
+    assert manager.delete_session(dir1) == 0
+    assert not dir1.exists()
+    assert len([p for p in (temp_dir / ".cas").rglob("*") if p.is_file()]) == 1
+
+    # Last reference gone – the blob (and its bucket) are removed.
+    assert manager.delete_session(dir2) == 1
+    assert not any(p.is_file() for p in (temp_dir / ".cas").rglob("*"))
+
+
+def test_prune_keeps_shared_blob_when_scandir_reports_no_links(temp_dir: Path, monkeypatch):
+    """``DirEntry.stat()`` reports ``st_nlink == 0`` on Windows – pruning must not trust it."""
+    import InstanceScrubber.archive_manager as archive_manager
+
+    manager = ArchiveManager(base_dir=temp_dir)
+    wav = temp_dir / "dummy.wav"
+    _create_dummy_wav(wav)
+    dir1 = manager.archive(wav_path=wav, transcription="First take")
+    dir2 = manager.archive(wav_path=wav, transcription="Second take")
+
+    class _WindowsEntry:
+        def __init__(self, entry):
+            self._entry = entry
+            self.name, self.path = entry.name, entry.path
+
+        def is_dir(self, follow_symlinks=True):
+            return self._entry.is_dir(follow_symlinks=follow_symlinks)
+
+        def stat(self, follow_symlinks=True):
+            return os.stat_result((0, 0, 0, 0, 0, 0, 0, 0, 0, 0))
+
+    real_scandir = os.scandir
+
+    class _Scandir:
+        def __init__(self, path):
+            self._it = real_scandir(path)
+
+        def __iter__(self):
+            return (_WindowsEntry(entry) for entry in self._it)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            self._it.close()
+
+    monkeypatch.setattr(archive_manager.os, "scandir", _Scandir)
+    assert manager.delete_session(dir1) == 0
+    monkeypatch.undo()
+
+    assert len([p for p in (temp_dir / ".cas").rglob("*.wav")]) == 1
+    assert (dir2 / "recording.wav").read_bytes() == wav.read_bytes()
+
+
+def test_store_recopies_blob_pruned_before_link(temp_dir: Path, monkeypatch):
+    """A blob pruned by another manager between copy-in and link is stored again."""
+    import InstanceScrubber.archive_manager as archive_manager
+
+    manager = ArchiveManager(base_dir=temp_dir)
+    other = ArchiveManager(base_dir=temp_dir)
+    wav = temp_dir / "dummy.wav"
+    _create_dummy_wav(wav)
+
+    real_link = os.link
+    calls = []
+
+    def _link_after_foreign_prune(src, dst):
+        if not calls:
+            calls.append(src)
+            assert other.prune_cas() == 1  # the unlinked fresh blob looks unreferenced
+        return real_link(src, dst)
+
+    monkeypatch.setattr(archive_manager.os, "link", _link_after_foreign_prune)
+    session_dir = manager.archive(wav_path=wav, transcription="Raced take")
+
+    assert (session_dir / "recording.wav").read_bytes() == wav.read_bytes()
+    assert not list((temp_dir / ".cas").rglob("*.tmp"))
+
+
+def test_delete_session_rejects_foreign_paths(temp_dir: Path):
+    manager = ArchiveManager(base_dir=temp_dir)
+    with pytest.raises(ValueError):
+        manager.delete_session(temp_dir / ".cas")
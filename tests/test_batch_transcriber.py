@@ -1,6 +1,8 @@
 import inspect
 import sys
+import threading
 import time
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from pathlib import Path
 
 import numpy as np
@@ -12,6 +14,7 @@ if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
 from InstanceScrubber.batch_transcriber import BatchTranscriber  # noqa: E402
+from InstanceScrubber.transcription_worker import EngineResponse  # noqa: E402
 
 
 @pytest.fixture()
@@ -36,4 +39,109 @@ def test_batch_transcriber_end_to_end(dummy_slice_bytes):
     assert full_text == "hello world hello world hello world"
 
     # Requirement: aggregated transcript available in < 3 s for a 30-min recording
-    assert duration < 3, f"Batch transcription too slow: {duration:.2f}s" 
\ No newline at end of file
+    assert duration < 3, f"Batch transcription too slow: {duration:.2f}s" 
+
+def _gated_transcribe(gate: threading.Event, texts: dict[bytes, str] | None = None):
+    """Return a fake *transcribe* that blocks until *gate* is set."""
+
+    def transcribe(audio_pcm: bytes) -> EngineResponse:
+        gate.wait(5)
+        return EngineResponse(ok=True, payload=(texts or {}).get(audio_pcm, "ok"))
+
+    return transcribe
+
+
+def test_submit_slice_applies_back_pressure():
+    """Once 2 × max_workers slices are in flight, submit_slice() blocks."""
+    gate = threading.Event()
+    with BatchTranscriber(use_stub=True, max_workers=1) as bt:
+        bt._worker.transcribe = _gated_transcribe(gate)
+        bt.submit_slice(b"a")
+        bt.submit_slice(b"b")
+
+        third = threading.Thread(target=bt.submit_slice, args=(b"c",))
+        third.start()
+        third.join(timeout=0.2)
+        assert third.is_alive(), "third slice should wait for a free slot"
+
+        gate.set()
+        third.join(timeout=5)
+        assert not third.is_alive()
+        assert bt.finalise(timeout_per_slice=5) == "ok ok ok"
+
+
+def test_submit_failure_releases_slot(monkeypatch):
+    """A slot taken for a slice whose submission raised is given back."""
+    with BatchTranscriber(use_stub=True, max_workers=1) as bt:
+        def _boom(*_args, **_kwargs):
+            raise RuntimeError("executor shut down")
+
+        monkeypatch.setattr(bt._executor, "submit", _boom)
+        for _ in range(3):  # more attempts than there are slots
+            with pytest.raises(RuntimeError):
+                bt.submit_slice(b"x")
+
+        assert bt._slots.acquire(blocking=False)
+        assert bt._slots.acquire(blocking=False)
+
+
+def test_finalise_orders_by_sequence_not_completion():
+    """A slow first slice does not reorder the transcript."""
+    slow = threading.Event()
+    with BatchTranscriber(use_stub=True, max_workers=2) as bt:
+        def transcribe(audio_pcm: bytes) -> EngineResponse:
+            if audio_pcm == b"first":
+                slow.wait(5)
+            return EngineResponse(ok=True, payload=audio_pcm.decode())
+
+        bt._worker.transcribe = transcribe
+        bt.submit_slice(b"first")
+        bt.submit_slice(b"second")
+        threading.Timer(0.1, slow.set).start()
+
+        assert bt.finalise(timeout_per_slice=5) == "first second"
+
+
+def test_finalise_times_out_on_stuck_slice():
+    """The overall deadline is timeout_per_slice × pending slices."""
+    gate = threading.Event()
+    with BatchTranscriber(use_stub=True, max_workers=1) as bt:
+        bt._worker.transcribe = _gated_transcribe(gate)
+        bt.submit_slice(b"stuck")
+        start = time.perf_counter()
+        with pytest.raises(FuturesTimeoutError):
+            bt.finalise(timeout_per_slice=0.1)
+        assert time.perf_counter() - start < 2
+        gate.set()
+
+
+def test_completed_slices_drop_their_futures():
+    """The done-callback moves each outcome into the results and frees the Future."""
+    with BatchTranscriber(use_stub=True, max_workers=1) as bt:
+        bt._worker.transcribe = lambda audio_pcm: EngineResponse(ok=True, payload="done")
+        bt.submit_slice(b"a")
+        bt._executor.submit(lambda: None).result(timeout=5)  # FIFO – slice finished
+
+        deadline = time.monotonic() + 5
+        while bt._futures and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert bt._futures == {}
+        assert bt._results == {0: "done"}
+
+
+def test_failed_slice_raises_on_finalise():
+    """An error response or exception for any slice surfaces from finalise()."""
+    with BatchTranscriber(use_stub=True, max_workers=1) as bt:
+        bt._worker.transcribe = lambda audio_pcm: EngineResponse(ok=False, payload="cuda_oom")
+        bt.submit_slice(b"a")
+        with pytest.raises(RuntimeError, match="cuda_oom"):
+            bt.finalise(timeout_per_slice=5)
+
+    with BatchTranscriber(use_stub=True, max_workers=1) as bt:
+        def _raise(audio_pcm: bytes) -> EngineResponse:
+            raise ValueError("bad audio")
+
+        bt._worker.transcribe = _raise
+        bt.submit_slice(b"a")
+        with pytest.raises(ValueError, match="bad audio"):
+            bt.finalise(timeout_per_slice=5)
@@ -30,7 +30,10 @@ class _FakePyperclipModule(types.ModuleType):  # pylint: disable=too-few-public-
 # Inject stub before importing SUT
 sys.modules["pyperclip"] = _FakePyperclipModule("pyperclip")
 
-from InstanceScrubber.clipboard_manager import copy_with_verification  # noqa: E402
+from InstanceScrubber.clipboard_manager import copy_with_verification, set_clipboard_backend  # noqa: E402
+
+# Bind explicitly in case *clipboard_manager* was imported before the stub.
+set_clipboard_backend(sys.modules["pyperclip"])
 
 
 # ---------------------------------------------------------------------------
@@ -95,6 +98,22 @@ def test_fallback_file_written(tmp_output_dir, monkeypatch):
     assert files[0].read_text(encoding="utf-8").startswith("some sample text")
 
 
+def test_fallback_preserves_whitespace(tmp_output_dir, monkeypatch):
+    """The fallback file must contain the payload verbatim – newlines included."""
+
+    monkeypatch.setattr(
+        sys.modules["pyperclip"],
+        "copy",
+        lambda _txt: (_ for _ in ()).throw(_FakePyperclipModule.PyperclipException("denied")),
+    )
+
+    payload = "first line\n\n  indented   second line\t"
+    assert copy_with_verification(payload, max_retries=1, fallback_dir=tmp_output_dir) is False
+
+    (written,) = tmp_output_dir.iterdir()
+    assert written.read_text(encoding="utf-8") == payload
+
+
 def test_large_payload_no_crash(monkeypatch):
     """Extremely large payloads should not crash the function."""
 
@@ -118,4 +137,51 @@ def test_large_payload_no_crash(monkeypatch):
     large_payload = _LazyHugeStr()
 
     # Should execute without raising MemoryError or similar.
-    copy_with_verification(large_payload, max_retries=1) 
\ No newline at end of file
+    copy_with_verification(large_payload, max_retries=1) 
+
+@pytest.mark.parametrize(
+    ("chars", "size", "expected"),
+    [
+        (16, 0, False),  # below the probe threshold – never probed
+        (1 << 20, None, False),  # size unknown – inconclusive
+        (1 << 20, 2 * ((1 << 20) + 1), False),  # exact UTF-16 size incl. terminator
+        (1 << 20, 4 * (1 << 20), False),  # block rounded up – still fine
+        (1 << 20, 2 * (1 << 20), True),  # no room for the terminator
+        (1 << 20, 10, True),  # clearly truncated
+    ],
+)
+def test_clipboard_too_small_decision(monkeypatch, chars, size, expected):
+    """The native size probe only rejects payloads that provably do not fit."""
+    from InstanceScrubber import clipboard_manager
+
+    monkeypatch.setattr(clipboard_manager, "_native_clipboard_enabled", True)
+    monkeypatch.setattr(clipboard_manager, "_native_clipboard_size", lambda: size)
+
+    assert clipboard_manager._clipboard_too_small("a" * chars) is expected
+
+
+def test_clipboard_too_small_skipped_for_stub_backend(monkeypatch):
+    """With an injected backend the native clipboard is never consulted."""
+    from InstanceScrubber import clipboard_manager
+
+    monkeypatch.setattr(clipboard_manager, "_native_clipboard_enabled", False)
+    monkeypatch.setattr(clipboard_manager, "_native_clipboard_size", lambda: 0)
+
+    assert clipboard_manager._clipboard_too_small("a" * (1 << 20)) is False
+
+
+def test_resetting_backend_restores_native_path():
+    """set_clipboard_backend(None) undoes an injected backend completely."""
+    from InstanceScrubber import clipboard_manager
+
+    stub = sys.modules["pyperclip"]
+    try:
+        set_clipboard_backend(None)
+        assert clipboard_manager._pyperclip is clipboard_manager._DEFAULT_BACKEND
+        assert clipboard_manager._native_clipboard_enabled is True
+
+        set_clipboard_backend(stub)
+        assert clipboard_manager._pyperclip is stub
+        assert clipboard_manager._native_clipboard_enabled is False
+    finally:
+        set_clipboard_backend(stub)
@@ -38,4 +38,105 @@ def test_save_load_round_trip(temp_appdata):
 
     # FINALLY, confirm on-disk JSON actually contains the mutated value for defence-in-depth
     data = json.loads(expected_path.read_text(encoding="utf-8"))
-    assert data["hotkey"] == "ctrl+shift+h" 
\ No newline at end of file
+    assert data["hotkey"] == "ctrl+shift+h" 
+
+def test_external_edit_invalidates_parse_cache(temp_appdata):
+    """A cached parse must not hide edits made to the file by another process."""
+    cm1 = ConfigManager(app_name="TestApp")
+    cm1.settings["hotkey"] = "unsaved"  # local mutation must not leak via the cache
+
+    path = Path(os.environ["APPDATA"]) / "TestApp" / "config.json"
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["hotkey"] = "ctrl+alt+external"
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+    assert ConfigManager(app_name="TestApp").get("hotkey") == "ctrl+alt+external"
+
+
+def test_set_burst_is_written_once(temp_appdata, monkeypatch):
+    """Consecutive auto-saved updates are coalesced into a single file write."""
+    cm = ConfigManager(app_name="TestApp")
+
+    writes = []
+    original = cm._write_to_disk
+    monkeypatch.setattr(cm, "_write_to_disk", lambda data: (writes.append(dict(data)), original(data)))
+
+    cm.set("hotkey", "ctrl+1")
+    cm.set("vad_aggressiveness", 3)
+    cm.set("show_notifications", False)
+    cm.flush()
+
+    assert len(writes) == 1
+    data = json.loads((Path(os.environ["APPDATA"]) / "TestApp" / "config.json").read_text(encoding="utf-8"))
+    assert (data["hotkey"], data["vad_aggressiveness"], data["show_notifications"]) == ("ctrl+1", 3, False)
+
+
+def test_saved_file_keeps_four_space_indent(temp_appdata):
+    """Saves keep the stdlib ``indent=4`` layout whatever JSON codec is installed."""
+    cm = ConfigManager(app_name="TestApp")
+    cm.set("hotkey", "ctrl+alt+i")
+    cm.flush()
+
+    text = (Path(os.environ["APPDATA"]) / "TestApp" / "config.json").read_text(encoding="utf-8")
+    assert text == json.dumps(json.loads(text), indent=4)
+
+
+def test_debounced_saves_share_one_flusher_thread(temp_appdata, monkeypatch):
+    """Many ``set()`` calls arm one background flusher, not a thread per call."""
+    import threading
+    import time
+
+    monkeypatch.setattr(ConfigManager, "_FLUSH_DELAY_SEC", 0.05)
+    cm = ConfigManager(app_name="TestApp")
+    other = ConfigManager(app_name="OtherApp")
+
+    before = threading.active_count()
+    for i in range(50):
+        cm.set("vad_aggressiveness", i % 4)
+        other.set("hotkey", f"ctrl+{i}")
+    assert threading.active_count() <= before + 1
+
+    deadline = time.monotonic() + 5
+    while any(t.name == "ConfigFlusher" for t in threading.enumerate()) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert ConfigManager(app_name="TestApp").get("vad_aggressiveness") == 49 % 4
+    assert ConfigManager(app_name="OtherApp").get("hotkey") == "ctrl+49"
+
+
+def test_instant_scribe_manager_shares_core_implementation(temp_appdata, monkeypatch):
+    """The ``instant_scribe`` flavour only swaps defaults on top of the core class."""
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(temp_appdata))
+    from instant_scribe.config_manager import ConfigManager as AppConfigManager
+
+    assert issubclass(AppConfigManager, ConfigManager)
+    cm = AppConfigManager(app_name="TestApp")
+    assert cm.get("pause_hotkey") == "ctrl+alt+c"
+
+
+def test_numeric_settings_coerced_on_load(temp_appdata):
+    """Hand-edited numeric strings are converted once; garbage falls back to defaults."""
+    path = Path(os.environ["APPDATA"]) / "TestApp" / "config.json"
+    path.parent.mkdir(parents=True)
+    path.write_text(
+        json.dumps({"gpu_monitor_interval_sec": "2.5", "vram_unload_threshold_mb": "oops"}),
+        encoding="utf-8",
+    )
+
+    cm = ConfigManager(app_name="TestApp")
+    assert cm.get("gpu_monitor_interval_sec") == 2.5
+    assert cm.get("vram_unload_threshold_mb") == ConfigManager.DEFAULTS["vram_unload_threshold_mb"]
+
+
+def test_unchanged_settings_not_rewritten(temp_appdata):
+    """Saving a value equal to the loaded one leaves the file untouched."""
+    ConfigManager(app_name="TestApp")  # creates the file with defaults
+    path = Path(os.environ["APPDATA"]) / "TestApp" / "config.json"
+    before = path.stat().st_mtime_ns
+
+    cm = ConfigManager(app_name="TestApp")
+    cm.set("hotkey", cm.get("hotkey"), auto_save="immediate")
+    assert path.stat().st_mtime_ns == before
+
+    cm.set("hotkey", "ctrl+alt+x", auto_save="immediate")
+    assert json.loads(path.read_text(encoding="utf-8"))["hotkey"] == "ctrl+alt+x"
@@ -1,4 +1,5 @@
 import inspect
+import os
 from pathlib import Path
 
 import pytest
@@ -101,4 +102,35 @@ def test_hotkey_conflict(monkeypatch):
     manager = HotkeyManager(cfg, lambda: None)
     assert manager.start() is False
     # No registrations should have succeeded
-    assert stub_keyboard.registered == [] 
\ No newline at end of file
+    assert stub_keyboard.registered == [] 
+
+def test_reload_skipped_while_config_file_untouched(monkeypatch, tmp_path):
+    """reload() only re-reads the config once the file's mtime moves."""
+    monkeypatch.setitem(sys.modules, "keyboard", _StubKeyboard())
+
+    cfg_file = tmp_path / "config.json"
+    cfg_file.write_text("{}")
+
+    class _FileConfig(_DummyConfig):
+        config_path = cfg_file
+
+        def __init__(self):
+            super().__init__()
+            self.reloads = 0
+            self.mtime_ns = cfg_file.stat().st_mtime_ns
+
+        def reload(self):
+            self.reloads += 1
+            self.mtime_ns = cfg_file.stat().st_mtime_ns
+
+    cfg = _FileConfig()
+    manager = HotkeyManager(cfg, lambda: None)
+    manager.start()
+
+    manager.reload()
+    assert cfg.reloads == 0
+
+    st = cfg_file.stat()
+    os.utime(cfg_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    manager.reload()
+    assert cfg.reloads == 1
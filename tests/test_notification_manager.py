@@ -66,6 +66,7 @@ def test_toast_shown_and_copied(_isolate_clipboard):
 
     sample_text = "Hello world"
     manager.show_transcription(sample_text)
+    assert manager.flush(timeout=5)
 
     # The fake toaster instance should have registered a single toast
     toaster: _FakeToaster = manager._toaster  # type: ignore[attr-defined]
@@ -84,6 +85,7 @@ def test_copy_disabled(_isolate_clipboard):
     manager = NotificationManager(app_name="TestApp")
 
     manager.show_transcription("No copy", copy_to_clipboard=False)
+    assert manager.flush(timeout=5)
 
     # Clipboard dict should remain empty
     assert "data" not in _isolate_clipboard
@@ -96,4 +98,50 @@ def test_no_toast_backend(monkeypatch):
     assert manager._toaster is None  # type: ignore[attr-defined]
 
     # Should execute silently without throwing.
-    manager.show_transcription("Hello") 
\ No newline at end of file
+    manager.show_transcription("Hello")
+    assert manager.flush(timeout=5) 
+
+def test_state_toast_reused():
+    """Successive model / pause state toasts mutate one shared Toast instance."""
+    manager = NotificationManager(app_name="TestApp")
+    manager._toaster = _FakeToaster("TestApp")  # type: ignore[attr-defined]
+
+    manager.show_model_state("loaded")
+    manager.show_pause_state(True)
+
+    first, second = manager._toaster.shown  # type: ignore[attr-defined]
+    assert first is second
+    assert second.text_fields == ["Instant Scribe", "Recording paused."]
+
+
+def test_burst_aggregated_into_one_toast(_isolate_clipboard):
+    """Transcriptions arriving inside the window share one toast + clipboard write."""
+    manager = NotificationManager(app_name="TestApp", flush_window_ms=60_000)
+    manager._toaster = _FakeToaster("TestApp")  # type: ignore[attr-defined]
+
+    manager.show_transcription("first")
+    manager.show_transcription("second")
+    manager.show_transcription("third", copy_to_clipboard=False)
+    assert manager.flush(timeout=5)
+
+    # The first one is not delayed; the rest of the burst is aggregated.
+    first, batch = manager._toaster.shown  # type: ignore[attr-defined]
+    assert first.text_fields == ["Transcription complete", "first"]
+    assert batch.text_fields == ["2 transcriptions complete", "second third"]
+    assert _isolate_clipboard["data"] == "second"
+
+
+def test_close_stops_clipboard_worker(_isolate_clipboard):
+    """close() delivers pending copies and shuts the clipboard worker down."""
+    manager = NotificationManager(app_name="TestApp")
+    manager._toaster = _FakeToaster("TestApp")  # type: ignore[attr-defined]
+
+    manager.show_transcription("first")
+    assert manager.close(timeout=5)
+    assert _isolate_clipboard["data"] == "first"
+    assert manager._clip_pool is None  # type: ignore[attr-defined]
+
+    # The manager stays usable – the worker is started again on demand.
+    manager.show_transcription("second")
+    assert manager.close(timeout=5)
+    assert _isolate_clipboard["data"] == "second"
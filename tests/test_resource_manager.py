@@ -50,4 +50,10 @@ def test_frozen_mode_path_resolution(monkeypatch, temporary_dir):
     assert resolved_path == dummy_abs_path.resolve()
     assert resolved_path.read_text(encoding="utf-8") == "dummy"
 
-    # Clean-up monkeypatch automatically done by fixture 
\ No newline at end of file
+    # Clean-up monkeypatch automatically done by fixture 
+
+def test_relative_segments_normalised_without_resolve():
+    """``..`` segments collapse lexically; *strict* additionally resolves."""
+    base = _determine_base_path()
+    assert resource_path("assets/../assets/icon.ico") == base / "assets" / "icon.ico"
+    assert resource_path("assets/icon.ico", strict=True) == (base / "assets" / "icon.ico").resolve()
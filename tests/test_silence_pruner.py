@@ -65,4 +65,102 @@ def test_prune_pcm_bytes_roundtrip(_sample_audio):
 
     # Decode to NumPy to verify the trimming logic is applied.
     result = np.frombuffer(bytes_out, dtype=np.int16)
-    assert len(result) < len(original)  # trimmed down 
\ No newline at end of file
+    assert len(result) < len(original)  # trimmed down 
+
+def test_single_pass_scan_matches_numpy_scan():
+    """The JIT-able run scanner must agree with the vectorised fallback."""
+    from InstanceScrubber.silence_pruner import (
+        _find_long_silences,
+        _find_long_silences_numpy,
+    )
+
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        audio = rng.integers(-3, 4, size=500).astype(np.int16) * 40
+        audio[rng.integers(0, 500, size=5)] = -32768
+        for threshold in (1, 3, 7):
+            runs = _find_long_silences(audio, threshold, 100)
+            expected = _find_long_silences_numpy(audio, threshold, 100)
+            assert [tuple(r) for r in runs.tolist()] == expected
+
+
+def test_biased_mask_matches_range_check():
+    """The unsigned-bias silence mask must classify every int16 value exactly."""
+    from InstanceScrubber.silence_pruner import _find_long_silences_numpy
+
+    audio = np.arange(-32768, 32768, dtype=np.int64).astype(np.int16)
+    for level in (0, 1, 100, 0x7FFF):
+        silent = np.flatnonzero((audio >= -level) & (audio <= level))
+        expected = [(int(silent[0]), int(silent[-1]) + 1)]
+        assert _find_long_silences_numpy(audio, 1, level) == expected
+
+
+def test_silence_pruner_reuses_scratch_across_sizes(_sample_audio):
+    """A shared instance gives the same result for any sequence of buffer sizes."""
+    from InstanceScrubber.silence_pruner import SilencePruner
+
+    original, _ = _sample_audio
+    pruner = SilencePruner(threshold_ms=120_000)
+    big = pruner.prune(original)
+    small = pruner.prune(np.zeros(16_000 * 30, dtype=np.int16))  # smaller – reuses scratch
+    again = pruner.prune(original)
+
+    assert len(small) == 16_000 * 30
+    np.testing.assert_array_equal(big, again)
+    np.testing.assert_array_equal(big, prune_long_silences(original, threshold_ms=120_000))
+
+
+def test_pruner_scratch_stays_small(monkeypatch):
+    """Only one shared pruner is cached and long buffers never pin scratch."""
+    from InstanceScrubber import silence_pruner
+    from InstanceScrubber.silence_pruner import SilencePruner
+
+    assert silence_pruner._shared_pruner.cache_parameters()["maxsize"] == 1
+
+    monkeypatch.setattr(silence_pruner, "_find_long_silences_jit", None)  # NumPy scan
+    voiced = np.full(16_000, 1000, dtype=np.int16)
+    original = np.concatenate([voiced, np.zeros(16_000 * 200, dtype=np.int16), voiced])
+    assert original.size > SilencePruner._MAX_SCRATCH_SAMPLES
+    pruner = SilencePruner(threshold_ms=120_000)
+    pruned = pruner.prune(original)
+
+    assert pruner._mask.size == 0 and pruner._biased.size == 0
+    assert len(pruned) == 16_000 * 2
+
+
+def test_block_prefilter_matches_full_scan():
+    """Skipping voiced blocks must find exactly the runs a full scan finds."""
+    from InstanceScrubber.silence_pruner import SilencePruner, _find_long_silences_numpy
+
+    rng = np.random.default_rng(0)
+    threshold = 10_000  # samples – prefilter blocks of 5 000
+    pruner = SilencePruner(sample_rate=1_000, threshold_ms=threshold)
+    for _ in range(20):
+        audio = rng.integers(-3_000, 3_000, size=200_003).astype(np.int16)
+        for _ in range(4):  # sprinkle silent stretches around the threshold length
+            start = int(rng.integers(0, audio.size))
+            audio[start : start + int(rng.integers(threshold - 3, 3 * threshold))] = 0
+        keep = np.ones(audio.size, dtype=bool)
+        for start, end in _find_long_silences_numpy(audio, threshold, 100):
+            keep[start:end] = False
+        np.testing.assert_array_equal(pruner.prune(audio), audio[keep])
+
+
+def test_prune_pcm_bytes_into_reusable_buffer(_sample_audio):
+    """Writing into a caller buffer matches the allocating wrapper."""
+    from InstanceScrubber.silence_pruner import prune_pcm_bytes_into
+
+    original, _ = _sample_audio
+    bytes_in = original.tobytes()
+    buf = bytearray(len(bytes_in))
+
+    written = prune_pcm_bytes_into(bytes_in, buf, threshold_ms=120_000)
+    assert bytes(buf[:written]) == prune_pcm_bytes(bytes_in, threshold_ms=120_000)
+
+    # Nothing to prune – the input is returned as-is and copied through verbatim.
+    short = np.full(100, 1000, dtype=np.int16).tobytes()
+    assert prune_pcm_bytes(short) is short
+    assert buf[: prune_pcm_bytes_into(short, buf)] == short
+
+    with pytest.raises(ValueError):
+        prune_pcm_bytes_into(bytes_in, bytearray(10))
@@ -1,5 +1,8 @@
 import inspect
+import os
+import struct
 import sys
+import time
 from pathlib import Path
 
 import pytest
@@ -24,18 +27,17 @@ def test_spooler_write_and_cleanup(tmp_path, monkeypatch):
     spooler.write_chunk(b"a" * 10)
     spooler.write_chunk(b"b" * 20)
     spooler.write_chunk(b"c" * 30)
+    assert spooler.flush(timeout=5)
 
     temp_dir = tmp_path / "Instant Scribe" / "temp"
-    files = sorted(temp_dir.glob("chunk_*.pcm"))
-    assert [f.name for f in files] == [
-        "chunk_0001.pcm",
-        "chunk_0002.pcm",
-        "chunk_0003.pcm",
-    ]
+    # Chunks land back to back in one session file – no per-chunk files
+    assert not list(temp_dir.glob("chunk_*.pcm"))
+    assert (temp_dir / "session.pcm").read_bytes() == b"a" * 10 + b"b" * 20 + b"c" * 30
 
-    # Verify file sizes match payload sizes
-    sizes = [f.stat().st_size for f in files]
-    assert sizes == [10, 20, 30]
+    # The index sidecar records (offset, length) for every chunk
+    index = (temp_dir / "index.bin").read_bytes()
+    records = list(struct.iter_unpack("<QI", index))
+    assert records == [(0, 10), (10, 20), (30, 30)]
 
     # Cleanup removes the directory completely
     spooler.close_session(success=True)
@@ -43,7 +45,7 @@ def test_spooler_write_and_cleanup(tmp_path, monkeypatch):
 
 
 def test_incomplete_detection(tmp_path, monkeypatch):
-    """Static helper should detect leftover chunk files."""
+    """Static helper should detect leftover legacy chunk files."""
     monkeypatch.setenv("APPDATA", str(tmp_path))
 
     # Manually create a leftover chunk file
@@ -51,4 +53,118 @@ def test_incomplete_detection(tmp_path, monkeypatch):
     leftover_dir.mkdir(parents=True, exist_ok=True)
     (leftover_dir / "chunk_0001.pcm").write_bytes(b"oops")
 
-    assert AudioSpooler.incomplete_session_exists() is True 
\ No newline at end of file
+    assert AudioSpooler.incomplete_session_exists() is True 
+
+def test_incomplete_detection_session_file(tmp_path, monkeypatch):
+    """A crashed session leaves a non-empty session file behind."""
+    monkeypatch.setenv("APPDATA", str(tmp_path))
+    assert AudioSpooler.incomplete_session_exists() is False
+
+    spooler = AudioSpooler()
+    spooler.start_session()
+    assert AudioSpooler.incomplete_session_exists() is False  # nothing spooled yet
+    spooler.write_chunk(b"audio")
+    spooler.close_session(success=False)
+
+    assert AudioSpooler.incomplete_session_exists() is True
+
+
+def test_pending_batch_flushed_after_delay(tmp_path, monkeypatch):
+    """A partial batch reaches disk once the batch delay elapses – no flush()."""
+    monkeypatch.setenv("APPDATA", str(tmp_path))
+    spooler = AudioSpooler()
+    spooler.start_session()
+    spooler.write_chunk(b"x" * 16)
+
+    session_file = tmp_path / "Instant Scribe" / "temp" / "session.pcm"
+    deadline = time.monotonic() + 5
+    while session_file.stat().st_size < 16 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert session_file.stat().st_size == 16
+
+    spooler.close_session(success=True)
+
+
+@pytest.mark.skipif(not hasattr(os, "posix_fadvise"), reason="POSIX only")
+def test_written_batches_evicted_from_page_cache(tmp_path, monkeypatch):
+    """Each flush drops the previously written range from the page cache."""
+    monkeypatch.setenv("APPDATA", str(tmp_path))
+    calls = []
+    monkeypatch.setattr(os, "posix_fadvise", lambda fd, off, size, advice: calls.append((off, size, advice)))
+
+    spooler = AudioSpooler()
+    spooler.start_session()
+    for payload in (b"a" * 10, b"b" * 20, b"c" * 30):
+        spooler.write_chunk(payload)
+        assert spooler.flush(timeout=5)
+    spooler.close_session(success=False)
+
+    dontneed = os.POSIX_FADV_DONTNEED
+    assert calls == [(0, 10, dontneed), (10, 20, dontneed), (30, 30, dontneed)]
+
+
+def test_dead_writer_fails_fast_instead_of_blocking(tmp_path, monkeypatch):
+    """Producers must not block forever on the full queue of a dead writer."""
+    monkeypatch.setenv("APPDATA", str(tmp_path))
+    monkeypatch.setattr(AudioSpooler, "_QUEUE_MAXSIZE", 1)
+    monkeypatch.setattr(AudioSpooler, "_LIVENESS_POLL", 0.01)
+
+    def _boom(self):
+        raise ValueError("writer crashed")
+
+    monkeypatch.setattr(AudioSpooler, "_drain_queue", _boom)
+    spooler = AudioSpooler()
+    spooler.start_session()
+    spooler._writer.join(timeout=5)
+
+    with pytest.raises(RuntimeError):
+        spooler.write_chunk(b"lost")
+    assert spooler.flush(timeout=5) is False
+
+    # The failed session is kept on disk for recovery.
+    spooler.close_session(success=True)
+    assert (tmp_path / "Instant Scribe" / "temp").exists()
+
+
+def test_failed_write_keeps_spool_for_recovery(tmp_path, monkeypatch):
+    """close_session(success=True) must not delete a spool that lost audio."""
+    monkeypatch.setenv("APPDATA", str(tmp_path))
+    spooler = AudioSpooler()
+    spooler.start_session()
+
+    def _fail(fh, data):
+        raise ValueError("write to closed file")
+
+    monkeypatch.setattr(AudioSpooler, "_write_all", staticmethod(_fail))
+    spooler.write_chunk(b"audio")
+    assert spooler.flush(timeout=5)
+    spooler.close_session(success=True)
+
+    assert (tmp_path / "Instant Scribe" / "temp" / "session.pcm").exists()
+
+
+def test_partial_write_is_rolled_back_and_retried(tmp_path, monkeypatch):
+    """A torn batch is truncated away and written again – index stays in step."""
+    monkeypatch.setenv("APPDATA", str(tmp_path))
+    real_write_all = AudioSpooler._write_all
+    failures = []
+
+    def _flaky(fh, data):
+        if not failures:
+            failures.append(True)
+            fh.write(bytes(data[: len(data) // 2]))  # torn write, then the disk "fails"
+            raise OSError("disk full")
+        real_write_all(fh, data)
+
+    monkeypatch.setattr(AudioSpooler, "_write_all", staticmethod(_flaky))
+    spooler = AudioSpooler()
+    spooler.start_session()
+    spooler.write_chunk(b"a" * 10)
+    spooler.write_chunk(b"b" * 20)
+    spooler.close_session(success=False)
+
+    temp_dir = tmp_path / "Instant Scribe" / "temp"
+    assert failures
+    assert (temp_dir / "session.pcm").read_bytes() == b"a" * 10 + b"b" * 20
+    records = list(struct.iter_unpack("<QI", (temp_dir / "index.bin").read_bytes()))
+    assert records == [(0, 10), (10, 20)]
@@ -1,4 +1,5 @@
 import inspect
+import struct
 import sys
 from pathlib import Path
 
@@ -19,7 +20,7 @@ def _reset_env(monkeypatch, tmp_path):
 
 
 def _write_dummy_chunks(spooler: AudioSpooler, *, count: int = 120):
-    """Helper – create *count* sequential chunk files with deterministic data."""
+    """Helper – spool *count* sequential chunks with deterministic data."""
     for idx in range(count):
         # Each chunk holds its 1-byte index repeated *idx+1* times so we can
         # verify exact concatenation ordering.
@@ -38,7 +39,7 @@ def test_merge_120_chunks(tmp_path):
     spooler.close_session(success=False)
 
     temp_dir = tmp_path / "Instant Scribe" / "temp"
-    assert len(list(temp_dir.glob("chunk_*.pcm"))) == 120
+    assert (temp_dir / "index.bin").stat().st_size == 120 * 12  # one record per chunk
 
     merged_path = AudioSpooler.merge_chunks(source_dir=temp_dir)
     assert merged_path.exists()
@@ -54,7 +55,7 @@ def test_merge_120_chunks(tmp_path):
 
 
 def test_merge_cleans_up_option(monkeypatch, tmp_path):
-    """When *cleanup=True* the original chunk files should be removed."""
+    """When *cleanup=True* the spool files should be removed."""
     monkeypatch.setenv("APPDATA", str(tmp_path))
     spooler = AudioSpooler()
     spooler.start_session()
@@ -66,4 +67,108 @@ def test_merge_cleans_up_option(monkeypatch, tmp_path):
 
     # Only the merged file should remain
     remaining = list(temp_dir.iterdir())
-    assert remaining == [out_file] 
\ No newline at end of file
+    assert remaining == [out_file] 
+
+def test_merge_legacy_chunk_files(tmp_path):
+    """Numbered chunk files from older versions are still merged in order."""
+    temp_dir = tmp_path / "Instant Scribe" / "temp"
+    temp_dir.mkdir(parents=True)
+    (temp_dir / "chunk_0002.pcm").write_bytes(b"bb")
+    (temp_dir / "chunk_0001.pcm").write_bytes(b"a")
+    (temp_dir / "chunk_0010.pcm").write_bytes(b"ccc")
+
+    merged_path = AudioSpooler.merge_chunks(source_dir=temp_dir)
+    assert merged_path.read_bytes() == b"abbccc"
+
+
+def test_merge_falls_back_when_sendfile_fails(tmp_path, monkeypatch):
+    """Without a working in-kernel copy the merge streams through userspace."""
+    import os
+
+    def _no_sendfile(*_args):
+        raise OSError("sendfile unsupported")
+
+    monkeypatch.setattr(os, "sendfile", _no_sendfile, raising=False)
+    temp_dir = tmp_path / "Instant Scribe" / "temp"
+    temp_dir.mkdir(parents=True)
+    (temp_dir / "chunk_0001.pcm").write_bytes(b"a" * 100)
+    (temp_dir / "chunk_0002.pcm").write_bytes(b"b" * 200)
+
+    merged_path = AudioSpooler.merge_chunks(source_dir=temp_dir)
+    assert merged_path.read_bytes() == b"a" * 100 + b"b" * 200
+
+
+@pytest.mark.parametrize("copy_fails", [False, True])
+def test_single_file_merge_prefers_copyfile2(tmp_path, monkeypatch, copy_fails):
+    """A lone spool file goes through CopyFile2 when present, else ``shutil.copyfile``."""
+    import shutil
+
+    import InstanceScrubber.spooler as spooler_mod
+
+    calls = []
+
+    def _fake_copyfile2(src, dst, flags):
+        calls.append((src, dst, flags))
+        if copy_fails:
+            raise OSError("CopyFile2 failed")
+        shutil.copyfile(src, dst)
+
+    monkeypatch.setattr(spooler_mod, "_COPY_FILE2", _fake_copyfile2)
+    temp_dir = tmp_path / "Instant Scribe" / "temp"
+    temp_dir.mkdir(parents=True)
+    (temp_dir / "chunk_0001.pcm").write_bytes(b"a" * 100)
+
+    merged_path = AudioSpooler.merge_chunks(source_dir=temp_dir)
+    assert merged_path.read_bytes() == b"a" * 100
+    assert calls == [(str(temp_dir / "chunk_0001.pcm"), str(merged_path), 0)]
+
+
+def _torn_session(temp_dir: Path) -> None:
+    """Append an indexed chunk whose audio was only partly written (crash)."""
+    with (temp_dir / "index.bin").open("ab") as fh:
+        fh.write(struct.pack("<QI", 3, 30))
+    with (temp_dir / "session.pcm").open("ab") as fh:
+        fh.write(b"z" * 7)
+
+
+def test_merge_cuts_torn_tail_using_index(tmp_path):
+    """Audio of a chunk torn by a crash is dropped; whole chunks are kept."""
+    spooler = AudioSpooler()
+    spooler.start_session()
+    spooler.write_chunk(b"a")
+    spooler.write_chunk(b"bb")
+    spooler.close_session(success=False)
+
+    temp_dir = tmp_path / "Instant Scribe" / "temp"
+    _torn_session(temp_dir)
+
+    merged_path = AudioSpooler.merge_chunks(source_dir=temp_dir)
+    assert merged_path.read_bytes() == b"abb"
+
+
+def test_merge_without_index_keeps_whole_session(tmp_path):
+    """Without index.bin the session file is trusted as-is."""
+    temp_dir = tmp_path / "Instant Scribe" / "temp"
+    temp_dir.mkdir(parents=True)
+    (temp_dir / "session.pcm").write_bytes(b"abc")
+
+    merged_path = AudioSpooler.merge_chunks(source_dir=temp_dir)
+    assert merged_path.read_bytes() == b"abc"
+
+
+def test_resumed_session_continues_after_last_whole_chunk(tmp_path):
+    """Reopening a crashed spool trims the tear so later chunks stay recoverable."""
+    spooler = AudioSpooler()
+    spooler.start_session()
+    spooler.write_chunk(b"a")
+    spooler.write_chunk(b"bb")
+    spooler.close_session(success=False)
+    temp_dir = tmp_path / "Instant Scribe" / "temp"
+    _torn_session(temp_dir)
+
+    spooler.start_session()
+    spooler.write_chunk(b"ccc")
+    spooler.close_session(success=False)
+
+    merged_path = AudioSpooler.merge_chunks(source_dir=temp_dir)
+    assert merged_path.read_bytes() == b"abbccc"
@@ -122,8 +122,9 @@ def test_orchestrator_spooler_lifecycle(tmp_path, monkeypatch):
     orch.audio_streamer.simulate_speech(b"x" * 100)
 
     temp_dir = tmp_path / "Instant Scribe" / "temp"
-    # Chunk file should exist after speech
-    assert any(temp_dir.glob("chunk_*.pcm"))
+    assert orch.spooler.flush(timeout=5)
+    # Session spool file should hold the audio after speech
+    assert (temp_dir / "session.pcm").stat().st_size > 0
 
     # Now stop listening which should cleanup
     orch._toggle_listening()  # pylint: disable=protected-access
@@ -132,8 +132,55 @@ def test_auto_unload_when_vram_low(monkeypatch):
     worker: _StubWorker = orch.worker  # type: ignore[assignment]
     assert worker.unload_called == 1
 
+    # Polling is suspended until the model is loaded again.
+    assert not orch.gpu_monitor._active_evt.is_set()
+
     # Notification should have been sent.
     notify: _StubNotify = orch.notification_manager  # type: ignore[assignment]
     assert notify.model_states[-1] == "unloaded"
 
-    orch.shutdown() 
\ No newline at end of file
+    orch.shutdown() 
+
+def test_poll_interval_backs_off_when_vram_plentiful():
+    """Polling slows down while free VRAM is far above threshold and resets near it."""
+    from InstanceScrubber.gpu_monitor import GPUResourceMonitor
+
+    class _Orch:
+        model_loaded = True
+
+    monitor = GPUResourceMonitor(_Orch(), {"vram_unload_threshold_mb": 1024}, None)
+
+    sys.modules["pynvml"].free_bytes = 6 * 1024 * 1024 * 1024  # 6 GB – > 4x threshold
+    monitor.check_once()
+    assert monitor._next_interval(5.0, 5.0) == 10.0
+    assert monitor._next_interval(40.0, 5.0) == 60.0
+
+    sys.modules["pynvml"].free_bytes = 1536 * 1024 * 1024  # 1.5 GB – < 2x threshold
+    monitor.check_once()
+    assert monitor._next_interval(40.0, 5.0) == 5.0
+    monitor.stop()
+
+
+def test_nvml_initialised_once_and_released_by_last_monitor(monkeypatch):
+    """NVML init/shutdown are reference-counted across monitors."""
+    from InstanceScrubber import gpu_monitor
+
+    calls = {"init": 0, "shutdown": 0}
+
+    def _count(name):
+        return lambda: calls.__setitem__(name, calls[name] + 1)
+
+    stub_nvml = sys.modules["pynvml"]
+    monkeypatch.setattr(stub_nvml, "nvmlInit", _count("init"), raising=False)
+    monkeypatch.setattr(stub_nvml, "nvmlShutdown", _count("shutdown"), raising=False)
+    monkeypatch.setattr(gpu_monitor, "_NVML_REFCOUNT", 0)
+
+    first = gpu_monitor.GPUResourceMonitor(None, {}, None)
+    second = gpu_monitor.GPUResourceMonitor(None, {}, None)
+    assert calls["init"] == 1
+
+    first.stop()
+    first.stop()  # idempotent – must not release twice
+    assert calls["shutdown"] == 0
+    second.stop()
+    assert calls["shutdown"] == 1
@@ -57,4 +57,433 @@ def test_worker_ipc_cycle(dummy_audio_array):
 
     assert isinstance(response, EngineResponse)
     assert response.ok is True
-    assert response.payload == "hello world" 
\ No newline at end of file
+    assert response.payload == "hello world" 
+
+def test_worker_process_batches_queued_requests(monkeypatch):
+    """Queued *Transcribe* requests share one model call and keep their ids."""
+    import queue
+
+    from InstanceScrubber import transcription_worker as tw
+    from ipc.messages import Response, Shutdown, Transcribe, UnloadModel
+
+    batch_sizes: list[int] = []
+    original = tw.TranscriptionEngine.get_plain_transcription_batch
+
+    def _spy(self, audios):
+        batch_sizes.append(len(audios))
+        return original(self, audios)
+
+    monkeypatch.setattr(tw.TranscriptionEngine, "get_plain_transcription_batch", _spy)
+
+    request_q: queue.Queue = queue.Queue()
+    response_q: queue.Queue = queue.Queue()
+    pcm = np.zeros(1600, dtype=np.int16).tobytes()
+    for rid in (7, 8, 9):
+        request_q.put(Transcribe(audio=pcm, request_id=rid))
+    request_q.put(UnloadModel())
+    request_q.put(Shutdown())
+
+    tw._worker_process(request_q, response_q, use_stub=True)
+
+    responses = [response_q.get_nowait() for _ in range(4)]
+    assert batch_sizes == [3]
+    assert [r.request_id for r in responses] == [7, 8, 9, None]
+    assert all(isinstance(r, Response) and r.result.ok for r in responses)
+    assert responses[0].result.payload == "hello world"
+
+
+def test_worker_routes_out_of_order_responses():
+    """Responses are handed to the caller whose request id they answer."""
+    import threading
+
+    from ipc.messages import Response
+
+    worker = TranscriptionWorker(use_stub=False)  # process never started
+    results: dict[int, str] = {}
+
+    def _wait(rid: int) -> None:
+        results[rid] = worker._await_response(rid, timeout=5).result
+
+    threads = [threading.Thread(target=_wait, args=(rid,)) for rid in (1, 2)]
+    for t in threads:
+        t.start()
+    worker._responses.put(Response(result="second", request_id=2))
+    worker._responses.put(Response(result="first", request_id=1))
+    for t in threads:
+        t.join(timeout=5)
+
+    assert results == {1: "first", 2: "second"}
+
+
+def test_warm_up_sweeps_lengths_and_batch_sizes():
+    """Warm-up primes several clip lengths at batch sizes 1 and 2."""
+    engine = TranscriptionEngine()
+    engine.load_model(use_stub=True)
+
+    calls: list[tuple[int, tuple[int, ...]]] = []
+
+    class _Recorder:
+        def transcribe(self, *, audio, batch_size=1, **_kwargs):
+            calls.append((batch_size, tuple(len(a) for a in audio)))
+            return ["" for _ in audio]
+
+    engine.model = _Recorder()
+    engine._warm_up()
+
+    lengths = [secs * 16_000 for secs in TranscriptionEngine._WARM_UP_SECONDS]
+    expected = [c for n in lengths for c in ((1, (n,)), (2, (n, n)))]
+    assert calls == expected
+
+
+def test_failed_warm_up_still_captures_encoder_graphs(monkeypatch, caplog):
+    """A warm-up failure is logged as a warning and graph capture still runs."""
+    engine = TranscriptionEngine()
+    engine.load_model(use_stub=True)
+
+    def _fail(audio):
+        raise RuntimeError("warm-up boom")
+
+    captured = []
+    monkeypatch.setattr(engine, "get_plain_transcription", _fail)
+    monkeypatch.setattr(engine, "_capture_encoder_graphs", lambda: captured.append(True))
+    with caplog.at_level("WARNING"):
+        engine._warm_up()
+
+    assert captured == [True]
+    assert any(r.levelname == "WARNING" and "warm-up boom" in r.getMessage() for r in caplog.records)
+
+
+def test_warm_up_uses_the_request_inference_path(monkeypatch):
+    """Warm-up feeds float32 clips through the same methods requests use."""
+    engine = TranscriptionEngine()
+    engine.load_model(use_stub=True)
+
+    seen: list[tuple[str, int, str]] = []
+    monkeypatch.setattr(
+        engine, "get_plain_transcription", lambda audio: seen.append(("single", 1, str(audio.dtype))) or ""
+    )
+    monkeypatch.setattr(
+        engine,
+        "get_plain_transcription_batch",
+        lambda audios: seen.append(("batch", len(audios), str(audios[0].dtype))) or ["" for _ in audios],
+    )
+    engine._warm_up()
+
+    assert seen[:2] == [("single", 1, "float32"), ("batch", 2, "float32")]
+    assert len(seen) == 2 * len(TranscriptionEngine._WARM_UP_SECONDS)
+
+
+def test_audio_stager_reads_bytes_and_shared_memory():
+    """PCM from bytes or a shared-memory block is scaled into one arena."""
+    from multiprocessing.shared_memory import SharedMemory
+
+    from InstanceScrubber.transcription_worker import _AudioStager
+    from ipc.messages import Transcribe
+
+    pcm = np.array([0, 16384, -32768, 32767], dtype=np.int16)
+    shm = SharedMemory(create=True, size=pcm.nbytes)
+    try:
+        shm.buf[: pcm.nbytes] = pcm.tobytes()
+        batch = [
+            Transcribe(audio=pcm.tobytes(), request_id=1),
+            Transcribe(audio=b"", request_id=2, shm_name=shm.name, nbytes=pcm.nbytes),
+            Transcribe(audio=b"", request_id=3, shm_name="instant-scribe-missing", nbytes=4),
+        ]
+        first, second, missing = _AudioStager().stage(batch)
+    finally:
+        shm.close()
+        shm.unlink()
+
+    expected = pcm.astype(np.float32) / 32768.0
+    assert first.dtype == np.float32
+    np.testing.assert_array_equal(first, expected)
+    np.testing.assert_array_equal(second, expected)
+    assert isinstance(missing, OSError)
+
+
+def test_engine_stages_audio_in_pinned_buffer(monkeypatch):
+    """Clips are converted into (or passed straight from) the staging buffer."""
+    from InstanceScrubber.transcription_worker import _AudioStager
+    from ipc.messages import Transcribe
+
+    engine = TranscriptionEngine()
+    engine.load_model(use_stub=True)
+    # A plain array stands in for the pinned tensor – slicing behaves alike.
+    host = np.zeros(64, dtype=np.float32)
+    monkeypatch.setattr(engine, "_pinned", host)
+    monkeypatch.setattr(engine, "_pinned_np", host)
+
+    seen: list = []
+
+    class _Recorder:
+        def transcribe(self, *, audio, batch_size=1, **_kwargs):
+            seen.extend(audio)
+            return ["ok" for _ in audio]
+
+    engine.model = _Recorder()
+
+    pcm = np.array([16384, -16384], dtype=np.int16)
+    assert engine.get_plain_transcription(pcm) == "ok"
+    assert np.shares_memory(seen[0], host)
+    np.testing.assert_array_equal(seen[0], [0.5, -0.5])
+
+    # Audio staged by the worker directly into the buffer is not copied again.
+    seen.clear()
+    batch = [Transcribe(audio=pcm.tobytes()), Transcribe(audio=pcm[::-1].tobytes())]
+    staged = _AudioStager().stage(batch, arena=engine.pinned_host_buffer())
+    assert engine.get_plain_transcription_batch(staged) == ["ok", "ok"]
+    assert [s.ctypes.data for s in seen] == [a.ctypes.data for a in staged]
+
+    # Batches that do not fit fall back to the caller's arrays.
+    seen.clear()
+    big = np.zeros(100, dtype=np.int16)
+    engine.get_plain_transcription(big)
+    assert seen[0] is big
+
+
+def test_graph_path_failure_falls_back_to_eager(dummy_audio_array):
+    """A broken encoder graph is dropped and the eager path answers instead."""
+    engine = TranscriptionEngine()
+    engine.load_model(use_stub=True)
+    engine._encoder_graphs[5 * 16_000] = object()  # replay cannot succeed
+
+    assert engine.get_plain_transcription(dummy_audio_array) == "hello world"
+    assert engine._encoder_graphs == {}
+
+
+@pytest.mark.parametrize(
+    ("requested", "cuda", "capability", "expected"),
+    [
+        ("auto", True, (8, 6), "bf16"),
+        ("auto", True, (7, 5), "fp16"),
+        ("auto", False, None, "fp32"),
+        ("fp16", False, None, "fp32"),
+        ("fp32", True, (9, 0), "fp32"),
+    ],
+)
+def test_resolve_precision(monkeypatch, requested, cuda, capability, expected):
+    """BF16 is picked on SM >= 8.0, FP16 below, and FP32 without CUDA."""
+    import types
+
+    fake_torch = types.SimpleNamespace(
+        cuda=types.SimpleNamespace(is_available=lambda: cuda, get_device_capability=lambda: capability)
+    )
+    monkeypatch.setitem(sys.modules, "torch", fake_torch)
+
+    assert TranscriptionEngine._resolve_precision(requested) == expected
+
+
+def test_onnx_encoder_failure_falls_back_to_pytorch(dummy_audio_array):
+    """A failing ONNX session is dropped and the NeMo path answers instead."""
+    engine = TranscriptionEngine()
+    engine.load_model(use_stub=True)
+    engine._onnx_session = object()  # cannot run
+
+    assert engine.get_plain_transcription(dummy_audio_array) == "hello world"
+    assert engine._onnx_session is None
+
+
+def test_batches_use_the_onnx_encoder(dummy_audio_array, monkeypatch):
+    """Batched requests go through the ONNX session too, not the PyTorch encoder."""
+    engine = TranscriptionEngine()
+    engine.load_model(use_stub=True)
+    engine._onnx_session = object()
+    batches = []
+    monkeypatch.setattr(engine, "_transcribe_with_onnx", lambda audios: batches.append(len(audios)) or ["a", "b"])
+
+    assert engine.get_plain_transcription_batch([dummy_audio_array, dummy_audio_array]) == ["a", "b"]
+    assert batches == [2]
+
+
+def test_onnx_batch_failure_falls_back_to_pytorch(dummy_audio_array):
+    """A failing ONNX session is dropped for batches as well."""
+    engine = TranscriptionEngine()
+    engine.load_model(use_stub=True)
+    engine._onnx_session = object()  # cannot run
+
+    assert engine.get_plain_transcription_batch([dummy_audio_array] * 2) == ["hello world"] * 2
+    assert engine._onnx_session is None
+
+
+def test_pcm_kernel_matches_numpy_conversion():
+    """The (JIT-able) conversion loop agrees with the vectorised NumPy path."""
+    from InstanceScrubber.transcription_worker import _pcm16_to_f32, _pcm16_to_f32_into
+
+    src = np.array([-32768, -1, 0, 1, 12345, 32767], dtype=np.int16)
+    expected = src.astype(np.float32) / np.float32(32768.0)
+
+    looped = np.empty(src.size, dtype=np.float32)
+    _pcm16_to_f32(src, looped)
+    np.testing.assert_array_equal(looped, expected)
+
+    big = np.random.default_rng(0).integers(-32768, 32767, size=1 << 17, dtype=np.int16)
+    converted = np.empty(big.size, dtype=np.float32)
+    _pcm16_to_f32_into(big, converted)
+    np.testing.assert_array_equal(converted, big.astype(np.float32) / np.float32(32768.0))
+
+
+def test_prefetcher_double_buffers_staged_batches():
+    """Batches alternate slots and a slot is not refilled before release."""
+    import queue
+    import time
+
+    from InstanceScrubber.transcription_worker import _Prefetcher, _StagedBatch
+    from ipc.messages import LoadModel, Shutdown, Transcribe
+
+    engine = TranscriptionEngine()
+    engine.load_model(use_stub=True)
+    request_q: queue.Queue = queue.Queue()
+    for value in (1, 2, 3):
+        request_q.put(Transcribe(audio=np.full(4, value * 1000, dtype=np.int16).tobytes(), request_id=value))
+        request_q.put(LoadModel())  # keeps each request in its own batch
+    request_q.put(Shutdown())
+
+    prefetcher = _Prefetcher(request_q, engine)
+    first, _, second, _ = (prefetcher.get() for _ in range(4))
+    assert isinstance(first, _StagedBatch) and isinstance(second, _StagedBatch)
+    assert (first.slot, second.slot) == (0, 1)
+
+    time.sleep(0.05)
+    assert prefetcher._ready.empty()  # third batch waits for slot 0
+    np.testing.assert_allclose(first.staged[0], 1000 / 32768)
+
+    prefetcher.release(first.slot)
+    third = prefetcher.get()
+    assert third.slot == 0 and third.batch[0].request_id == 3
+    np.testing.assert_allclose(third.staged[0], 3000 / 32768)
+    assert isinstance(prefetcher.get(), LoadModel)
+    assert isinstance(prefetcher.get(), Shutdown)
+
+
+def test_audio_ring_slots_are_recycled_and_staged():
+    """Ring slots are reused after release and read back by the stager."""
+    from multiprocessing.shared_memory import SharedMemory
+
+    from InstanceScrubber.transcription_worker import _AudioRing, _AudioStager
+    from ipc.messages import Transcribe
+
+    ring = _AudioRing(slots=2, slot_bytes=16)
+    try:
+        pcm = np.array([16384, -16384], dtype=np.int16).tobytes()
+        first, second = ring.try_write(pcm), ring.try_write(pcm[::-1])
+        assert {first, second} == {0, 1}
+        assert ring.try_write(pcm) is None  # all slots busy
+        assert ring.try_write(bytes(32)) is None  # larger than a slot
+
+        attached = SharedMemory(name=ring.name)
+        try:
+            stager = _AudioStager(attached, ring.slot_bytes)
+            (staged,) = stager.stage([Transcribe(audio=b"", ring_slot=first, nbytes=len(pcm))])
+            np.testing.assert_array_equal(staged, [0.5, -0.5])
+            del staged
+        finally:
+            attached.close()
+
+        ring.release(first)
+        ring.release(first)  # duplicate release must not free the slot twice
+        assert ring.try_write(pcm) == first
+        assert ring.try_write(pcm) is None
+    finally:
+        ring.close()
+
+
+def test_late_response_releases_abandoned_ring_slot():
+    """A response arriving after its caller timed out frees the slot and is dropped."""
+    from InstanceScrubber.transcription_worker import _AudioRing, _SHM_MIN_BYTES
+    from ipc.messages import Response
+
+    worker = TranscriptionWorker(use_stub=False)  # process never started
+    worker._ring = _AudioRing(slots=1, slot_bytes=_SHM_MIN_BYTES)
+    try:
+        with pytest.raises(TimeoutError):
+            worker.transcribe(bytes(_SHM_MIN_BYTES), timeout=0.05)
+        request = worker._requests.get(timeout=5)
+        assert request.ring_slot == 0
+        assert worker._ring.try_write(b"x") is None  # still reserved
+
+        worker._responses.put(Response(result="late", request_id=request.request_id))
+        worker._responses.put(Response(result="loaded"))
+        assert worker._await_response(None, timeout=5).result == "loaded"
+        assert worker._parked == {} and worker._abandoned == {}
+        assert worker._ring.try_write(b"x") == 0
+    finally:
+        worker._ring.close()
+
+
+def test_late_response_after_restart_leaves_new_ring_alone():
+    """A slot abandoned on one ring is never released into its replacement."""
+    from types import SimpleNamespace
+
+    from InstanceScrubber.transcription_worker import _AudioRing, _SHM_MIN_BYTES
+    from ipc.messages import Response
+
+    worker = TranscriptionWorker(use_stub=False)  # process never started
+    old_ring = worker._ring = _AudioRing(slots=1, slot_bytes=_SHM_MIN_BYTES)
+    with pytest.raises(TimeoutError):
+        worker.transcribe(bytes(_SHM_MIN_BYTES), timeout=0.05)
+    request = worker._requests.get(timeout=5)
+
+    # Simulate a restart: the ring is replaced and its only slot handed out.
+    new_ring = worker._ring = _AudioRing(slots=1, slot_bytes=_SHM_MIN_BYTES)
+    try:
+        assert new_ring.try_write(b"x") == 0
+        worker._responses.put(Response(result="late", request_id=request.request_id))
+        worker._responses.put(Response(result="loaded"))
+        assert worker._await_response(None, timeout=5).result == "loaded"
+        assert new_ring.try_write(b"x") is None  # still owned by the new request
+    finally:
+        old_ring.close()
+
+    # stop() forgets abandoned requests of the old process.
+    worker._abandoned[99] = None
+    worker._proc = SimpleNamespace(join=lambda timeout: None, is_alive=lambda: False)
+    worker.stop()
+    assert worker._abandoned == {} and worker._ring is None
+
+
+def test_encoder_export_is_cached(tmp_path, monkeypatch):
+    """The ONNX encoder is exported once and reused from the cache dir."""
+    import types
+
+    engine = TranscriptionEngine()
+    exports: list[str] = []
+
+    def _export(path: str) -> None:
+        exports.append(path)
+        Path(path).write_bytes(b"onnx")
+
+    engine.model = types.SimpleNamespace(encoder=types.SimpleNamespace(export=_export))
+
+    first = engine._export_encoder(tmp_path)
+    second = engine._export_encoder(tmp_path)
+    assert first == second and first.read_bytes() == b"onnx"
+    assert len(exports) == 1
+    assert sorted(p.name for p in tmp_path.iterdir()) == [first.name]  # no temp file left
+
+    monkeypatch.setenv("APPDATA", str(tmp_path))
+    assert TranscriptionEngine._default_model_cache_dir() == tmp_path / "Instant Scribe" / "models"
+
+
+def test_direct_path_failure_falls_back_to_transcribe(dummy_audio_array):
+    """A failing direct call path is disabled and model.transcribe() answers."""
+    engine = TranscriptionEngine()
+    engine.load_model(use_stub=True)
+    engine._direct = True  # the stub has no preprocessor/encoder/decoding
+
+    assert engine.get_plain_transcription_batch([dummy_audio_array] * 2) == ["hello world"] * 2
+    assert engine._direct is False
+    assert engine.get_plain_transcription(dummy_audio_array, legacy=True) == "hello world"
+
+
+@pytest.mark.parametrize("wrap", [list, lambda hyps: (hyps, None)])
+def test_decode_accepts_hypotheses_and_tuples(wrap):
+    """Decoder output is read from Hypothesis lists and older (best, all) tuples."""
+    import types
+
+    engine = TranscriptionEngine()
+    hyps = [types.SimpleNamespace(text="first"), "second"]
+    engine.model = types.SimpleNamespace(
+        decoding=types.SimpleNamespace(rnnt_decoder_predictions_tensor=lambda **_kwargs: wrap(hyps))
+    )
+
+    assert engine._decode(None, None) == ["first", "second"]